@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for db_able. Run a module directly, i.e. `python -m benchmarks.bench_client`.
+:date_created: 2026-10-16
+"""
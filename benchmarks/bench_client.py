@@ -0,0 +1,63 @@
+"""
+Per-call overhead of `DBClient` execution modes against an in-memory DBAPI connection.
+Isolates client-side cost: there is no network or server time in these numbers.
+    python -m benchmarks.bench_client
+:date_created: 2026-10-16
+"""
+from datetime import datetime
+
+from pymysql.constants import FIELD_TYPE
+
+from benchmarks.harness import measure, report
+from db_able.client import DBClient, EngineRegistry
+from db_able.mgmt.const import ExecutionMode
+from tests.mock_db import MockDatabase, ResultSet
+
+ROW = {
+    'id': 1,
+    'string': 'Hello world.',
+    'json': '{"x": 1, "y": 123}',
+    'int': 12,
+    'float': 12.34,
+    'datetime': datetime(2021, 11, 18)
+    }
+
+
+def setup():
+    """
+    Register an in-memory `A_load` stored procedure as the default engine.
+    :rtype: MockDatabase
+    """
+    db = MockDatabase()
+    result_set = ResultSet.from_dicts([ROW], types={'json': FIELD_TYPE.JSON})
+    db.register('testing', 'A_load', lambda _id: [result_set])
+    EngineRegistry.register_engine(None, db.engine())
+    return db
+
+
+def load(execution_mode):
+    """
+    :type execution_mode: str
+    :rtype: callable
+    """
+    def run():
+        with DBClient('testing', 'A_load', ('id', 1), execution_mode=execution_mode) as conn:
+            return conn.data
+    return run
+
+
+def run(number=2000, repeat=5):
+    """
+    :type number: int
+    :type repeat: int
+    :rtype: list of dict
+    """
+    setup()
+    return [
+        measure('client.load[%s]' % execution_mode, load(execution_mode), number=number, repeat=repeat)
+        for execution_mode in ExecutionMode.allowed
+        ]
+
+
+if __name__ == '__main__':
+    report(run(), baseline='client.load[%s]' % ExecutionMode.SESSION)
@@ -0,0 +1,84 @@
+"""
+Throughput of `Creatable.create` per row against `Creatable.create_many` over an in-memory DBAPI connection.
+Every stored procedure call sleeps for `LATENCY` seconds to stand in for the network round trip and statement
+execution that the per-row path pays once per row.
+    python -m benchmarks.bench_create
+:date_created: 2026-10-16
+"""
+import json
+import time
+
+from pymysql.constants import FIELD_TYPE
+
+from benchmarks.harness import measure, report
+from db_able.client import EngineRegistry
+from examples.a import A
+from tests.mock_db import MockDatabase, ResultSet
+
+LATENCY = 0.0005
+ROWS = [
+    {'string': 'Hello world.', 'json': {'x': i, 'y': 123}, 'int': i, 'float': 12.34, 'datetime': None}
+    for i in range(1000)
+    ]
+COLUMNS = ['id', 'string', 'json', 'int', 'float', 'datetime']
+TYPES = {'id': FIELD_TYPE.LONG, 'json': FIELD_TYPE.JSON}
+
+
+def setup():
+    """
+    Register in-memory `A_create` and `A_create_many` stored procedures as the default engine.
+    :rtype: MockDatabase
+    """
+    ids = iter(range(1, 10 ** 9))
+
+    def create(string, json_, int_, float_, datetime):
+        time.sleep(LATENCY)
+        return [ResultSet.from_dicts([dict(zip(COLUMNS, [next(ids), string, json_, int_, float_, datetime]))], TYPES)]
+
+    def create_many(rows, echo):
+        time.sleep(LATENCY)
+        rows = [dict(row, id=next(ids), json=json.dumps(row['json'])) for row in json.loads(rows)]
+        if echo:
+            return [ResultSet.from_dicts(rows, TYPES)]
+        return [ResultSet.from_dicts([{'id': row['id']} for row in rows], TYPES)]
+
+    db = MockDatabase()
+    db.register('testing', 'A_create', create)
+    db.register('testing', 'A_create_many', create_many)
+    EngineRegistry.register_engine(None, db.engine())
+    return db
+
+
+def create_each():
+    for row in ROWS:
+        A.create(**row)
+
+
+def create_many(chunk_size, echo=True):
+    """
+    :type chunk_size: int
+    :type echo: bool
+    :rtype: callable
+    """
+    def run():
+        A.create_many(ROWS, chunk_size=chunk_size, echo=echo)
+    return run
+
+
+def run(number=1, repeat=3):
+    """
+    :type number: int
+    :type repeat: int
+    :rtype: list of dict
+    """
+    setup()
+    return [
+        measure('create.each[%s rows]' % len(ROWS), create_each, number=number, repeat=repeat),
+        measure('create_many[chunk=100]', create_many(100), number=number, repeat=repeat),
+        measure('create_many[chunk=1000]', create_many(1000), number=number, repeat=repeat),
+        measure('create_many[chunk=1000, echo=False]', create_many(1000, echo=False), number=number, repeat=repeat),
+        ]
+
+
+if __name__ == '__main__':
+    report(run(), baseline='create.each[%s rows]' % len(ROWS))
@@ -0,0 +1,120 @@
+"""
+Row decoding throughput of `DBClient.populate_data` over a 100k-row in-memory result set.
+"legacy" reproduces the per-row description zip and per-cell JSON type check that preceded `RowDecoder`.
+    python -m benchmarks.bench_decode
+:date_created: 2026-10-16
+"""
+import json
+from datetime import datetime
+
+from pymysql.constants import FIELD_TYPE
+
+from benchmarks.harness import measure, report
+from db_able import client
+from db_able.client import DBClient, EngineRegistry
+from db_able.client.codec import RowDecoder, get_codec
+from db_able.mgmt.const import ExecutionMode
+from tests.mock_db import MockDatabase, ResultSet
+
+ROWS = 100000
+
+
+def setup(rows=ROWS):
+    """
+    Register an in-memory `A_list` stored procedure returning `rows` rows as the default engine.
+    :type rows: int
+    :rtype: ResultSet
+    """
+    result_set = ResultSet.from_dicts([
+        {
+            'id': i,
+            'string': 'Hello world.',
+            'json': '{"x": %s, "y": [1, 2, 3]}' % i,
+            'int': i,
+            'float': 12.34,
+            'datetime': datetime(2021, 11, 18)
+            }
+        for i in range(rows)
+        ], types={'id': FIELD_TYPE.LONG, 'json': FIELD_TYPE.JSON})
+    db = MockDatabase()
+    db.register('testing', 'A_list', lambda: [result_set])
+    EngineRegistry.register_engine(None, db.engine())
+    return result_set
+
+
+def legacy(result_set):
+    """
+    :type result_set: ResultSet
+    :rtype: callable
+    """
+    def run():
+        data_types = {descriptor[0]: descriptor[1] for descriptor in result_set.description}
+        data = []
+        for row in result_set.rows:
+            row_dict = {}
+            for description, value in zip(result_set.description, row):
+                row_dict[description[0]] = value
+            data.append(row_dict)
+        new_data = []
+        for datum in data:
+            new_datum = {}
+            for key, value in datum.items():
+                if data_types[key] == FIELD_TYPE.JSON and value is not None:
+                    new_datum[key] = json.loads(value)
+                else:
+                    new_datum[key] = value
+            new_data.append(new_datum)
+        return new_data
+    return run
+
+
+def plan(result_set, codec):
+    """
+    :type result_set: ResultSet
+    :type codec: db_able.client.codec.JSONCodec
+    :rtype: callable
+    """
+    def run():
+        return RowDecoder(result_set.description, codec).decode_all(result_set.rows)
+    return run
+
+
+def client_list(codec):
+    """
+    End-to-end `DBClient` call, including fetching from the mock cursor.
+    :type codec: db_able.client.codec.JSONCodec
+    :rtype: callable
+    """
+    def run():
+        client.JSON_CODEC = codec
+        with DBClient('testing', 'A_list', execution_mode=ExecutionMode.DBAPI) as conn:
+            return conn.data
+    return run
+
+
+def run(number=1, repeat=5):
+    """
+    :type number: int
+    :type repeat: int
+    :rtype: list of dict
+    """
+    result_set = setup()
+    default_codec = client.JSON_CODEC
+    codecs = [get_codec('json')]
+    if get_codec('auto').name != 'json':
+        codecs.append(get_codec('auto'))
+    results = [measure('decode.legacy[json]', legacy(result_set), number=number, repeat=repeat)]
+    results.extend(
+        measure('decode.plan[%s]' % codec.name, plan(result_set, codec), number=number, repeat=repeat)
+        for codec in codecs
+        )
+    results.extend(
+        measure('decode.client[%s]' % codec.name, client_list(codec), number=number, repeat=repeat)
+        for codec in codecs
+        )
+    client.JSON_CODEC = default_codec
+    return results
+
+
+if __name__ == '__main__':
+    report(run(), baseline='decode.legacy[json]')
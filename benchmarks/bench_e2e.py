@@ -0,0 +1,117 @@
+"""
+End-to-end throughput and latency of the mixin methods against a local MySQL, through the stored procedures in
+`tests/sql`. Requires a server reachable through `DB_CONN_STR` (or `db_able.client.CONN_STR`); the `testing` schema,
+tables and routines are (re)created from `tests/sql`, and tables are seeded when empty.
+Rows created by the benchmark are deleted by it, so repeated runs leave the tables as they were.
+    python -m benchmarks.bench_e2e
+:date_created: 2026-10-16
+"""
+import glob
+import os
+from datetime import datetime
+
+from benchmarks.harness import measure_latency, report_latency
+from db_able.client import EngineRegistry
+from examples.a import A
+from examples.b import B
+from examples.c import C
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'sql', 'testing')
+ROW = {
+    'string': 'Hello world.',
+    'json': {'x': 1, 'y': 123},
+    'int': 12,
+    'float': 12.34,
+    'datetime': datetime(2021, 11, 18)
+    }
+
+
+def sql_statements(path):
+    """
+    Split a SQL file into statements, honoring the `DELIMITER` directives only the mysql CLI understands.
+    :type path: str
+    :rtype: list of str
+    """
+    delimiter = ';'
+    statements = []
+    buffer = []
+    with open(path) as f:
+        for line in f:
+            if line.strip().upper().startswith('DELIMITER '):
+                delimiter = line.split()[1]
+                continue
+            buffer.append(line)
+            statement = ''.join(buffer).strip()
+            if statement.endswith(delimiter):
+                statements.append(statement[:-len(delimiter)])
+                buffer = []
+    return statements
+
+
+def setup():
+    """
+    Create the `testing` schema, tables and routines from `tests/sql`, and seed the empty tables.
+    """
+    EngineRegistry.register(None)  # Replace any in-memory engine registered by the microbenchmarks.
+    conn = EngineRegistry.get().raw_connection()
+    try:
+        cursor = conn.cursor()
+        paths = [os.path.join(SQL_DIR, 'testing.sql')]
+        paths += sorted(glob.glob(os.path.join(SQL_DIR, 'tables', '*.sql')))
+        paths += sorted(glob.glob(os.path.join(SQL_DIR, 'routines', '*.sql')))
+        for path in sorted(glob.glob(os.path.join(SQL_DIR, 'seed_data', '*__seed_data.sql'))):
+            table = os.path.basename(path).split('__')[0]
+            cursor.execute('SELECT COUNT(*) FROM `testing`.`%s`' % table)
+            if not cursor.fetchone()[0]:
+                paths.append(path)
+        for path in paths:
+            for statement in sql_statements(path):
+                cursor.execute(statement)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def each(func, items):
+    """
+    :param func: callable(item)
+    :type items: list
+    :return: Callable applying `func` to the next of `items` on each call.
+    :rtype: callable
+    """
+    iterator = iter(items)
+    return lambda: func(next(iterator))
+
+
+def run(count=1000):
+    """
+    Rows created by `create` are saved, loaded and deleted in turn, one call per row.
+    :param count: int; Calls per method.
+    :rtype: list of dict
+    """
+    setup()
+    created = []
+
+    def create():
+        created.append(A.create(**ROW))
+
+    def save(a):
+        a.int += 1
+        a.save()
+
+    results = [measure_latency('e2e.create', create, count=count)]
+    results += [
+        measure_latency('e2e.load', each(lambda a: A.load(id=a.id), created), count=count, warmup=False),
+        measure_latency('e2e.load_many[10]', lambda: A.load_many([a.id for a in created[:10]]), count=count),
+        measure_latency('e2e.save', each(save, created), count=count, warmup=False),
+        measure_latency('e2e.list[paginated]', lambda: C.list(limit=10, page=1), count=count),
+        measure_latency('e2e.list[scrollable]', lambda: B.list(limit=10), count=count),
+        measure_latency('e2e.yield_all[paginated]', lambda: list(C.yield_all(limit=5)), count=count),
+        measure_latency('e2e.yield_all[scrollable]', lambda: list(B.yield_all(limit=5)), count=count),
+        measure_latency('e2e.delete', each(lambda a: a.delete(), created), count=len(created), warmup=False),
+        ]
+    return results
+
+
+if __name__ == '__main__':
+    report_latency(run())
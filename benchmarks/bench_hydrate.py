@@ -0,0 +1,68 @@
+"""
+Rows/sec building `A` objects from 10k decoded rows with full restriction validation and with trusted hydration.
+"trusted[text]" rows carry JSON and DATETIME values as text, i.e. from a text protocol cursor, to price coercion.
+    python -m benchmarks.bench_hydrate
+:date_created: 2026-10-16
+"""
+from datetime import datetime
+
+from benchmarks.harness import measure, report
+from examples.a import A
+
+ROWS = 10000
+
+
+def rows(text=False):
+    """
+    :param text: bool; Render `json` and `datetime` as text.
+    :rtype: list of dict
+    """
+    return [
+        {
+            'id': i,
+            'string': 'Hello world.',
+            'json': '{"x": %s, "y": 2}' % i if text else {'x': i, 'y': 2},
+            'int': i,
+            'float': 12.34,
+            'datetime': '2021-11-18 00:00:00' if text else datetime(2021, 11, 18)
+            }
+        for i in range(ROWS)
+        ]
+
+
+def hydrate(data, trusted):
+    """
+    :type data: list of dict
+    :type trusted: bool
+    :rtype: callable
+    """
+    def run():
+        A.trusted_hydration = trusted
+        try:
+            return [A._from_row(row) for row in data]
+        finally:
+            del A.trusted_hydration
+    return run
+
+
+def run(number=1, repeat=5):
+    """
+    :type number: int
+    :type repeat: int
+    :rtype: list of dict
+    """
+    results = [
+        measure('hydrate.full', hydrate(rows(), False), number=number, repeat=repeat),
+        measure('hydrate.trusted', hydrate(rows(), True), number=number, repeat=repeat),
+        measure('hydrate.trusted[text]', hydrate(rows(text=True), True), number=number, repeat=repeat),
+        ]
+    for result in results:
+        result['rows_per_sec'] = ROWS / result['median_us'] * 1e6
+    return results
+
+
+if __name__ == '__main__':
+    results = run()
+    report(results, baseline='hydrate.full')
+    for result in results:
+        print('%-40s %12.0f rows/sec' % (result['name'], result['rows_per_sec']))
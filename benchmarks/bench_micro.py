@@ -0,0 +1,110 @@
+"""
+Pure-Python cost of the per-call hot paths around a stored procedure call, each alone and without any DB call: the
+`Args` and `Data` descriptors, `DBClient.populate_data` over an in-memory cursor, and building one `A` from a decoded
+row. `kwargs_validator` is covered by `bench_validator`.
+    python -m benchmarks.bench_micro
+:date_created: 2026-10-16
+"""
+from datetime import datetime
+
+from pymysql.constants import FIELD_TYPE
+
+from benchmarks.harness import measure, report
+from db_able.client import Args, Data, DBClient, EngineRegistry
+from db_able.mgmt.const import ExecutionMode
+from examples.a import A
+from tests.mock_db import MockCursor, MockDatabase, ResultSet
+
+ROWS = 100
+KWARGS = {'id': 1, 'string': 'a', 'json': {'x': 1, 'y': 2}, 'int': 1, 'float': 1.5, 'datetime': datetime(2021, 11, 18)}
+ROW = {
+    'id': 1,
+    'string': 'Hello world.',
+    'json': {'x': 1, 'y': 123},
+    'int': 12,
+    'float': 12.34,
+    'datetime': datetime(2021, 11, 18)
+    }
+TYPES = {'id': FIELD_TYPE.LONG, 'json': FIELD_TYPE.JSON}
+
+
+class Holder(object):
+    """
+    Bare owner of the `DBClient` descriptors.
+    """
+    args = Args()
+    data = Data()
+    data_types = {key: TYPES.get(key, FIELD_TYPE.VAR_STRING) for key in ROW}
+
+
+def set_args():
+    """
+    :rtype: callable
+    """
+    holder = Holder()
+    args = list(KWARGS.items())
+
+    def run():
+        holder.args = args
+    return run
+
+
+def set_data():
+    """
+    :rtype: callable
+    """
+    holder = Holder()
+    data = [dict(ROW, json='{"x": %s, "y": 123}' % i) for i in range(ROWS)]
+
+    def run():
+        holder.data = data
+    return run
+
+
+def populate_data():
+    """
+    :rtype: callable
+    """
+    result_set = ResultSet.from_dicts([dict(ROW, id=i, json='{"x": %s, "y": 123}' % i) for i in range(ROWS)],
+                                      types=TYPES)
+    EngineRegistry.register_engine(None, MockDatabase().engine())
+    conn = DBClient('testing', 'A_list', execution_mode=ExecutionMode.DBAPI)
+    cursor = conn._cursor = MockCursor(None)  # Cached `DBClient.cursor`, standing in for the executed CALL.
+
+    def run():
+        cursor._load(result_set)
+        conn.populate_data()
+    return run
+
+
+def hydrate(trusted):
+    """
+    :type trusted: bool
+    :rtype: callable
+    """
+    def run():
+        A.trusted_hydration = trusted
+        try:
+            return A._from_row(ROW)
+        finally:
+            del A.trusted_hydration
+    return run
+
+
+def run(number=20000, repeat=5):
+    """
+    :type number: int
+    :type repeat: int
+    :rtype: list of dict
+    """
+    return [
+        measure('micro.args[%s]' % len(KWARGS), set_args(), number=number, repeat=repeat),
+        measure('micro.data[%s]' % ROWS, set_data(), number=number // 100, repeat=repeat),
+        measure('micro.populate_data[%s]' % ROWS, populate_data(), number=number // 100, repeat=repeat),
+        measure('micro.hydrate[full]', hydrate(False), number=number, repeat=repeat),
+        measure('micro.hydrate[trusted]', hydrate(True), number=number, repeat=repeat),
+        ]
+
+
+if __name__ == '__main__':
+    report(run())
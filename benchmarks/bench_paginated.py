@@ -0,0 +1,120 @@
+"""
+Deep-page latency of the OFFSET `PaginatedListProcedure` against the `DeferredJoinListProcedure` on a local MySQL.
+Requires a server reachable through `DB_CONN_STR` (or `db_able.client.CONN_STR`); a `testing`.`bench_page` table is
+created and seeded with `ROWS` rows of wide payloads on first run.
+    python -m benchmarks.bench_paginated
+:date_created: 2026-10-16
+"""
+from do_py import R
+
+from benchmarks.harness import measure, report
+from db_able import Paginated, Params
+from db_able.client import EngineRegistry
+from db_able.utils.sql_generator import CoreStoredProcedure
+
+ROWS = 500000
+LIMIT = 50
+BATCH = 5000
+PAYLOAD = 'x' * 1000
+
+
+def page_cls(version):
+    """
+    :param version: int or None; `list` stored procedure version, i.e. `BenchPage_list_v2`.
+    :rtype: type[Paginated]
+    """
+    return type('BenchPage', (Paginated,), {
+        '__module__': __name__,
+        'db': 'testing',
+        '_restrictions': {
+            'id': R.INT,
+            'x': R.INT,
+            'payload': R.STR
+            },
+        '_extra_restrictions': {
+            'limit': R.INT.with_default(LIMIT),
+            'page': R.INT.with_default(1)
+            },
+        'list_params': Params('limit', 'page', version=version)
+        })
+
+
+OffsetPage = page_cls(None)
+DeferredJoinPage = page_cls(2)
+
+
+def procedure_statements(cls_ref, procedure_key):
+    """
+    Statements creating the `list` stored procedure of `cls_ref` generated with `procedure_key`, without the
+    `DELIMITER` directives only the mysql CLI understands.
+    :type cls_ref: type[Paginated]
+    :type procedure_key: str
+    :rtype: list of str
+    """
+    sp = CoreStoredProcedure.from_db_able(cls_ref, 'list', procedure_key=procedure_key)
+    name = '`testing`.`%s_list%s`' % (cls_ref.__name__, sp.version)
+    return ['DROP PROCEDURE IF EXISTS %s' % name,
+            'CREATE PROCEDURE %s (\n%s\n)\nBEGIN\n    %s\nEND' % (name, sp.params, sp.procedure)]
+
+
+def setup():
+    """
+    Create and seed `testing`.`bench_page`, and both `list` stored procedures.
+    """
+    EngineRegistry.register(None)  # Replace any in-memory engine registered by the microbenchmarks.
+    conn = EngineRegistry.get().raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''CREATE TABLE IF NOT EXISTS `testing`.`bench_page`
+        (
+            `id`      INT          NOT NULL AUTO_INCREMENT,
+            `x`       INT          NOT NULL,
+            `payload` VARCHAR(1000) NOT NULL,
+            PRIMARY KEY (`id`)
+        )''')
+        cursor.execute('SELECT COUNT(*) FROM `testing`.`bench_page`')
+        for start in range(cursor.fetchone()[0], ROWS, BATCH):
+            cursor.executemany(
+                'INSERT INTO `testing`.`bench_page` (`x`, `payload`) VALUES (%s, %s)',
+                [(i, PAYLOAD) for i in range(start, min(start + BATCH, ROWS))]
+                )
+            conn.commit()
+        for cls_ref, procedure_key in [(OffsetPage, 'paginated'), (DeferredJoinPage, 'paginated_deferred_join')]:
+            for statement in procedure_statements(cls_ref, procedure_key):
+                cursor.execute(statement)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def list_page(cls_ref, page):
+    """
+    :type cls_ref: type[Paginated]
+    :type page: int
+    :rtype: callable
+    """
+    def run():
+        cls_ref.list(limit=LIMIT, page=page)
+    return run
+
+
+def run(number=5, repeat=3):
+    """
+    :type number: int
+    :type repeat: int
+    :return: Results grouped by page depth.
+    :rtype: list of list of dict
+    """
+    setup()
+    return [
+        [
+            measure('offset[page=%s]' % page, list_page(OffsetPage, page), number=number, repeat=repeat),
+            measure('deferred_join[page=%s]' % page, list_page(DeferredJoinPage, page), number=number, repeat=repeat),
+            ]
+        for page in [1, ROWS // LIMIT // 10, ROWS // LIMIT // 2, ROWS // LIMIT]
+        ]
+
+
+if __name__ == '__main__':
+    for results in run():
+        report(results, baseline=results[0]['name'])
@@ -0,0 +1,61 @@
+"""
+Time and memory per row of a 100k-row `C.list` page hydrated into DataObjects against `list(raw=True)` namedtuples,
+over an in-memory result set.
+    python -m benchmarks.bench_raw
+:date_created: 2026-10-16
+"""
+from benchmarks.harness import measure, measure_memory, report, report_memory
+from db_able.client import EngineRegistry
+from examples.c import C
+from tests.mock_db import MockDatabase, ResultSet
+
+ROWS = 100000
+
+
+def setup(rows=ROWS):
+    """
+    Register an in-memory `C_list` stored procedure returning `rows` rows as the default engine.
+    :type rows: int
+    """
+    result_sets = [
+        ResultSet.from_dicts([{'id': i, 'x': i * 10, 'y': i * 100} for i in range(rows)]),
+        ResultSet.from_dicts([{'page': 1, 'total': rows, 'page_size': rows}])
+        ]
+    db = MockDatabase()
+    db.register('testing', 'C_list', lambda limit, page: result_sets)
+    EngineRegistry.register_engine(None, db.engine())
+
+
+def list_page(raw):
+    """
+    :type raw: bool
+    :rtype: callable
+    """
+    def run():
+        return C.list(limit=ROWS, raw=raw).data
+    return run
+
+
+def run(number=1, repeat=5):
+    """
+    :type number: int
+    :type repeat: int
+    :return: Timing results and memory results.
+    :rtype: tuple[list of dict, list of dict]
+    """
+    setup()
+    timings = [
+        measure('list.objects', list_page(False), number=number, repeat=repeat),
+        measure('list.raw', list_page(True), number=number, repeat=repeat),
+        ]
+    memory = [
+        measure_memory('memory.list.objects', list_page(False), ROWS),
+        measure_memory('memory.list.raw', list_page(True), ROWS),
+        ]
+    return timings, memory
+
+
+if __name__ == '__main__':
+    timings, memory = run()
+    report(timings, baseline='list.objects')
+    report_memory(memory)
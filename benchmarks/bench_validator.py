@@ -0,0 +1,53 @@
+"""
+Per-call cost of `KwargsValidator.kwargs_validator` for `A.save_params`, alone and without any DB call.
+"legacy" reproduces the per-argument restriction lookups that preceded precompiled `KwargsPlan`s.
+    python -m benchmarks.bench_validator
+:date_created: 2026-10-16
+"""
+from datetime import datetime
+
+from do_py.exceptions import DataObjectError, RestrictionError
+
+from benchmarks.harness import measure, report
+from examples.a import A
+
+KWARGS = {'id': 1, 'string': 'a', 'json': None, 'int': 1, 'float': 1.5, 'datetime': datetime(2021, 11, 18)}
+
+
+def legacy(cls, *signature, **kwargs):
+    """
+    :type cls: type[db_able.base_model.kwargs_validator.KwargsValidator]
+    :rtype: list of tuple
+    """
+    validated_vals = []
+    for k in signature:
+        try:
+            if k in cls._restrictions:
+                validated_vals.append((k, cls._restrictions[k](kwargs.get(k, cls._restrictions[k].default))))
+            elif k in cls._extra_restrictions:
+                validated_vals.append(
+                    (k, cls._extra_restrictions[k](kwargs.get(k, cls._extra_restrictions[k].default)))
+                    )
+            else:
+                raise KeyError('Restrictions required for "%s" in %s.' % (k, cls.__name__))
+        except RestrictionError as re:
+            raise DataObjectError.from_restriction_error(k, cls, re)
+    return validated_vals
+
+
+def run(number=100000, repeat=5):
+    """
+    :type number: int
+    :type repeat: int
+    :rtype: list of dict
+    """
+    assert legacy(A, *A.save_params, **KWARGS) == A.kwargs_validator(*A.save_params, **KWARGS)
+    return [
+        measure('kwargs_validator.legacy', lambda: legacy(A, *A.save_params, **KWARGS), number=number, repeat=repeat),
+        measure('kwargs_validator.plan', lambda: A.kwargs_validator(*A.save_params, **KWARGS),
+                number=number, repeat=repeat),
+        ]
+
+
+if __name__ == '__main__':
+    report(run(), baseline='kwargs_validator.legacy')
@@ -0,0 +1,121 @@
+"""
+Minimal timing harness shared by the benchmark modules.
+:date_created: 2026-10-16
+"""
+import statistics
+import time
+import timeit
+import tracemalloc
+
+
+def measure(name, func, number=1000, repeat=5):
+    """
+    Time `func` with `timeit`, reporting per-call statistics over `repeat` rounds of `number` calls.
+    :type name: str
+    :type func: callable
+    :type number: int
+    :type repeat: int
+    :rtype: dict
+    """
+    func()  # Warm up caches, pools and lazily-built engines.
+    rounds = [total / number for total in timeit.repeat(func, number=number, repeat=repeat)]
+    return {
+        'name': name,
+        'number': number,
+        'repeat': repeat,
+        'min_us': min(rounds) * 1e6,
+        'median_us': statistics.median(rounds) * 1e6,
+        }
+
+
+def report(results, baseline=None):
+    """
+    Print `results` as a table. When `baseline` names a result, include the speedup relative to it.
+    :type results: list of dict
+    :type baseline: str or None
+    """
+    reference = next((result['median_us'] for result in results if result['name'] == baseline), None)
+    print('%-40s %12s %12s %9s' % ('benchmark', 'min (us)', 'median (us)', 'speedup'))
+    for result in results:
+        speedup = '%.2fx' % (reference / result['median_us']) if reference else ''
+        print('%-40s %12.2f %12.2f %9s' % (result['name'], result['min_us'], result['median_us'], speedup))
+
+
+def measure_memory(name, func, count):
+    """
+    Trace the memory still allocated by the value `func` returns, per item of `count` items.
+    :type name: str
+    :param func: callable; Builds and returns the measured value, i.e. a page of rows.
+    :param count: int; Number of items held by the returned value.
+    :rtype: dict
+    """
+    func()  # Warm up caches, pools and lazily-built engines.
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = func()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del value
+    return {
+        'name': name,
+        'count': count,
+        'bytes_per_item': retained / count,
+        }
+
+
+def report_memory(results):
+    """
+    Print `measure_memory` results as a table.
+    :type results: list of dict
+    """
+    print('%-40s %12s %16s' % ('benchmark', 'items', 'bytes per item'))
+    for result in results:
+        print('%-40s %12d %16.1f' % (result['name'], result['count'], result['bytes_per_item']))
+
+
+def measure_latency(name, func, count=1000, warmup=True):
+    """
+    Time each of `count` calls of `func` separately, for throughput and latency percentiles of calls that each pay a
+    round trip, i.e. to MySQL.
+    :type name: str
+    :type func: callable
+    :type count: int
+    :param warmup: bool; Call `func` once, untimed, first. Disable when each call consumes state, i.e. deletes a row.
+    :rtype: dict
+    """
+    if warmup:
+        func()
+    perf_counter = time.perf_counter
+    latencies = []
+    for _ in range(count):
+        start = perf_counter()
+        func()
+        latencies.append(perf_counter() - start)
+    latencies.sort()
+
+    def percentile(q):
+        return latencies[min(int(q * count), count - 1)] * 1e6
+
+    return {
+        'name': name,
+        'count': count,
+        'ops_per_sec': count / sum(latencies),
+        'min_us': latencies[0] * 1e6,
+        'median_us': statistics.median(latencies) * 1e6,
+        'p95_us': percentile(0.95),
+        'p99_us': percentile(0.99),
+        }
+
+
+def report_latency(results):
+    """
+    Print `measure_latency` results as a table.
+    :type results: list of dict
+    """
+    print('%-40s %10s %12s %12s %12s' % ('benchmark', 'ops/sec', 'median (us)', 'p95 (us)', 'p99 (us)'))
+    for result in results:
+        print('%-40s %10.0f %12.2f %12.2f %12.2f' % (
+            result['name'], result['ops_per_sec'], result['median_us'], result['p95_us'], result['p99_us']
+            ))
@@ -0,0 +1,133 @@
+"""
+Run the benchmark modules and write their results as JSON, keyed by benchmark name, to compare between commits.
+Microbenchmarks run in-memory; `--mysql` adds the end-to-end and deep-page benchmarks against a local server.
+    python -m benchmarks.suite --output before.json
+    git checkout my-branch
+    python -m benchmarks.suite --output after.json --compare before.json
+:date_created: 2026-10-16
+"""
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+MICRO = ['bench_micro', 'bench_validator', 'bench_client', 'bench_decode', 'bench_hydrate', 'bench_raw', 'bench_create']
+MYSQL = ['bench_e2e', 'bench_paginated']
+
+
+def commit():
+    """
+    :return: The checked-out git commit, or None outside of a git checkout.
+    :rtype: str or None
+    """
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(results):
+    """
+    :param results: list or tuple of dict, or of nested groups of them.
+    :rtype: list of dict
+    """
+    flat = []
+    for result in results:
+        flat.extend(flatten(result) if isinstance(result, (list, tuple)) else [result])
+    return flat
+
+
+def value(result, metric):
+    """
+    :param result: dict; A `measure`, `measure_latency` or `measure_memory` result.
+    :param metric: str; Refer to `compare`.
+    :return: `metric` of a timing result, or the bytes per item of a memory result; lower is better for both.
+    :rtype: float
+    """
+    return result[metric] if metric in result else result['bytes_per_item']
+
+
+def run(modules):
+    """
+    :param modules: list of str; Names of `benchmarks` modules exposing `run()`, returning results or groups of
+        results, i.e. timings and memory.
+    :rtype: dict
+    """
+    results = {}
+    for module_name in modules:
+        module = importlib.import_module('benchmarks.%s' % module_name)
+        print('Running %s...' % module_name, file=sys.stderr)
+        for result in flatten(module.run()):
+            assert result['name'] not in results, 'Duplicate benchmark name "%s".' % result['name']
+            results[result['name']] = dict(result, module=module_name)
+    return {
+        'commit': commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': datetime.utcnow().isoformat(),
+        'results': results
+        }
+
+
+def compare(current, baseline, threshold=0.1, metric='min_us'):
+    """
+    Print `metric` of each benchmark present in both runs, relative to `baseline`. Memory benchmarks compare their
+    bytes per item.
+    :type current: dict
+    :type baseline: dict
+    :param threshold: float; Relative slowdown, or growth, above which a benchmark is reported as a regression.
+    :param metric: str; "min_us", the least noisy on a shared machine, or "median_us".
+    :return: Names of the regressed benchmarks.
+    :rtype: list of str
+    """
+    regressions = []
+    print('%-40s %14s %14s %9s' % ('benchmark', 'base', 'current', 'change'), file=sys.stderr)
+    for name, result in sorted(current['results'].items()):
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        change = value(result, metric) / value(base, metric) - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print('%-40s %14.2f %14.2f %+8.1f%%%s' % (
+            name, value(base, metric), value(result, metric), change * 100, flag
+            ), file=sys.stderr)
+    return regressions
+
+
+def main(argv=None):
+    """
+    :type argv: list of str or None
+    :return: Exit code; 1 when `--compare` finds a regression.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.split('\n')[1])
+    parser.add_argument('--output', help='Path of the JSON results to write; stdout when omitted.')
+    parser.add_argument('--mysql', action='store_true', help='Also run the end-to-end MySQL benchmarks.')
+    parser.add_argument('--only', action='append', choices=MICRO + MYSQL, help='Module to run; repeatable.')
+    parser.add_argument('--compare', help='Path of baseline JSON results to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Relative slowdown reported as a regression; default 0.1.')
+    parser.add_argument('--metric', choices=['min_us', 'median_us'], default='min_us', help='Statistic compared.')
+    args = parser.parse_args(argv)
+    current = run(args.only or MICRO + (MYSQL if args.mysql else []))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+    else:
+        json.dump(current, sys.stdout, indent=2, sort_keys=True)
+        print()
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        return 1 if compare(current, baseline, threshold=args.threshold, metric=args.metric) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,6 +3,7 @@
 """
 
 from db_able.base_model.params import Params
+from db_able.client.transaction import Transaction
 from db_able.loadable import Loadable
 from db_able.listable import Paginated, Scrollable
 from db_able.creatable import Creatable
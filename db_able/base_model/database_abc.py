@@ -1,19 +1,40 @@
 """
 :date_created: 2021-11-03
 """
+import copy
 
 from do_py.abc import ABCRestrictions
 
+from db_able.base_model import hydration
 from db_able.base_model.kwargs_validator import KwargsValidator
 from db_able.base_model.params import Params
+from db_able.client import DBClient
+from db_able.client.aio import AsyncDBClient
+from db_able.client.transaction import Transaction
+from db_able.mgmt.const import ExecutionMode
 
 
 @ABCRestrictions.require('db')
 class Database(KwargsValidator):
     """
     Abstracted common required attributes and functionality for all DBAble mixins.
+    :attribute engine_key: Optional `EngineRegistry` key to bind the class to; defaults to `db`.
+    :attribute execution_mode: `ExecutionMode` used by `DBClient` for this class's stored procedures.
+    :attribute load_cache: Optional `LRUCache` of rows keyed by `load_params`, read through by `Loadable.load`.
+    :attribute list_cache: Optional `LRUCache` of pages keyed by validated `list_params`, read through by `list`.
+    :attribute trusted_hydration: Build objects from DB rows with a `HydrationPlan` instead of full restriction
+        validation. Set `DB_FULL_VALIDATION=1` to validate in full regardless, i.e. to debug a stored procedure.
+    :attribute echo_writes: `create` and `save` read the written row back from DB. When False, their stored
+        procedures take an `_echo` flag and, unless echoing, return only the generated key or the affected-row
+        count; the written values are merged into the local object instead.
     """
     _is_abstract_ = True
+    engine_key = None
+    execution_mode = ExecutionMode.SESSION
+    load_cache = None
+    list_cache = None
+    trusted_hydration = False
+    echo_writes = True
 
     @classmethod
     def _validate_params(cls, params_attr_name):
@@ -22,6 +43,7 @@ class Database(KwargsValidator):
         2. Transform the params into a `Params` instance.
         3. Validate that all declared parameters have a corresponding restriction
             in `cls._restrictions` or `cls._extra_restrictions`.
+        4. Precompile the `KwargsPlan` used to validate the params on each call.
         :type params_attr_name: str
         """
         params = getattr(cls, params_attr_name)
@@ -32,3 +54,113 @@ class Database(KwargsValidator):
         for k in params:
             assert k in cls._restrictions or k in cls._extra_restrictions, \
                 '%s: Missing restrictions for "%s" in %s.' % (cls.__name__, k, params_attr_name)
+        cls.compile_kwargs_plan(*params)
+
+    @classmethod
+    def _from_row(cls, row):
+        """
+        :param row: dict; Row returned by DB.
+        :rtype: cls
+        """
+        if cls.trusted_hydration and not hydration.FULL_VALIDATION:
+            return hydration.HydrationPlan.get(cls).hydrate(row)
+        return cls(data=row)
+
+    @classmethod
+    def _from_written(cls, data):
+        """
+        Build an object from the values just written to DB, without reading them back. Fields that were not
+        written take their restriction default.
+        :param data: dict; Validated args merged with the row returned by DB, i.e. the generated key.
+        :rtype: cls
+        """
+        return cls(data=data, strict=False)
+
+    def _copy(self):
+        """
+        :return: A deep copy of `self`, i.e. of a cached object handed to a caller, sharing no nested values.
+        :rtype: Database
+        """
+        return type(self)(data=copy.deepcopy(dict(self)))
+
+    def _refresh(self, row):
+        """
+        Replace the data of `self` with a row returned by DB.
+        :type row: dict
+        """
+        if self.trusted_hydration and not hydration.FULL_VALIDATION:
+            hydration.HydrationPlan.get(type(self)).hydrate(row, into=self)
+        else:
+            self(data=row)
+
+    @classmethod
+    def _load_cache_key(cls, data):
+        """
+        :param data: dict or list of tuple; Row or validated args holding the values of `cls.load_params`.
+        :return: Key into `cls.load_cache`, or None when the class does not cache loads.
+        :rtype: tuple or None
+        """
+        if cls.load_cache is None or not hasattr(cls, 'load_params'):
+            return None
+        data = dict(data)
+        return (cls,) + tuple(data.get(param) for param in cls.load_params)
+
+    @classmethod
+    def _cache_row(cls, row):
+        """
+        Populate or refresh `cls.load_cache` with a row returned by DB. Within a `Transaction` the row may yet be
+        rolled back, so the entry is invalidated instead. The row is deep-copied so that the caller hydrating it
+        never shares nested values with the cache.
+        :type row: dict
+        """
+        key = cls._load_cache_key(row)
+        if key is not None:
+            if Transaction.current() is None:
+                cls.load_cache.set(key, copy.deepcopy(row))
+            else:
+                cls.load_cache.pop(key)
+
+    @classmethod
+    def _uncache_row(cls, data):
+        """
+        Invalidate the `cls.load_cache` entry for `data`.
+        :param data: dict or list of tuple; Row or validated args holding the values of `cls.load_params`.
+        """
+        key = cls._load_cache_key(data)
+        if key is not None:
+            cls.load_cache.pop(key)
+
+    @classmethod
+    def _invalidate_list_cache(cls):
+        """
+        Drop every page and cached total of this class from `cls.list_cache` and `cls.total_cache`; any in-process
+        write may change any page.
+        """
+        for cache in [cls.list_cache, getattr(cls, 'total_cache', None)]:
+            if cache is not None:
+                cache.discard(lambda key: key[0] is cls)
+
+    @classmethod
+    def _db_client(cls, stored_procedure, *args, **kwargs):
+        """
+        Construct a `DBClient` for `stored_procedure` bound to the class's engine and execution settings.
+        :type stored_procedure: str
+        :param args: *list of tuple; Stored procedure's keyword argument values.
+        :param kwargs: Refer to `DBClient.__init__`.
+        :rtype: DBClient
+        """
+        kwargs.setdefault('engine_key', cls.engine_key)
+        kwargs.setdefault('execution_mode', cls.execution_mode)
+        return DBClient(cls.db, stored_procedure, *args, **kwargs)
+
+    @classmethod
+    def _async_db_client(cls, stored_procedure, *args, **kwargs):
+        """
+        Construct an `AsyncDBClient` for `stored_procedure` bound to the class's engine settings.
+        :type stored_procedure: str
+        :param args: *list of tuple; Stored procedure's keyword argument values.
+        :param kwargs: Refer to `AsyncDBClient.__init__`.
+        :rtype: AsyncDBClient
+        """
+        kwargs.setdefault('engine_key', cls.engine_key)
+        return AsyncDBClient(cls.db, stored_procedure, *args, **kwargs)
@@ -0,0 +1,120 @@
+"""
+Trusted hydration of DataObjects from DB rows: per-class plans that skip do_py restriction validation and apply only
+the cheap coercions a typed MySQL column may still need.
+:date_created: 2026-10-16
+"""
+import os
+from datetime import date, datetime
+
+from do_py.data_object.restriction import (
+    _DataObjectRestriction, _ListNoRestriction, _ListTypeRestriction, _ListValueRestriction,
+    _NullableDataObjectRestriction
+    )
+from do_py.data_object.validator import Validator
+
+from db_able import client
+
+FULL_VALIDATION = os.getenv('DB_FULL_VALIDATION', '').lower() in ('1', 'true', 'yes')
+
+
+def _datetime(value):
+    """
+    :param value: datetime or str; i.e. a DATETIME rendered as text by a JSON column or a text protocol cursor.
+    :rtype: datetime
+    """
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _date(value):
+    """
+    :param value: date or str
+    :rtype: date
+    """
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+class HydrationPlan(object):
+    """
+    Coercions for the restrictions of one DataObject class, resolved once, then applied to every row in a tight loop.
+    Restrictions that only check types or values are trusted and skipped; nested DataObjects are built through their
+    own plan, decoding JSON text first; any other restriction, i.e. `ManagedRestrictions`, still runs in full.
+    """
+    plans = {}
+
+    def __init__(self, cls_ref):
+        """
+        :type cls_ref: type[do_py.DataObject]
+        """
+        cls_ref.__new__(cls_ref)  # Run the `ABCRestrictions` checks once; instances are then allocated directly.
+        self.cls_ref = cls_ref
+        self.keys = cls_ref._restrictions.keys()
+        self.validate = issubclass(cls_ref, Validator)
+        self.coercions = tuple(
+            (key, coerce) for key, coerce in (
+                (key, self.coercion(restriction)) for key, restriction in cls_ref._restrictions.items()
+                )
+            if coerce is not None
+            )
+
+    @classmethod
+    def get(cls, cls_ref):
+        """
+        :type cls_ref: type[do_py.DataObject]
+        :rtype: HydrationPlan
+        """
+        plan = cls.plans.get(cls_ref)
+        if plan is None:
+            plan = cls.plans[cls_ref] = cls(cls_ref)
+        return plan
+
+    @classmethod
+    def coercion(cls, restriction):
+        """
+        :type restriction: do_py.data_object.restriction.AbstractRestriction
+        :return: Callable coercing a trusted value for `restriction`, or None when the value is used as is.
+        :rtype: callable or None
+        """
+        if isinstance(restriction, _NullableDataObjectRestriction):
+            nullable = not isinstance(restriction, _DataObjectRestriction)
+            dataobj = restriction.allowed
+
+            def coerce(value):
+                if value is None and nullable:
+                    return None
+                if isinstance(value, (str, bytes)):
+                    value = client.JSON_CODEC.loads(value)
+                if not isinstance(value, dict):
+                    return restriction(value)
+                return cls.get(dataobj).hydrate(value)
+            return coerce
+        if isinstance(restriction, _ListTypeRestriction):
+            if datetime in restriction.allowed:
+                return _datetime
+            if date in restriction.allowed:
+                return _date
+            return None
+        if isinstance(restriction, (_ListValueRestriction, _ListNoRestriction)):
+            return None
+        return restriction
+
+    def hydrate(self, row, into=None):
+        """
+        :param row: dict; Row holding exactly the restricted keys. Any other row is validated in full, raising the
+            usual do_py errors.
+        :param into: Optional instance of `self.cls_ref` to replace the data of instead of building a new one.
+        :rtype: do_py.DataObject
+        """
+        if row.keys() != self.keys:
+            return self.cls_ref(data=row) if into is None else into(data=row)
+        data = dict(row)
+        for key, coerce in self.coercions:
+            data[key] = coerce(data[key])
+        if into is None:
+            into = dict.__new__(self.cls_ref)
+            object.__setattr__(into, '_strict', True)
+        else:
+            dict.clear(into)
+        dict.update(into, data)
+        if self.validate:
+            into._validate()
+        return into
@@ -30,6 +30,20 @@ class KwargsValidator(DataObject):
                 except RestrictionError as re:
                     raise DataObjectError.from_restriction_error(k, cls, re)
 
+    @classmethod
+    def compile_kwargs_plan(cls, *signature):
+        """
+        Precompile and cache the `KwargsPlan` used by `cls.kwargs_validator` for `signature`.
+        :param signature: *str; Argument names, i.e. a `%s_params` attribute.
+        :rtype: KwargsPlan
+        """
+        plans = cls.__dict__.get('_kwargs_plans')
+        if plans is None:
+            plans = {}
+            setattr(cls, '_kwargs_plans', plans)
+        plan = plans[signature] = KwargsPlan(cls, signature)
+        return plan
+
     @classmethod
     def kwargs_validator(cls, *signature, **kwargs):
         """
@@ -40,19 +54,50 @@ class KwargsValidator(DataObject):
         :return: list of validated kwargs
         :rtype: list of tuple
         """
-        validated_vals = []
-        for k in signature:
+        plan = cls.__dict__.get('_kwargs_plans', {}).get(signature)
+        if plan is None:
+            plan = KwargsPlan(cls, signature)
+        return plan.validate(kwargs)
+
+
+class KwargsPlan(object):
+    """
+    Restrictions and defaults of a fixed signature resolved once, so validating each call is a straight loop.
+    """
+
+    def __init__(self, cls_ref, signature):
+        """
+        :type cls_ref: type[KwargsValidator]
+        :param signature: tuple of str; Argument names in stored procedure order.
+        :raises KeyError: When an argument has no restriction.
+        """
+        self.cls_ref = cls_ref
+        self.signature = tuple(signature)
+        steps = []
+        for k in self.signature:
+            if k in cls_ref._restrictions:
+                restriction = cls_ref._restrictions[k]
+            elif k in cls_ref._extra_restrictions:
+                restriction = cls_ref._extra_restrictions[k]
+            else:
+                raise KeyError('Restrictions required for "%s" in %s.' % (k, cls_ref.__name__))
+            steps.append((k, restriction, restriction.default))
+        self.steps = tuple(steps)
+
+    def validate(self, kwargs):
+        """
+        :param kwargs: dict; Keyword arguments to validate, with defaults injected for missing ones.
+        :return: list of validated kwargs
+        :rtype: list of tuple
+        """
+        get = kwargs.get
+        try:
+            return [(k, restriction(get(k, default))) for k, restriction, default in self.steps]
+        except RestrictionError as re:
+            error = re
+        for k, restriction, default in self.steps:  # Name the failing argument.
             try:
-                if k in cls._restrictions:
-                    validated_vals.append(
-                        (k, cls._restrictions[k](kwargs.get(k, cls._restrictions[k].default)))
-                        )
-                elif k in cls._extra_restrictions:
-                    validated_vals.append(
-                        (k, cls._extra_restrictions[k](kwargs.get(k, cls._extra_restrictions[k].default)))
-                        )
-                else:
-                    raise KeyError('Restrictions required for "%s" in %s.' % (k, cls.__name__))
+                restriction(get(k, default))
             except RestrictionError as re:
-                raise DataObjectError.from_restriction_error(k, cls, re)
-        return validated_vals
+                raise DataObjectError.from_restriction_error(k, self.cls_ref, re)
+        raise error  # No single argument fails on its own, i.e. a restriction depending on call order or state.
@@ -2,17 +2,24 @@
 :date_created: 2021-10-23
 """
 
-import json
 import os
 
 from do_py.utils import cached_property
-from do_py.utils.properties import cached_classproperty
 from pymysql.constants import FIELD_TYPE
-from sqlalchemy import create_engine, text
+from pymysql.cursors import SSCursor
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 from typing import List
 
+from db_able.client import telemetry
+from db_able.client.codec import DecodedRows, RowDecoder, get_codec
+from db_able.client.registry import Engine, EngineRegistry, PoolConfig  # Re-exported.
+from db_able.client.transaction import Transaction
+from db_able.mgmt.const import ExecutionMode, Phase
+from db_able.utils.cache import LRUCache
+
 CONN_STR = os.getenv('DB_CONN_STR')
+JSON_CODEC = get_codec(os.getenv('DB_JSON_CODEC', 'json'))
 
 
 class Data(object):
@@ -32,19 +39,21 @@ class Data(object):
     def __set__(self, instance, data: List[dict]):
         """
         Validate that `value` is a list of 2-tuples and is dict-transformation friendly.
-        `json.dumps` dict and list vals in tuple[1] of each element
+        Decode JSON columns with `JSON_CODEC`, unless `data` was already decoded by a `RowDecoder`.
         Caveat: Relies on `instance.data_types` to be populated beforehand.
         :type instance: DBClient
         :type data: list of dict
         """
+        if isinstance(data, DecodedRows):
+            instance.__data = data
+            return
+        json_keys = [key for key, data_type in instance.data_types.items() if data_type == FIELD_TYPE.JSON]
         new_data = []
         for datum in data:
-            new_datum = {}
-            for key, value in datum.items():
-                if instance.data_types[key] == FIELD_TYPE.JSON and value is not None:
-                    new_datum[key] = json.loads(value)
-                else:
-                    new_datum[key] = value
+            new_datum = dict(datum.items())
+            for key in json_keys:
+                if new_datum.get(key) is not None:
+                    new_datum[key] = JSON_CODEC.loads(new_datum[key])
             new_data.append(new_datum)
         instance.__data = new_data
 
@@ -66,26 +75,29 @@ class Args(object):
     def __set__(self, instance, args: List[tuple]):
         """
         Validate that `value` is a list of 2-tuples and is dict-transformation friendly.
-        `json.dumps` dict and list vals in tuple[1] of each element
+        Encode dict and list vals in tuple[1] of each element with `JSON_CODEC`.
         :type instance: DBClient
         :type args: list of tuple
         """
         dict(args)  # Attempting this throws a ValueError for malformed `value`.
-        new_args = []
-        for key, value in args:
-            if isinstance(value, dict) or isinstance(value, list):
-                new_args.append((key, json.dumps(value)))
-            else:
-                new_args.append((key, value))
-        instance.__args = new_args
+        dumps = JSON_CODEC.dumps
+        instance.__args = [
+            (key, dumps(value) if isinstance(value, (dict, list)) else value)
+            for key, value in args
+            ]
 
 
-class DBClient(object):
+class BaseDBClient(object):
     """
-    SQLAlchemy to MySQL via pymysql client implementation with context utility.
-    Implementation is scoped to using stored procedures and provided arguments.
+    Stored procedure call state shared by the sync and async clients: arguments, compiled statements and
+    decoded result sets.
+    :attribute statement_cache: Compiled CALL statements keyed by (database, stored_procedure, argument names).
+        Inspect with `DBClient.statement_cache.info()`; bound with `DBClient.statement_cache.resize(maxsize)`.
     """
+    statement_cache = LRUCache(maxsize=1024)
     data_types = None
+    decoder = None
+    row_type = None
     data = Data()
     args = Args()
 
@@ -95,41 +107,144 @@ class DBClient(object):
         :type stored_procedure: str
         :param args: *list of tuple; Stored procedure's keyword argument values.
         :param kwargs: Additional keyword arguments to adjust DB execution logic.
-        :keyword rollback: bool; Rolls back changes on exception.
         """
-        assert CONN_STR is not None, 'Initialize db_able by setting `db_able.client.CONN_STR`.'
         self.database = database
         self.stored_procedure = stored_procedure
         self.args = args
         self.kwargs = kwargs
+        self.row_type = kwargs.get('row_type')
+
+    @property
+    def engine_key(self):
+        """
+        :rtype: str
+        """
+        return self.kwargs.get('engine_key') or self.database
+
+    @cached_property
+    def statement(self):
+        """
+        Both flavors of the CALL statement, served from `self.statement_cache` when already compiled.
+        :return: The SQLAlchemy `TextClause` and its DBAPI "format" paramstyle string.
+        :rtype: tuple[sqlalchemy.sql.elements.TextClause, str]
+        """
+        key = (self.database, self.stored_procedure, tuple(arg[0] for arg in self.args))
+        statement = self.statement_cache.get(key)
+        if statement is None:
+            call = 'CALL `{database}`.`{stored_procedure}`({{args}});'.format(
+                database=self.database,
+                stored_procedure=self.stored_procedure
+                )
+            statement = (
+                text(call.format(args=','.join(':%s' % arg_name for arg_name in key[2]))),
+                call.format(args=','.join('%s' for _ in key[2]))
+                )
+            self.statement_cache.set(key, statement)
+        return statement
 
-    @cached_classproperty
-    def engine(cls):
+    def timed(self, phase):
         """
-        :rtype: sqlalchemy.engine.base.Engine or sqlalchemy.future.Engine
+        Time a phase of this call into the `telemetry` sinks, under the name '%s.%s' % (database, stored_procedure).
+        :param phase: str; Refer to `Phase`.
+        :return: Context manager; a shared no-op when no sink is registered.
         """
-        return create_engine(CONN_STR)
+        if not telemetry.sinks:
+            return telemetry.null_timer
+        return telemetry.Timer('%s.%s' % (self.database, self.stored_procedure), phase)
 
     @property
     def sql(self):
         """
         :rtype: sqlalchemy.sql.elements.TextClause
         """
-        return text(
-            'CALL `{database}`.`{stored_procedure}`({args});'.format(
-                database=self.database,
-                stored_procedure=self.stored_procedure,
-                args=','.join(':%s' % arg[0] for arg in self.args)
-                )
-            )
+        return self.statement[0]
+
+    @property
+    def call_sql(self):
+        """
+        DBAPI flavor of `self.sql`, using pymysql's positional "format" paramstyle.
+        :rtype: str
+        """
+        return self.statement[1]
+
+    def decode(self, description, rows):
+        """
+        Populate `self.data` and `self.data_types` from a result set.
+        :param description: `cursor.description` of the result set; None when there is no result set.
+        :type description: tuple of tuple or None
+        :type rows: list of tuple
+        """
+        self.decoder = RowDecoder.from_description(description or (), JSON_CODEC)
+        # {column_name: pymysql column type}
+        self.data_types = self.decoder.data_types
+        with self.timed(Phase.DECODE):
+            if self.row_type is not None and description:
+                self.data = self.decoder.decode_all_as(rows, self.row_type)
+            else:
+                self.data = self.decoder.decode_all(rows)
+
+    @property
+    def row_decoder(self):
+        """
+        Decoder of one raw row of the current result set: into `self.row_type` instances for the first result set
+        when set, else into dicts.
+        :rtype: callable
+        """
+        if self.row_type is not None:
+            return self.decoder.tuple_decoder(self.row_type)
+        return self.decoder.decode
+
+
+class DBClient(BaseDBClient):
+    """
+    SQLAlchemy to MySQL via pymysql client implementation with context utility.
+    Implementation is scoped to using stored procedures and provided arguments.
+    Clients executed within a `Transaction` context share its connection and defer committing to it.
+    """
+    engine = Engine()
+
+    def __init__(self, database, stored_procedure, *args, **kwargs):
+        """
+        :type database: str
+        :type stored_procedure: str
+        :param args: *list of tuple; Stored procedure's keyword argument values.
+        :param kwargs: Additional keyword arguments to adjust DB execution logic.
+        :keyword rollback: bool; Rolls back changes on exception.
+        :keyword engine_key: str; `EngineRegistry` key to use instead of `database`.
+        :keyword execution_mode: str; Refer to `ExecutionMode`. Defaults to `ExecutionMode.SESSION`.
+        :keyword stream: bool; Read rows on demand through an unbuffered `SSCursor`, via `self.iter_data`.
+            Implies `ExecutionMode.DBAPI`. The connection cannot run other statements until the client exits.
+        :keyword row_type: namedtuple class; Decode the first result set, the rows, into its instances rather than
+            dicts. Its columns must match the fields, else AssertionError is raised. Later result sets, i.e.
+            pagination data, are decoded into dicts.
+        """
+        super(DBClient, self).__init__(database, stored_procedure, *args, **kwargs)
+        self.stream = kwargs.get('stream', False)
+        self.execution_mode = kwargs.get('execution_mode') or ExecutionMode.SESSION
+        if self.stream:
+            self.execution_mode = ExecutionMode.DBAPI
+        self.transaction = Transaction.current()
+        assert self.execution_mode in ExecutionMode.allowed, 'Invalid execution_mode="%s".' % (self.execution_mode,)
+        assert EngineRegistry.has_conn_str(self.engine_key), 'Initialize db_able by setting `db_able.client.CONN_STR`.'
 
     @cached_property
     def conn(self):
         """
-        Note that calling this property opens a connection with DB.
-        :rtype: sqlalchemy.engine.base.Connection
+        Note that calling this property opens a connection with DB, unless joining `self.transaction`.
+        In `ExecutionMode.DBAPI`, this is the pooled DBAPI connection proxy.
+        :rtype: sqlalchemy.engine.base.Connection or sqlalchemy.pool.base._ConnectionFairy
         """
-        return self.engine.connect()
+        engine = self.engine
+        with self.timed(Phase.CHECKOUT):
+            if self.transaction is not None:
+                conn = self.transaction.connect(engine)
+                conn = conn.connection if self.execution_mode == ExecutionMode.DBAPI else conn
+            elif self.execution_mode == ExecutionMode.DBAPI:
+                conn = engine.raw_connection()
+            else:
+                conn = engine.connect()
+        telemetry.record_pool(EngineRegistry.resolve(self.engine_key) or 'default', engine.pool)
+        return conn
 
     @cached_property
     def session(self):
@@ -143,41 +258,99 @@ class DBClient(object):
     def output(self):
         """
         Note that calling this property executes the SQL and prepares for a single pass-through of resulting data.
+        Within `self.transaction`, the SQL is executed on the shared connection without a Session.
         :rtype: sqlalchemy.engine.cursor.CursorResult
         """
-        return self.session.execute(self.sql.bindparams(**dict(self.args)))
+        if self.transaction is not None:
+            conn = self.conn
+            with self.timed(Phase.CALL):
+                return conn.execute(self.sql, dict(self.args))
+        session = self.session
+        with self.timed(Phase.CALL):
+            return session.execute(self.sql, dict(self.args))
+
+    @cached_property
+    def cursor(self):
+        """
+        Note that calling this property executes the SQL.
+        In `ExecutionMode.DBAPI`, the CALL is executed directly on a DBAPI cursor of `self.conn`.
+        :rtype: pymysql.cursors.Cursor or pymysql.cursors.SSCursor
+        """
+        if self.execution_mode == ExecutionMode.DBAPI:
+            cursor = self.conn.cursor(SSCursor if self.stream else None)
+            with self.timed(Phase.CALL):
+                cursor.execute(self.call_sql, [value for _, value in self.args])
+            return cursor
+        return self.output.cursor
 
     def populate_data(self):
         """
-        Use the current `self.output.cursor` position to populate `self.data` and `self.data_types`.
+        Use the current `self.cursor` position to populate `self.data` and `self.data_types`.
+        When streaming, `self.data` is left empty; rows are read on demand with `self.iter_data`.
         """
-        # {column_name: pymysql column type}
-        self.data_types = {descriptor[0]: descriptor[1] for descriptor in self.output.cursor.description}
-        data = []
-        for row in self.output.cursor.fetchall():
-            row_dict = {}
-            for description, value in zip(self.output.cursor.description, row):
-                row_dict[description[0]] = value
-            data.append(row_dict)
-        self.data = data
+        description = self.cursor.description
+        rows = []
+        if not self.stream and description is not None:
+            with self.timed(Phase.FETCH):
+                rows = self.cursor.fetchall()
+        self.decode(description, rows)
 
     def next_set(self):
         """
         Move cursor to next result set and populate `self.data` with data from next result set.
         :rtype: bool
         """
-        next_set_bool = self.output.cursor.nextset() and self.output.cursor.description
+        if self.stream:
+            for _ in iter(self.cursor.fetchone, None):  # Unread rows must be drained before moving on.
+                pass
+        self.row_type = None
+        next_set_bool = self.cursor.nextset() and self.cursor.description
         self.populate_data()
         return next_set_bool
 
+    def iter_data(self):
+        """
+        Yield the rows of the current result set as dicts, or `row_type` instances, decoding JSON columns as they
+        are read.
+        When streaming, rows are read from the server one at a time and are not retained.
+        :rtype: Generator
+        """
+        if not self.stream:
+            yield from self.data
+            return
+        decode = self.row_decoder
+        for row in iter(self.cursor.fetchone, None):
+            yield decode(row)
+
     def __enter__(self):
         """
         Execute the constructed `self.sql` command in DB based on `__init__` params.
         :rtype: DBClient
         """
-        self.populate_data()
+        try:
+            self.populate_data()
+        except BaseException:
+            self._abort()
+            raise
         return self
 
+    def _abort(self):
+        """
+        Roll back and release what a failed `__enter__` opened, as `__exit__` is not called for it.
+        Within `self.transaction`, the unit of work is marked to roll back instead.
+        """
+        if hasattr(self, '_cursor') and self.execution_mode == ExecutionMode.DBAPI:
+            self.cursor.close()
+        if self.transaction is not None:
+            self.transaction.set_rollback_only()
+        elif hasattr(self, '_conn'):  # `cached_property` values are stored as `_<name>`.
+            if self.execution_mode == ExecutionMode.DBAPI:
+                self.conn.rollback()
+            elif hasattr(self, '_session'):
+                self.session.rollback()
+                self.session.close()
+            self.conn.close()
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         :type exc_type: Exception or None
@@ -185,7 +358,25 @@ class DBClient(object):
         :type exc_tb:
         :rtype:
         """
-        if exc_type is None or not self.kwargs.get('rollback', False):
+        commit = exc_type is None or not self.kwargs.get('rollback', False)
+        if self.transaction is not None:
+            # Committing or rolling back is deferred to the unit of work.
+            if not commit:
+                self.transaction.set_rollback_only()
+            if self.execution_mode == ExecutionMode.DBAPI:
+                self.cursor.close()
+            else:
+                self.output.close()
+            return
+        if self.execution_mode == ExecutionMode.DBAPI:
+            self.cursor.close()  # Drains any unread rows of an unbuffered cursor.
+            if commit:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+            self.conn.close()  # Returns the DBAPI connection to the pool.
+            return
+        if commit:
             self.session.commit()
         self.session.__exit__(exc_type, exc_val, exc_tb)
         self.conn.__exit__(exc_type, exc_val, exc_tb)
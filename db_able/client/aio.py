@@ -0,0 +1,227 @@
+"""
+asyncio client implementation on aiomysql. Requires `pip install db-able[async]`.
+:date_created: 2026-10-16
+"""
+import asyncio
+
+from pymysql.constants import CLIENT
+from sqlalchemy.engine.url import make_url
+
+from db_able import client
+from db_able.client import BaseDBClient, EngineRegistry
+from db_able.mgmt.const import Phase
+
+
+class AsyncEngineRegistry(object):
+    """
+    Process-wide registry of aiomysql pools. Keys resolve exactly like `EngineRegistry` keys and pools are sized from
+    the same `PoolConfig` registrations: `maxsize` is `pool_size + max_overflow`, acquiring waits up to
+    `pool_timeout` seconds and `pool_pre_ping` pings connections on checkout.
+    Caveat: aiomysql pools are bound to the event loop they were created on. Call `close` before the loop closes.
+
+    Example:
+        >>> from db_able.client import EngineRegistry
+        >>>
+        >>> EngineRegistry.register(None, pool_size=10, max_overflow=0)  # Sync engine and async pool of 10
+    """
+    _pools = {}
+
+    @classmethod
+    def register_pool(cls, key, pool):
+        """
+        Register a pre-built pool for `key`, i.e. one created with custom `aiomysql.create_pool` arguments.
+        :type key: str or None
+        :type pool: aiomysql.Pool
+        """
+        cls._pools[key] = pool
+
+    @classmethod
+    def resolve(cls, key):
+        """
+        :type key: str or None
+        :rtype: str or None
+        """
+        return key if key in cls._pools else EngineRegistry.resolve(key)
+
+    @classmethod
+    async def get(cls, key=None):
+        """
+        Get the pool for `key`, creating it on first use.
+        :type key: str or None
+        :rtype: aiomysql.Pool
+        """
+        key = cls.resolve(key)
+        pool = cls._pools.get(key)
+        if pool is None:
+            pool = await cls._create_pool(EngineRegistry.config(key))
+            if key in cls._pools:  # Created concurrently by another task.
+                pool.close()
+                await pool.wait_closed()
+            else:
+                cls._pools[key] = pool
+        return cls._pools[key]
+
+    @classmethod
+    async def _create_pool(cls, config):
+        """
+        Connections report matched rather than changed rows, as with SQLAlchemy's MySQL dialects; refer to
+        `NoEchoSaveProcedure`.
+        :type config: db_able.client.PoolConfig
+        :rtype: aiomysql.Pool
+        """
+        import aiomysql  # Optional dependency.
+
+        conn_str = config.conn_str or client.CONN_STR
+        assert conn_str is not None, 'Initialize db_able by setting `db_able.client.CONN_STR`.'
+        url = make_url(conn_str)
+        return await aiomysql.create_pool(
+            host=url.host or 'localhost',
+            port=url.port or 3306,
+            user=url.username,
+            password=url.password or '',
+            db=url.database,
+            maxsize=config.pool_size + config.max_overflow,
+            pool_recycle=config.pool_recycle,
+            autocommit=False,
+            client_flag=CLIENT.FOUND_ROWS,
+            **dict(url.query)
+            )
+
+    @classmethod
+    async def acquire(cls, key=None):
+        """
+        Check out a connection from the pool for `key`, honoring its `pool_timeout` and `pool_pre_ping` settings.
+        :type key: str or None
+        :rtype: aiomysql.Connection
+        """
+        config = EngineRegistry.config(cls.resolve(key))
+        pool = await cls.get(key)
+        conn = await asyncio.wait_for(pool.acquire(), config.pool_timeout)
+        if config.pool_pre_ping:
+            await conn.ping(reconnect=True)
+        return conn
+
+    @classmethod
+    async def release(cls, key, conn):
+        """
+        :type key: str or None
+        :type conn: aiomysql.Connection
+        """
+        pool = await cls.get(key)
+        await pool.release(conn)
+
+    @classmethod
+    def has_conn_str(cls, key):
+        """
+        :type key: str or None
+        :rtype: bool
+        """
+        return cls.resolve(key) in cls._pools or EngineRegistry.has_conn_str(key)
+
+    @classmethod
+    async def close(cls):
+        """
+        Close all pools. Registrations are kept and pools are rebuilt on next use.
+        """
+        pools = list(cls._pools.values())
+        cls._pools.clear()
+        for pool in pools:
+            pool.close()
+            await pool.wait_closed()
+
+
+class AsyncDBClient(BaseDBClient):
+    """
+    aiomysql client implementation with async context utility, and the same `data`/`next_set` semantics as
+    `DBClient`. Every result set is read while entering the context, so `populate_data` and `next_set` are synchronous.
+    Caveat: Async clients do not join a `Transaction` context; each call commits on its own.
+
+    Example:
+        >>> async with AsyncDBClient('testing', 'A_load', ('id', 1)) as conn:
+        >>>     print(conn.data)
+    """
+
+    def __init__(self, database, stored_procedure, *args, **kwargs):
+        """
+        :type database: str
+        :type stored_procedure: str
+        :param args: *list of tuple; Stored procedure's keyword argument values.
+        :param kwargs: Additional keyword arguments to adjust DB execution logic.
+        :keyword rollback: bool; Rolls back changes on exception.
+        :keyword engine_key: str; `EngineRegistry` key to use instead of `database`.
+        :keyword row_type: namedtuple class; Refer to `DBClient.__init__`.
+        """
+        super(AsyncDBClient, self).__init__(database, stored_procedure, *args, **kwargs)
+        self.conn = None
+        self.result_sets = []
+        assert AsyncEngineRegistry.has_conn_str(self.engine_key), \
+            'Initialize db_able by setting `db_able.client.CONN_STR`.'
+
+    async def execute(self):
+        """
+        Execute the CALL on `self.conn` and buffer every result set.
+        """
+        async with self.conn.cursor() as cursor:
+            with self.timed(Phase.CALL):
+                await cursor.execute(self.call_sql, [value for _, value in self.args])
+            while True:
+                if cursor.description is not None:
+                    with self.timed(Phase.FETCH):
+                        rows = await cursor.fetchall()
+                    self.result_sets.append((cursor.description, rows))
+                if not await cursor.nextset():
+                    break
+
+    def populate_data(self):
+        """
+        Use the next buffered result set to populate `self.data` and `self.data_types`.
+        """
+        description, rows = self.result_sets.pop(0) if self.result_sets else (None, [])
+        self.decode(description, rows)
+
+    def next_set(self):
+        """
+        Move to next result set and populate `self.data` with data from next result set.
+        :rtype: bool
+        """
+        self.row_type = None
+        next_set_bool = bool(self.result_sets)
+        self.populate_data()
+        return next_set_bool
+
+    def iter_data(self):
+        """
+        Yield the rows of the current result set as dicts.
+        :rtype: Generator
+        """
+        yield from self.data
+
+    async def __aenter__(self):
+        """
+        Execute the constructed `self.call_sql` command in DB based on `__init__` params.
+        :rtype: AsyncDBClient
+        """
+        with self.timed(Phase.CHECKOUT):
+            self.conn = await AsyncEngineRegistry.acquire(self.engine_key)
+        try:
+            await self.execute()
+            self.populate_data()
+        except BaseException:
+            await self.conn.rollback()
+            await AsyncEngineRegistry.release(self.engine_key, self.conn)
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        :type exc_type: Exception or None
+        :type exc_val:
+        :type exc_tb:
+        """
+        try:
+            if exc_type is None or not self.kwargs.get('rollback', False):
+                await self.conn.commit()
+            else:
+                await self.conn.rollback()
+        finally:
+            await AsyncEngineRegistry.release(self.engine_key, self.conn)
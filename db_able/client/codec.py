@@ -0,0 +1,197 @@
+"""
+Pluggable JSON codecs and precomputed row decoding plans for DBClient result sets.
+:date_created: 2026-10-16
+"""
+from datetime import date
+
+from pymysql.constants import FIELD_TYPE
+
+from db_able.utils.cache import LRUCache
+
+
+class JSONCodec(object):
+    """
+    Standard library JSON encoder/decoder. Subclasses wrap faster optional implementations.
+    """
+    name = 'json'
+
+    def __init__(self):
+        self.module = __import__(self.name)
+
+    def dumps(self, value):
+        """
+        :type value: dict or list
+        :rtype: str
+        """
+        return self.module.dumps(value, default=self.default)
+
+    @staticmethod
+    def default(value):
+        """
+        Serialize values the JSON module does not support natively.
+        :param value: date or datetime; rendered in a MySQL-compatible ISO format.
+        :rtype: str
+        """
+        if isinstance(value, date):
+            return value.isoformat(sep=' ') if hasattr(value, 'hour') else value.isoformat()
+        raise TypeError('Object of type %s is not JSON serializable' % type(value).__name__)
+
+    def loads(self, value):
+        """
+        :type value: str or bytes
+        :rtype: dict or list
+        """
+        return self.module.loads(value)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    `orjson` encoder/decoder. Requires `pip install orjson`.
+    Caveat: Output is compact, i.e. '{"x":1}', and datetimes are serialized natively.
+    """
+    name = 'orjson'
+
+    def dumps(self, value):
+        """
+        :type value: dict or list
+        :rtype: str
+        """
+        return self.module.dumps(value).decode()
+
+
+class UjsonCodec(JSONCodec):
+    """
+    `ujson` encoder/decoder. Requires `pip install ujson`.
+    """
+    name = 'ujson'
+
+
+codecs = {codec.name: codec for codec in [JSONCodec, OrjsonCodec, UjsonCodec]}
+
+
+def get_codec(name='json'):
+    """
+    :param name: str; One of `codecs`, or "auto" for the fastest installed codec.
+    :rtype: JSONCodec
+    """
+    if name == 'auto':
+        for codec in [OrjsonCodec, UjsonCodec]:
+            try:
+                return codec()
+            except ImportError:
+                continue
+        return JSONCodec()
+    assert name in codecs, 'Invalid JSON codec="%s". Expected one of %s or "auto".' % (name, list(codecs))
+    return codecs[name]()
+
+
+class DecodedRows(list):
+    """
+    Rows already decoded by a `RowDecoder`; assigning them to `DBClient.data` skips re-decoding.
+    """
+
+
+class RowDecoder(object):
+    """
+    Decoding plan for one result set description: column names and JSON column positions are resolved once,
+    then applied to every row in a tight loop.
+    """
+    plans = LRUCache(maxsize=256)
+
+    def __init__(self, description, codec):
+        """
+        :param description: `cursor.description` of the result set.
+        :type description: tuple of tuple
+        :type codec: JSONCodec
+        """
+        self.names = tuple(descriptor[0] for descriptor in description)
+        self.data_types = {descriptor[0]: descriptor[1] for descriptor in description}
+        self.json_keys = tuple(descriptor[0] for descriptor in description if descriptor[1] == FIELD_TYPE.JSON)
+        self.loads = codec.loads
+        self.tuple_decoders = {}
+
+    @classmethod
+    def from_description(cls, description, codec):
+        """
+        Get the plan for `description`, reusing the one built for an identical description.
+        :type description: tuple of tuple
+        :type codec: JSONCodec
+        :rtype: RowDecoder
+        """
+        key = (tuple(description), codec)
+        plan = cls.plans.get(key)
+        if plan is None:
+            plan = cls(description, codec)
+            cls.plans.set(key, plan)
+        return plan
+
+    def decode(self, row):
+        """
+        :type row: tuple
+        :rtype: dict
+        """
+        datum = dict(zip(self.names, row))
+        for key in self.json_keys:
+            value = datum[key]
+            if value is not None:
+                datum[key] = self.loads(value)
+        return datum
+
+    def decode_all(self, rows):
+        """
+        :type rows: list of tuple
+        :rtype: DecodedRows
+        """
+        names = self.names
+        if not self.json_keys:
+            return DecodedRows(dict(zip(names, row)) for row in rows)
+        json_keys = self.json_keys
+        loads = self.loads
+        data = DecodedRows()
+        for row in rows:
+            datum = dict(zip(names, row))
+            for key in json_keys:
+                value = datum[key]
+                if value is not None:
+                    datum[key] = loads(value)
+            data.append(datum)
+        return data
+
+    def tuple_decoder(self, row_type):
+        """
+        Get the decoder of raw rows into `row_type` instances, skipping the dict per row.
+        :param row_type: namedtuple class whose fields are the result set's columns, in any order.
+        :return: Callable decoding one raw row.
+        :rtype: callable
+        :raises AssertionError: The columns do not match the fields of `row_type`.
+        """
+        if row_type in self.tuple_decoders:
+            return self.tuple_decoders[row_type]
+        fields = row_type._fields
+        assert sorted(self.names) == sorted(fields), \
+            'Columns %s do not match the fields %s of %s.' % (list(self.names), list(fields), row_type.__name__)
+        order = tuple(self.names.index(field) for field in fields)
+        json_positions = tuple(i for i, field in enumerate(fields) if field in self.json_keys)
+        make = row_type._make
+        loads = self.loads
+        if order == tuple(range(len(fields))) and not json_positions:
+            decode = make
+        else:
+            def decode(row):
+                values = [row[i] for i in order]
+                for i in json_positions:
+                    if values[i] is not None:
+                        values[i] = loads(values[i])
+                return make(values)
+        self.tuple_decoders[row_type] = decode
+        return decode
+
+    def decode_all_as(self, rows, row_type):
+        """
+        :type rows: list of tuple
+        :param row_type: Refer to `self.tuple_decoder`.
+        :return: Rows decoded into `row_type` instances.
+        :rtype: DecodedRows
+        :raises AssertionError: Refer to `self.tuple_decoder`.
+        """
+        return DecodedRows(map(self.tuple_decoder(row_type), rows))
@@ -0,0 +1,164 @@
+"""
+Process-wide registry of SQLAlchemy engines and their connection pool settings.
+:date_created: 2026-10-17
+"""
+import threading
+
+from do_py import DataObject, R
+from sqlalchemy import create_engine
+
+from db_able import client
+
+
+class PoolConfig(DataObject):
+    """
+    Engine and connection pool settings for an `EngineRegistry` entry.
+    Defaults mirror SQLAlchemy's `QueuePool` defaults.
+    :restriction conn_str: Falls back to `db_able.client.CONN_STR` when not set.
+    :restriction pool_recycle: Seconds before a pooled connection is replaced; -1 disables recycling.
+    :restriction pool_pre_ping: Test connections for liveness on checkout.
+    """
+    _restrictions = {
+        'conn_str': R.NULL_STR,
+        'pool_size': R.INT.with_default(5),
+        'max_overflow': R.INT.with_default(10),
+        'pool_timeout': R.INT.with_default(30),
+        'pool_recycle': R.INT.with_default(-1),
+        'pool_pre_ping': R.BOOL.with_default(False),
+        }
+
+
+class EngineRegistry(object):
+    """
+    Process-wide registry of SQLAlchemy engines, keyed by database name or by an explicit `engine_key` binding.
+    Keys without a registration share the default engine, which is built from `db_able.client.CONN_STR` and the settings
+    registered under the `None` key.
+
+    Example:
+        >>> from db_able.client import EngineRegistry
+        >>>
+        >>> EngineRegistry.register(None, pool_size=10, pool_pre_ping=True)  # Default engine
+        >>> EngineRegistry.register('reporting', conn_str='mysql+pymysql://...', pool_size=20, pool_recycle=3600)
+    """
+    _configs = {}
+    _engines = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, key, **kwargs):
+        """
+        Register pool settings for `key`. Any engine already built for `key` is disposed and rebuilt on next use.
+        :param key: Database name or `engine_key`; None configures the default engine.
+        :type key: str or None
+        :param kwargs: Refer to `PoolConfig._restrictions`.
+        """
+        config = PoolConfig(data=kwargs, strict=False)
+        with cls._lock:
+            cls._configs[key] = config
+            engine = cls._engines.pop(key, None)
+        if engine is not None:
+            engine.dispose()
+
+    @classmethod
+    def register_engine(cls, key, engine):
+        """
+        Register a pre-built engine for `key`, i.e. one created with custom `connect_args` or `creator`.
+        :type key: str or None
+        :type engine: sqlalchemy.engine.base.Engine
+        """
+        with cls._lock:
+            cls._configs[key] = PoolConfig(data={'conn_str': str(engine.url)}, strict=False)
+            old_engine = cls._engines.get(key)
+            cls._engines[key] = engine
+        if old_engine is not None and old_engine is not engine:
+            old_engine.dispose()
+
+    @classmethod
+    def resolve(cls, key):
+        """
+        :type key: str or None
+        :return: `key` if it has been registered, else the default key.
+        :rtype: str or None
+        """
+        return key if key in cls._configs else None
+
+    @classmethod
+    def get(cls, key=None):
+        """
+        Get the engine for `key`, creating it on first use.
+        :type key: str or None
+        :rtype: sqlalchemy.engine.base.Engine
+        """
+        key = cls.resolve(key)
+        engine = cls._engines.get(key)
+        if engine is None:
+            with cls._lock:
+                engine = cls._engines.get(key)
+                if engine is None:
+                    engine = cls._engines[key] = cls._create_engine(cls._configs.get(key))
+        return engine
+
+    @classmethod
+    def _create_engine(cls, config):
+        """
+        :type config: PoolConfig or None
+        :rtype: sqlalchemy.engine.base.Engine
+        """
+        config = config or PoolConfig(strict=False)
+        conn_str = config.conn_str or client.CONN_STR
+        assert conn_str is not None, 'Initialize db_able by setting `db_able.client.CONN_STR`.'
+        return create_engine(
+            conn_str,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_recycle=config.pool_recycle,
+            pool_pre_ping=config.pool_pre_ping
+            )
+
+    @classmethod
+    def config(cls, key):
+        """
+        :type key: str or None
+        :return: Pool settings that apply to `key`.
+        :rtype: PoolConfig
+        """
+        return cls._configs.get(cls.resolve(key)) or PoolConfig(strict=False)
+
+    @classmethod
+    def has_conn_str(cls, key):
+        """
+        :type key: str or None
+        :rtype: bool
+        """
+        config = cls._configs.get(cls.resolve(key))
+        return client.CONN_STR is not None or (config is not None and config.conn_str is not None)
+
+    @classmethod
+    def dispose(cls):
+        """
+        Dispose of all engines and their pools, i.e. after forking a worker process. Registrations are kept and
+        engines are rebuilt on next use.
+        """
+        with cls._lock:
+            engines = list(cls._engines.values())
+            cls._engines.clear()
+        for engine in engines:
+            engine.dispose()
+
+
+class Engine(object):
+    """
+    Managed attribute for DBClient to resolve its engine from `EngineRegistry`.
+    Class-level access returns the default engine.
+    """
+
+    def __get__(self, instance, owner):
+        """
+        :type instance: DBClient or None
+        :type owner: type
+        :rtype: sqlalchemy.engine.base.Engine
+        """
+        if instance is None:
+            return EngineRegistry.get()
+        return EngineRegistry.get(instance.engine_key)
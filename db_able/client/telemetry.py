@@ -0,0 +1,257 @@
+"""
+Per stored procedure phase timings and connection pool gauges, recorded into pluggable sinks.
+Nothing is timed or recorded while no sink is registered.
+:date_created: 2026-10-16
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+
+sinks = []
+null_timer = nullcontext()
+
+
+def add_sink(sink):
+    """
+    Start recording into `sink`.
+
+    Example:
+        >>> from db_able.client import telemetry
+        >>>
+        >>> histogram = telemetry.add_sink(telemetry.HistogramSink())
+        >>> A.load(id=1)
+        >>> histogram.summary('testing.A_load', 'call')
+
+    :type sink: Sink
+    :rtype: Sink
+    """
+    sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink):
+    """
+    :type sink: Sink
+    """
+    sinks.remove(sink)
+
+
+def record_timing(name, phase, seconds):
+    """
+    :type name: str
+    :type phase: str
+    :type seconds: float
+    """
+    for sink in sinks:
+        sink.timing(name, phase, seconds)
+
+
+def record_pool(pool_name, pool):
+    """
+    Record the checked-out and overflow connection counts of a pool that reports them, i.e. `QueuePool`.
+    :param pool_name: str; `EngineRegistry` key of the pool, or "default".
+    :type pool: sqlalchemy.pool.Pool
+    """
+    if not sinks or not hasattr(pool, 'checkedout'):
+        return
+    checked_out = pool.checkedout()
+    overflow = max(pool.overflow(), 0)
+    for sink in sinks:
+        sink.gauge(pool_name, 'checked_out', checked_out)
+        sink.gauge(pool_name, 'overflow', overflow)
+
+
+class Timer(object):
+    """
+    Context manager recording the duration of its block with `record_timing`.
+    """
+    __slots__ = ('name', 'phase', 'start')
+
+    def __init__(self, name, phase):
+        """
+        :type name: str
+        :type phase: str
+        """
+        self.name = name
+        self.phase = phase
+        self.start = None
+
+    def __enter__(self):
+        """
+        Start the clock.
+        :rtype: Timer
+        """
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Record the elapsed time, whether or not the block raised.
+        :type exc_type: Exception or None
+        :type exc_val:
+        :type exc_tb:
+        """
+        record_timing(self.name, self.phase, time.perf_counter() - self.start)
+
+
+class Sink(object):
+    """
+    Interface of telemetry sinks. Implementations are checked for the required methods when declared, as
+    `ABCRestrictions.require` does for DataObjects, whose metaclass only supports dict-based classes.
+    :attribute timing: method(name, phase, seconds); `name` is '%s.%s' % (database, stored_procedure) and `phase`
+        refers to `Phase`.
+    :attribute gauge: method(pool_name, metric, value); `pool_name` is the `EngineRegistry` key of the pool, or
+        "default", and `metric` is "checked_out" or "overflow".
+    """
+    required = ('timing', 'gauge')
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Validate the implementation defines every `required` method.
+        """
+        super(Sink, cls).__init_subclass__(**kwargs)
+        for attr in cls.required:
+            assert callable(getattr(cls, attr, None)), '%s is required for %s!' % (attr, cls.__name__)
+
+
+class HistogramSink(Sink):
+    """
+    In-memory histograms of timings per (name, phase), with exponential buckets from 10us, and the latest value of
+    each pool gauge.
+    """
+    bounds = tuple(1e-5 * 2 ** i for i in range(24))  # 10us .. ~84s
+
+    def __init__(self):
+        """
+        Start with no histograms or gauges.
+        """
+        self.histograms = {}  # {(name, phase): [count, total, min, max, bucket counts]}
+        self.gauges = {}  # {(pool_name, metric): value}
+        self._lock = threading.Lock()
+
+    def timing(self, name, phase, seconds):
+        """
+        Refer to `Sink`.
+        """
+        bucket = bisect_left(self.bounds, seconds)
+        with self._lock:
+            histogram = self.histograms.get((name, phase))
+            if histogram is None:
+                histogram = self.histograms[(name, phase)] = [0, 0.0, seconds, seconds, [0] * (len(self.bounds) + 1)]
+            histogram[0] += 1
+            histogram[1] += seconds
+            histogram[2] = min(histogram[2], seconds)
+            histogram[3] = max(histogram[3], seconds)
+            histogram[4][bucket] += 1
+
+    def gauge(self, pool_name, metric, value):
+        """
+        Refer to `Sink`.
+        """
+        with self._lock:
+            self.gauges[(pool_name, metric)] = value
+
+    def summary(self, name, phase):
+        """
+        :type name: str
+        :type phase: str
+        :return: Count, total, min, max, mean and bucket upper bound estimates of p50, p95 and p99, in seconds; None
+            when nothing was recorded.
+        :rtype: dict or None
+        """
+        with self._lock:
+            histogram = self.histograms.get((name, phase))
+            if histogram is None:
+                return None
+            count, total, minimum, maximum = histogram[:4]
+            buckets = list(histogram[4])
+        return {
+            'count': count,
+            'total': total,
+            'min': minimum,
+            'max': maximum,
+            'mean': total / count,
+            'p50': self._percentile(buckets, count, maximum, 0.5),
+            'p95': self._percentile(buckets, count, maximum, 0.95),
+            'p99': self._percentile(buckets, count, maximum, 0.99),
+            }
+
+    def _percentile(self, buckets, count, maximum, q):
+        """
+        :return: Upper bound of the bucket holding the `q` quantile, capped at the maximum recorded.
+        :rtype: float
+        """
+        rank = q * count
+        seen = 0
+        for bound, bucket_count in zip(self.bounds, buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, maximum)
+        return maximum
+
+    def clear(self):
+        """
+        Drop every histogram and gauge recorded so far.
+        """
+        with self._lock:
+            self.histograms.clear()
+            self.gauges.clear()
+
+
+class LoggingSink(Sink):
+    """
+    Log every timing and gauge, i.e. at DEBUG level while investigating a slow call.
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        """
+        :type logger: logging.Logger or None
+        :type level: int
+        """
+        self.logger = logger or logging.getLogger('db_able.telemetry')
+        self.level = level
+
+    def timing(self, name, phase, seconds):
+        """
+        Refer to `Sink`.
+        """
+        self.logger.log(self.level, '%s %s %.3fms', name, phase, seconds * 1000)
+
+    def gauge(self, pool_name, metric, value):
+        """
+        Refer to `Sink`.
+        """
+        self.logger.log(self.level, 'pool %s %s=%s', pool_name, metric, value)
+
+
+class CallbackSink(Sink):
+    """
+    Forward to statsd-style callables, i.e. `statsd.StatsClient().timing` and `.gauge`, with dotted metric names:
+    '{prefix}.{name}.{phase}' timings in milliseconds and '{prefix}.pool.{pool_name}.{metric}' gauges.
+    """
+
+    def __init__(self, timing=None, gauge=None, prefix='db'):
+        """
+        :param timing: callable(metric_name, milliseconds) or None
+        :param gauge: callable(metric_name, value) or None
+        :type prefix: str
+        """
+        self.timing_callback = timing
+        self.gauge_callback = gauge
+        self.prefix = prefix
+
+    def timing(self, name, phase, seconds):
+        """
+        Refer to `Sink`.
+        """
+        if self.timing_callback is not None:
+            self.timing_callback('%s.%s.%s' % (self.prefix, name, phase), seconds * 1000)
+
+    def gauge(self, pool_name, metric, value):
+        """
+        Refer to `Sink`.
+        """
+        if self.gauge_callback is not None:
+            self.gauge_callback('%s.pool.%s.%s' % (self.prefix, pool_name, metric), value)
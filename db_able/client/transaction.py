@@ -0,0 +1,119 @@
+"""
+Unit-of-work context shared by every DBClient executed within its scope.
+:date_created: 2026-10-16
+"""
+import functools
+from contextvars import ContextVar
+
+_current_transaction = ContextVar('db_able_transaction', default=None)
+
+
+class Transaction(object):
+    """
+    Unit-of-work context manager and decorator. Every `DBClient` executed within the context joins it, so all
+    mixin calls share one connection per engine and are committed once, on exit.
+    Nested `Transaction` contexts, including the same instance entered again, join the outermost one; only its exit
+    commits or rolls back.
+    Caveats:
+        * Classes bound to different engines get one connection each; commits are not two-phase.
+        * The context is tracked with `contextvars`, so it does not follow work handed to other threads.
+
+    Example:
+        >>> from db_able import Transaction
+        >>>
+        >>> with Transaction():
+        >>>     a = A.load(id=1)
+        >>>     a.x = 2
+        >>>     a.save()
+        >>>     A.create(x=3, y=4)
+        >>>
+        >>> @Transaction()
+        >>> def handler():
+        >>>     ...
+    """
+
+    def __init__(self, rollback=True):
+        """
+        :param rollback: bool; Rolls back all changes on exception. Refer to `DBClient`'s `rollback` keyword.
+        """
+        self.rollback = rollback
+        self.rollback_only = False
+        self.connections = {}  # {engine: (sqlalchemy.engine.base.Connection, sqlalchemy.engine.base.Transaction)}
+        self._token = None
+        self._depth = 0  # Re-entries of this instance while it is the active unit of work.
+
+    @classmethod
+    def current(cls):
+        """
+        :return: The unit of work active in the current context, if any.
+        :rtype: Transaction or None
+        """
+        return _current_transaction.get()
+
+    def connect(self, engine):
+        """
+        Get the connection for `engine` within this unit of work, beginning a transaction on first use.
+        :type engine: sqlalchemy.engine.base.Engine
+        :rtype: sqlalchemy.engine.base.Connection
+        """
+        if engine not in self.connections:
+            conn = engine.connect()
+            self.connections[engine] = (conn, conn.begin())
+        return self.connections[engine][0]
+
+    def set_rollback_only(self):
+        """
+        Mark the unit of work to be rolled back on exit, i.e. when a `rollback=True` call failed within it.
+        """
+        self.rollback_only = True
+
+    def __enter__(self):
+        """
+        :rtype: Transaction
+        """
+        current = self.current()
+        if current is not None:
+            if current is self:
+                self._depth += 1
+            return current
+        self._token = _current_transaction.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Commit or roll back every connection in the unit of work and return them to their pools.
+        :type exc_type: Exception or None
+        :type exc_val:
+        :type exc_tb:
+        """
+        if self._token is None:  # Joined an outer unit of work.
+            return
+        if self._depth:  # Re-entered; the outermost exit ends the unit of work.
+            self._depth -= 1
+            return
+        _current_transaction.reset(self._token)
+        self._token = None
+        commit = not self.rollback_only and (exc_type is None or not self.rollback)
+        connections, self.connections = self.connections, {}
+        self.rollback_only = False
+        try:
+            for _, transaction in connections.values():
+                if commit:
+                    transaction.commit()
+                else:
+                    transaction.rollback()
+        finally:
+            for conn, _ in connections.values():
+                conn.close()
+
+    def __call__(self, func):
+        """
+        Decorator usage; each call of `func` runs in its own unit of work.
+        :type func: callable
+        :rtype: callable
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.__class__(rollback=self.rollback):
+                return func(*args, **kwargs)
+        return wrapper
@@ -4,7 +4,8 @@
 from do_py.abc import ABCRestrictions
 
 from db_able.base_model.database_abc import Database
-from db_able.client import DBClient
+from db_able.client.transaction import Transaction
+from db_able.mgmt.const import Phase
 
 
 @ABCRestrictions.require('create_params')
@@ -29,6 +30,8 @@ class Creatable(Database):
         Create `DataObject`. Use `cls.create_params` as kwargs reference.
         Expects to call the stored procedure: '%s_create' % cls.__name__, i.e. 'MyDataObject_create'
         Note: Standard Creatable implementation uses Loadable internally in the stored procedure.
+        With `echo_writes = False`, the stored procedure is passed `_echo` false and returns only the generated key,
+        which is merged with the validated kwargs; refer to `Database._from_written`.
 
         Example:
             >>> from db_able import Loadable, Creatable, Params
@@ -53,6 +56,93 @@ class Creatable(Database):
         """
         stored_procedure = '%s_create%s' % (cls.__name__, cls.create_params.version)
         validated_args = cls.kwargs_validator(*cls.create_params, **kwargs)
-        with DBClient(cls.db, stored_procedure, *validated_args, rollback=True) as conn:
-            for row in conn.data:  # Note: this is a weakness. Create should always return one and only one row.
-                return cls(data=row)
+        with cls._db_client(stored_procedure, *cls._create_args(validated_args), rollback=True) as conn:
+            with conn.timed(Phase.HYDRATE):
+                return cls._create_result(conn, validated_args)
+
+    @classmethod
+    def create_many(cls, rows, chunk_size=1000, echo=True):
+        """
+        Create many `DataObject` with one stored procedure call per chunk. Every row is validated against
+        `cls.create_params` before connecting to DB; rows are then sent in chunks of `chunk_size` within a single
+        `Transaction`, so either all rows are created or none are.
+        Expects to call the stored procedure: '%s_create_many' % cls.__name__, i.e. 'MyDataObject_create_many', with
+        a JSON array of the validated rows and the `echo` flag, returning the created rows, or their ids, in order.
+
+        Example:
+            >>> created = A.create_many([{'x': 1, 'y': 2}, {'x': 3, 'y': 4}])
+            >>> ids = A.create_many([{'x': 1, 'y': 2}, {'x': 3, 'y': 4}], echo=False)
+
+        :param rows: list of dict; Refer to cls.create_params
+        :param chunk_size: int; Maximum rows per stored procedure call.
+        :param echo: bool; Return the created objects. Otherwise, only their ids are returned.
+        :return: Created objects, or ids, in the order of `rows`.
+        :rtype: list of cls or list of int
+        """
+        assert isinstance(rows, (list, tuple)), 'Expected rows to be a list; got %s.' % type(rows).__name__
+        assert isinstance(chunk_size, int) and chunk_size > 0, 'Invalid chunk_size="%s".' % (chunk_size,)
+        stored_procedure = '%s_create_many%s' % (cls.__name__, cls.create_params.version)
+        validated_rows = [dict(cls.kwargs_validator(*cls.create_params, **row)) for row in rows]
+        results = []
+        with Transaction():
+            for i in range(0, len(validated_rows), chunk_size):
+                chunk = validated_rows[i:i + chunk_size]
+                with cls._db_client(stored_procedure, ('rows', chunk), ('echo', echo), rollback=True) as conn:
+                    with conn.timed(Phase.HYDRATE):
+                        results.extend(cls._create_many_result(conn, len(chunk), echo))
+        return results
+
+    @classmethod
+    def _create_many_result(cls, conn, expected, echo):
+        """
+        :type conn: db_able.client.BaseDBClient
+        :param expected: int; Number of rows sent in the chunk.
+        :type echo: bool
+        :rtype: list of cls or list of int
+        """
+        cls._invalidate_list_cache()
+        if echo:
+            results = [cls._from_row(row) for row in conn.data]
+        else:
+            results = [row[cls.load_params[0]] for row in conn.data]
+        assert len(results) == expected, \
+            'Expected %s rows created by `%s`.`%s`; got %s.' % (expected, cls.db, conn.stored_procedure, len(results))
+        return results
+
+    @classmethod
+    async def acreate(cls, **kwargs):
+        """
+        Async variant of `cls.create`.
+        :param kwargs: Refer to cls.create_params
+        :rtype: cls or None
+        """
+        stored_procedure = '%s_create%s' % (cls.__name__, cls.create_params.version)
+        validated_args = cls.kwargs_validator(*cls.create_params, **kwargs)
+        async with cls._async_db_client(stored_procedure, *cls._create_args(validated_args), rollback=True) as conn:
+            with conn.timed(Phase.HYDRATE):
+                return cls._create_result(conn, validated_args)
+
+    @classmethod
+    def _create_args(cls, validated_args):
+        """
+        :type validated_args: list of tuple
+        :return: Stored procedure args, with the `echo` flag when `cls.echo_writes` is False.
+        :rtype: list of tuple
+        """
+        if cls.echo_writes:
+            return validated_args
+        return validated_args + [('echo', False)]
+
+    @classmethod
+    def _create_result(cls, conn, validated_args):
+        """
+        :type conn: db_able.client.BaseDBClient
+        :param validated_args: list of tuple; Merged with the generated key when `cls.echo_writes` is False.
+        :rtype: cls or None
+        """
+        for row in conn.data:  # Note: this is a weakness. Create should always return one and only one row.
+            cls._invalidate_list_cache()
+            if not cls.echo_writes:
+                return cls._from_written(dict(validated_args, **row))
+            cls._cache_row(row)
+            return cls._from_row(row)
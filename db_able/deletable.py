@@ -5,7 +5,6 @@
 from do_py.abc import ABCRestrictions
 
 from db_able.base_model.database_abc import Database
-from db_able.client import DBClient
 
 
 @ABCRestrictions.require('delete_params')
@@ -51,8 +50,27 @@ class Deletable(Database):
         """
         stored_procedure = '%s_delete%s' % (self.__class__.__name__, self.delete_params.version)
         validated_args = self.kwargs_validator(*self.delete_params, **self)
-        with DBClient(self.db, stored_procedure, *validated_args) as conn:
-            assert conn.data, 'Expected a truthy response for `%s`.`%s`' % (self.db, stored_procedure)
-            assert conn.data[0]['deleted'], 'No data deleted.'
-            self(None, strict=False)  # Deletes data from memory on success
-            return True
+        with self._db_client(stored_procedure, *validated_args) as conn:
+            return self._delete_result(conn)
+
+    async def adelete(self):
+        """
+        Async variant of `self.delete`.
+        :rtype: bool
+        """
+        stored_procedure = '%s_delete%s' % (self.__class__.__name__, self.delete_params.version)
+        validated_args = self.kwargs_validator(*self.delete_params, **self)
+        async with self._async_db_client(stored_procedure, *validated_args) as conn:
+            return self._delete_result(conn)
+
+    def _delete_result(self, conn):
+        """
+        :type conn: db_able.client.BaseDBClient
+        :rtype: bool
+        """
+        assert conn.data, 'Expected a truthy response for `%s`.`%s`' % (self.db, conn.stored_procedure)
+        assert conn.data[0]['deleted'], 'No data deleted.'
+        self._uncache_row(self)
+        self._invalidate_list_cache()
+        self(None, strict=False)  # Deletes data from memory on success
+        return True
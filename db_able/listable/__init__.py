@@ -0,0 +1,9 @@
+"""
+Mixins to provide a paginated result set.
+:date_created: 2021-11-25
+"""
+from db_able.listable.pagination import ABCPagination, InfiniteScroll, LazyPaginatedData, LazyRows, PaginatedData, \
+    Pagination, RawPaginatedData
+from db_able.listable.base import _Listable
+from db_able.listable.paginated import Paginated
+from db_able.listable.scrollable import Scrollable
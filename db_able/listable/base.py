@@ -0,0 +1,247 @@
+"""
+Abstraction of the `Paginated` and `Scrollable` mixins.
+:date_created: 2021-11-25
+"""
+from collections import namedtuple
+from typing import AsyncGenerator, Generator
+
+from do_py.abc import ABCRestrictions
+
+from db_able.base_model.database_abc import Database
+from db_able.base_model.params import Params
+from db_able.listable import paging, streaming
+from db_able.listable.pagination import ABCPagination, PaginatedData
+from db_able.mgmt.const import PaginationType
+from db_able.utils.prefetch import prefetch as prefetch_pages
+
+
+@ABCRestrictions.require(
+    'list_params', 'pagination_type', 'pagination_data_cls_ref', '_list_result', '_stream_page'
+    )
+class _Listable(Database):
+    """
+    This is an abstraction for `Paginated` and `Scrollable` mixins, designed to access DB with a
+    standard classmethod action, `list`.
+    Supplants bulk "R" of CRUD.
+    There are two pagination designs:
+        1. Pagination, with Offset/limit paging implemented
+        2. Infinite Scroll, with "next page" design using an "after" cursor and "has_more" boolean.
+    :attribute _list_result: classmethod(conn, limit, raw=False) reading the result sets of the list stored
+        procedure into `PaginatedData`; `limit` is the first item returned by `_validate_list_args`.
+    :attribute _stream_page: classmethod(raw=False, **kwargs); Streaming counterpart of `list`, a generator
+        yielding a single page's rows as they are read and returning the page's pagination DataObject.
+    :attribute stream_params: Optional; params for the `stream` stored procedure. Defaults to `list_params` without
+        the paging params ("limit" and the pagination cursor key).
+    :attribute paginated_data_cls_ref: `PaginatedData` implementation returned by `list`, i.e. `LazyPaginatedData`.
+    Set `list_cache` to an `LRUCache` to serve repeated `list` calls with identical arguments from memory. Every
+    page of the class is invalidated when its `create`, `create_many`, `save` or `delete` runs in-process; use a
+    `ttl` to bound staleness from other writers. Each call returns its own copy of the cached page.
+
+    Example:
+        >>> from db_able.utils.cache import LRUCache
+        >>>
+        >>> class A(Paginated):
+        >>>     ...
+        >>>     list_cache = LRUCache(maxsize=1000, ttl=30)
+    """
+    _is_abstract_ = True
+    stream_params = None
+    paginated_data_cls_ref = PaginatedData
+
+    @classmethod
+    def __compile__(cls):
+        """
+        Extend compilation checks to validate defined params, and that a single pagination design is mixed in.
+        """
+        super(_Listable, cls).__compile__()
+        assert len({getattr(base, 'pagination_type', None) for base in cls.mro()} - {None}) == 1, \
+            '"Scrollable" and "Paginated" mixins are mutually exclusive.'
+        cls._validate_params('list_params')
+        assert cls.pagination_type in PaginationType.allowed, 'Invalid pagination_type="%s".' % (cls.pagination_type,)
+        assert ABCPagination in cls.pagination_data_cls_ref.mro(), \
+            'Invalid pagination_data_cls_ref="%s".' % (cls.pagination_data_cls_ref,)
+        assert PaginatedData in cls.paginated_data_cls_ref.mro(), \
+            'Invalid paginated_data_cls_ref="%s".' % (cls.paginated_data_cls_ref,)
+        if cls.stream_params is None:
+            paging_params = ['limit', cls.pagination_data_cls_ref.cursor_key]
+            cls.stream_params = Params(
+                *[param for param in cls.list_params if param not in paging_params],
+                version=getattr(cls.list_params, '_version', None)
+                )
+        cls._validate_params('stream_params')
+
+    @classmethod
+    def row_type(cls):
+        """
+        Lightweight row class of `list(raw=True)` and `yield_all(raw=True)`, generated once per class.
+        :return: namedtuple class named '%sRow' % cls.__name__, with the `cls._restrictions` keys as fields.
+        :rtype: type[tuple]
+        """
+        row_type = cls.__dict__.get('_row_type')
+        if row_type is None:
+            row_type = namedtuple('%sRow' % cls.__name__, list(cls._restrictions))
+            setattr(cls, '_row_type', row_type)
+        return row_type
+
+    @classmethod
+    def _list_client(cls, stored_procedure, validated_args, raw=False, **kwargs):
+        """
+        :type stored_procedure: str
+        :type validated_args: list of tuple
+        :param raw: bool; Decode the rows into `cls.row_type()` instances.
+        :param kwargs: Refer to `DBClient.__init__`.
+        :rtype: db_able.client.DBClient
+        """
+        if raw:
+            kwargs['row_type'] = cls.row_type()
+        return cls._db_client(stored_procedure, *validated_args, **kwargs)
+
+    @classmethod
+    def yield_all(cls, stream=False, prefetch=0, workers=0, ordered=True, raw=False, **kwargs) -> Generator:
+        """
+        Wrap `cls.list` to auto-paginate and provide a generator of all results.
+
+        Example:
+            >>> for a in A.yield_all(limit=1000, prefetch=2):  # Fetch up to 2 pages ahead while consuming
+            >>>     process(a)
+            >>> for c in C.yield_all(limit=1000, workers=4, ordered=False):  # Paginated only
+            >>>     process(c)
+
+        :param stream: Read each page through an unbuffered cursor, hydrating rows one at a time. The page's
+            connection stays checked out while its rows are consumed.
+        :param prefetch: int; Number of pages to fetch ahead on a worker thread while the current page is consumed.
+            0 fetches each page only after the previous one is consumed. Refer to `db_able.utils.prefetch.prefetch`.
+        :param workers: int; `Paginated` only. After the first page, fetch the remaining pages its pagination data
+            implies concurrently on this many threads. 0 fetches pages one by one.
+        :param ordered: bool; With `workers`, yield pages in page order. Otherwise, pages are yielded as completed.
+        :param raw: bool; Yield `cls.row_type()` namedtuples rather than DataObjects. Refer to `cls.list`.
+        :param kwargs: refer to `cls.list_params`
+        :rtype: Generator
+        """
+        assert isinstance(prefetch, int) and prefetch >= 0, 'Invalid prefetch="%s".' % (prefetch,)
+        assert isinstance(workers, int) and workers >= 0, 'Invalid workers="%s".' % (workers,)
+        assert [bool(stream), bool(prefetch), bool(workers)].count(True) <= 1, \
+            '"stream", "prefetch" and "workers" are mutually exclusive.'
+        assert not workers or cls.pagination_type == PaginationType.PAGINATION, \
+            '"workers" requires the page count known to "Paginated"; %s is "%s".' % (cls.__name__, cls.pagination_type)
+        if stream:
+            yield from streaming.stream_pages(cls, raw=raw, **kwargs)
+        else:
+            if workers:
+                pages = paging.fan_out(cls, workers, ordered, raw=raw, **kwargs)
+            else:
+                pages = cls._yield_pages(raw=raw, **kwargs)
+            if prefetch:
+                pages = prefetch_pages(pages, depth=prefetch)
+            for paginated_data in pages:
+                yield from paginated_data.data
+
+    @classmethod
+    def _yield_pages(cls, raw=False, **kwargs) -> Generator:
+        """
+        Wrap `cls.list` to auto-paginate and provide a generator of every page.
+        :param raw: bool; Refer to `cls.list`.
+        :param kwargs: refer to `cls.list_params`
+        :rtype: Generator
+        """
+        cursor_key = cls.pagination_data_cls_ref.cursor_key
+        after = kwargs.pop(cursor_key, cls.pagination_data_cls_ref._restrictions[cursor_key].default)
+        has_more = True
+        while has_more:
+            kwargs[cursor_key] = after
+            paginated_data = cls.list(raw=raw, **kwargs)
+            yield paginated_data
+            has_more = paginated_data.pagination.has_more
+            after = paginated_data.pagination.after
+
+    @classmethod
+    def to_columns(cls, dataframe=False, prefetch=0, **kwargs):
+        """
+        Page through `cls.list(raw=True)` and append each page column by column into typed NumPy buffers derived
+        from `cls._restrictions`, without creating DataObjects. Requires `pip install db-able[columns]`.
+        Refer to `db_able.utils.columns.column_dtype` for the dtype of each column.
+
+        Example:
+            >>> columns = C.to_columns(limit=10000)
+            >>> columns['x'].mean()
+
+        :param dataframe: bool; Return a `pandas.DataFrame` instead. Requires `pip install pandas`.
+        :param prefetch: int; Refer to `cls.yield_all`.
+        :param kwargs: refer to `cls.list_params`
+        :return: {field: numpy.ndarray}, in `cls._restrictions` order.
+        :rtype: dict or pandas.DataFrame
+        """
+        from db_able.utils.columns import ColumnBuffers  # Optional dependency.
+        buffers = ColumnBuffers(cls)
+        pages = cls._yield_pages(raw=True, **kwargs)
+        if prefetch:
+            pages = prefetch_pages(pages, depth=prefetch)
+        for paginated_data in pages:
+            buffers.extend(paginated_data.data)
+        return buffers.to_frame() if dataframe else buffers.to_dict()
+
+    @classmethod
+    async def alist(cls, **kwargs) -> PaginatedData:
+        """
+        Async variant of `cls.list`.
+        :param kwargs: refer to `cls.list_params`
+        :rtype: PaginatedData
+        """
+        stored_procedure = '%s_list%s' % (cls.__name__, cls.list_params.version)
+        limit, validated_args = cls._validate_list_args(**kwargs)
+        cached = paging.cached_page(cls, validated_args)
+        if cached is not None:
+            return cached
+        async with cls._async_db_client(stored_procedure, *validated_args) as conn:
+            return paging.cache_page(cls, validated_args, cls._list_result(conn, limit))
+
+    @classmethod
+    async def ayield_all(cls, **kwargs) -> AsyncGenerator:
+        """
+        Async variant of `cls.yield_all`: wrap `cls.alist` to auto-paginate and provide an async generator of all
+        results.
+
+        Example:
+            >>> async for a in A.ayield_all(limit=10):
+            >>>     print(a.id)
+
+        :param kwargs: refer to `cls.list_params`
+        :rtype: AsyncGenerator
+        """
+        cursor_key = cls.pagination_data_cls_ref.cursor_key
+        after = kwargs.pop(cursor_key, cls.pagination_data_cls_ref._restrictions[cursor_key].default)
+        has_more = True
+        while has_more:
+            kwargs[cursor_key] = after
+            paginated_data = await cls.alist(**kwargs)
+            for datum in paginated_data.data:
+                yield datum
+            has_more = paginated_data.pagination.has_more
+            after = paginated_data.pagination.after
+
+    @classmethod
+    def _validate_list_args(cls, **kwargs):
+        """
+        Validate `kwargs` against `cls.list_params`.
+        :param kwargs: refer to `cls.list_params`
+        :return: What the implementation needs to read the result, i.e. the requested limit, and the validated args
+            to pass to the stored procedure.
+        :rtype: tuple[object, list of tuple]
+        """
+        return None, cls.kwargs_validator(*cls.list_params, **kwargs)
+
+    @classmethod
+    def stream(cls, **kwargs) -> Generator:
+        """
+        Yield every `DataObject` from a single call of the stored procedure '%s_stream' % cls.__name__, read through
+        an unbuffered cursor so memory use is constant regardless of result size. Use `cls.stream_params` as kwargs
+        reference. The connection stays checked out until the generator is exhausted or closed.
+
+        Example:
+            >>> for a in A.stream():
+            >>>     print(a.id)
+
+        :param kwargs: refer to `cls.stream_params`
+        :rtype: Generator
+        """
+        return streaming.stream(cls, **kwargs)
@@ -0,0 +1,163 @@
+"""
+Mixin to provide an offset/limit paginated result set.
+:date_created: 2021-11-25
+"""
+from typing import Generator
+
+from db_able.client.transaction import Transaction
+from db_able.listable import paging, streaming
+from db_able.listable.base import _Listable
+from db_able.listable.pagination import PaginatedData, Pagination, RawPaginatedData
+from db_able.mgmt.const import PaginationType, Phase, TotalMode
+from db_able.utils.cache import LRUCache
+
+
+class Paginated(_Listable):
+    """
+    Mixin to support standard pagination design, with offset/limit paging implementation.
+    :attribute total_mode: `TotalMode` of the `list` stored procedure. Every mode but EXACT requires "limit" in
+        `list_params`.
+    :attribute total_cache: `LRUCache` of totals keyed by the filter args, for `TotalMode.CACHED`. Defaults to a
+        10 second TTL.
+    """
+    _is_abstract_ = True
+    pagination_type = PaginationType.PAGINATION
+    pagination_data_cls_ref = Pagination
+    total_mode = TotalMode.EXACT
+    total_cache = None
+
+    @classmethod
+    def __compile__(cls):
+        """
+        Extend compile-time checks to validate `total_mode`, and that "limit" is in `list_params` when an additional
+        row is read.
+        """
+        super(Paginated, cls).__compile__()
+        assert cls.total_mode in TotalMode.allowed, 'Invalid total_mode="%s".' % (cls.total_mode,)
+        if cls.total_mode != TotalMode.EXACT:
+            assert 'limit' in cls.list_params, \
+                '"limit" param required for %s.list_params with total_mode="%s".' % (cls.__name__, cls.total_mode)
+        if cls.total_mode == TotalMode.CACHED and cls.total_cache is None:
+            cls.total_cache = LRUCache(maxsize=1024, ttl=10)
+
+    @classmethod
+    def list(cls, raw=False, **kwargs) -> PaginatedData:
+        """
+        List multiple `DataObject` in `PaginatedData` structure. Use `cls.list_params` as kwargs reference.
+        Expects to call the stored procedure: '%s_list' % cls.__name__, i.e. 'MyDataObject_list'
+
+        Example:
+            >>> from db_able import Paginated, Params
+            >>> from do_py import R
+            >>>
+            >>> class A(Paginated):
+            >>>     db = 'schema_name'
+            >>>     _restrictions = {
+            >>>         'id': R.INT,
+            >>>         'x': R.INT.with_default(0),
+            >>>         'y': R.INT.with_default(1)
+            >>>         }
+            >>>     _extra_restrictions = {
+            >>>         'limit': R.INT.with_default(10),
+            >>>         'page': R.INT.with_default(1)
+            >>>         }
+            >>>     list_params = Params('limit', 'page')  # version=2 allows versioning of the SP, i.e. `A_list_v2`
+            >>>
+            >>> a = A.list(limit=10)
+            >>> list(A.yield_all(limit=10))
+        :param raw: bool; Return the rows as `cls.row_type()` namedtuples in a `RawPaginatedData`, skipping the
+            dict per row and DataObject hydration. Raw pages bypass `list_cache`.
+        :param kwargs: refer to `cls.list_params`
+        :rtype: PaginatedData
+        """
+        stored_procedure = '%s_list%s' % (cls.__name__, cls.list_params.version)
+        limit, validated_args = cls._validate_list_args(**kwargs)
+        if raw:
+            with cls._list_client(stored_procedure, validated_args, raw=True) as conn:
+                return cls._list_result(conn, limit, raw=True)
+        cached = paging.cached_page(cls, validated_args)
+        if cached is not None:
+            return cached
+        with cls._db_client(stored_procedure, *validated_args) as conn:
+            return paging.cache_page(cls, validated_args, cls._list_result(conn, limit))
+
+    @classmethod
+    def _validate_list_args(cls, **kwargs):
+        """
+        Validate `kwargs` against `cls.list_params`. Unless `cls.total_mode` is EXACT, the limit is returned to read
+        the additional row; with CACHED, the cached total is looked up and `with_total` requests one on a miss.
+        :param kwargs: refer to `cls.list_params`
+        :return: None for EXACT, otherwise the page state as {'limit': int, 'total_key': tuple or None,
+            'total': int or None}, and the validated args to pass to the stored procedure.
+        :rtype: tuple[dict or None, list of tuple]
+        """
+        validated_args = cls.kwargs_validator(*cls.list_params, **kwargs)
+        if cls.total_mode == TotalMode.EXACT:
+            return None, validated_args
+        state = {
+            'limit': dict(validated_args)['limit'],
+            'total_key': None,
+            'total': None
+            }
+        if cls.total_mode == TotalMode.CACHED:
+            paging_params = ['limit', cls.pagination_data_cls_ref.cursor_key]
+            state['total_key'] = (cls, tuple(arg for arg in validated_args if arg[0] not in paging_params))
+            state['total'] = cls.total_cache.get(state['total_key'])
+            validated_args = validated_args + [('with_total', state['total'] is None)]
+        return state, validated_args
+
+    @classmethod
+    def _pagination(cls, row, state, count) -> Pagination:
+        """
+        :param row: The pagination data row of the list stored procedure.
+        :type row: dict
+        :param state: Refer to `cls._validate_list_args`.
+        :type state: dict or None
+        :param count: int; Number of rows read for the page.
+        :rtype: Pagination
+        """
+        pagination = dict(row)
+        if state is not None and state['total_key'] is not None:
+            if pagination['total'] is None:
+                pagination['total'] = state['total']
+            elif Transaction.current() is None:
+                cls.total_cache.set(state['total_key'], pagination['total'])
+        pagination = cls.pagination_data_cls_ref(data=pagination)
+        if state is not None:
+            pagination.more = count > state['limit']
+        return pagination
+
+    @classmethod
+    def _list_result(cls, conn, state, raw=False) -> PaginatedData:
+        """
+        Read the page's rows from the first result set and its pagination data from the second.
+        :type conn: db_able.client.BaseDBClient
+        :param state: Refer to `cls._validate_list_args`.
+        :type state: dict or None
+        :param raw: bool; Refer to `cls.list`.
+        :rtype: PaginatedData
+        """
+        stored_procedure = conn.stored_procedure
+        rows = conn.data
+        paginated_data_cls_ref = RawPaginatedData if raw else cls.paginated_data_cls_ref
+        with conn.timed(Phase.HYDRATE):
+            data = paginated_data_cls_ref.hydrate(cls, rows if state is None else rows[:state['limit']])
+        assert conn.next_set(), 'Expected 2 result sets from %s.%s' % (cls.db, stored_procedure)
+        assert conn.data, 'No pagination data found in second result set from %s.%s' % (cls.db, stored_procedure)
+        assert len(conn.data) == 1, \
+            'Expected one row from pagination data result set from %s.%s' % (cls.db, stored_procedure)
+        return paginated_data_cls_ref({
+            'data': data,
+            'pagination': cls._pagination(conn.data[0], state, len(rows))
+            })
+
+    @classmethod
+    def _stream_page(cls, raw=False, **kwargs) -> Generator:
+        """
+        Refer to `streaming.stream_paginated_page`.
+        :param raw: bool; Refer to `cls.list`.
+        :param kwargs: refer to `cls.list_params`
+        :return: The page's pagination DataObject.
+        :rtype: Generator
+        """
+        return streaming.stream_paginated_page(cls, raw=raw, **kwargs)
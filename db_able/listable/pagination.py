@@ -0,0 +1,228 @@
+"""
+Pagination data structures of `_Listable` implementations.
+:date_created: 2021-11-25
+"""
+import copy
+
+from do_py import DataObject, R
+from do_py.abc import ABCRestrictions
+from do_py.data_object.validator import Validator
+
+
+@ABCRestrictions.require('cursor_key')
+class ABCPagination(DataObject):
+    """
+    Interface for nested pagination structures for use with PaginatedData.
+    """
+    _is_abstract_ = True
+
+    @classmethod
+    def __compile__(cls):
+        """
+        Extend compile-time checks to validate `cls.cursor_key` value in `cls._restrictions`.
+        """
+        super(ABCPagination, cls).__compile__()
+        assert cls.cursor_key in cls._restrictions, \
+            '{cls_name}.cursor_key="{cursor_key}" must be in {cls_name}._restrictions.'.format(
+                cls_name=cls.__name__,
+                cursor_key=cls.cursor_key
+                )
+        assert 'has_more' in cls._restrictions or hasattr(cls, 'has_more'), \
+            '"has_more" must be defined in {cls_name}\'s restrictions or as an attribute'.format(
+                cls_name=cls.__name__
+                )
+        assert 'after' in cls._restrictions or hasattr(cls, 'after'), \
+            '"after" must be defined in {cls_name}\'s restrictions or as an attribute'.format(
+                cls_name=cls.__name__
+                )
+
+
+class Pagination(ABCPagination):
+    """
+    This design suffers from performance issues on large data sets: in MySQL, OFFSET walks through each row it skips.
+    :restriction total: None when not reported; refer to `TotalMode`.
+    :attribute more: Whether rows follow the page, read from one additional row when the total is not exact.
+        None derives `has_more` from `total`. Not serialized.
+    """
+    _restrictions = {
+        'page': R.INT.with_default(1),
+        'page_size': R.INT.with_default(10),
+        'total': R.NULL_INT,
+        }
+    cursor_key = 'page'
+    more = None
+
+    @property
+    def has_more(self) -> bool:
+        """
+        :rtype: bool
+        """
+        if self.more is not None:
+            return self.more
+        return self.page * self.page_size < self.total
+
+    @property
+    def after(self) -> int:
+        """
+        :rtype: int
+        """
+        return self.page + 1
+
+
+class InfiniteScroll(ABCPagination, Validator):
+    """
+    This design suffers from UX issues: Skipping through pages cannot be supported, only the next page is available.
+    """
+    _restrictions = {
+        'after': R(),  # Note: Does not handle encryption/decryption for external exposure.
+        'has_more': R.BOOL,
+        # 'total': R.INT  # Anti-pattern; InfiniteScroll is intended to be performant with large data sets.
+        }
+    cursor_key = 'after'
+
+    def _validate(self):
+        """
+        Validate that `self.after` is populated if `self.has_more` is True.
+        """
+        if self.has_more:
+            assert self.after is not None, 'Expected "after" to be populated when "has_more" is True.'
+
+
+class PaginatedData(Validator):
+    """
+    Paginated data structure.
+    """
+    _restrictions = {
+        'data': R.LIST,  # _Listable DataObjects.
+        'pagination': R()  # Pagination or InfiniteScroll DO; validated via `_validate`
+        }
+
+    @classmethod
+    def hydrate(cls, cls_ref, rows) -> list:
+        """
+        :type cls_ref: type[_Listable]
+        :param rows: list of dict; Rows of the list stored procedure.
+        :return: The `data` for a page of `rows`.
+        :rtype: list of _Listable
+        """
+        return [cls_ref._from_row(row) for row in rows]
+
+    def _validate(self):
+        """
+        Validate `self.data` elements are `_Listable` implementation instances.
+        Validate `self.pagination` is a `ABCPagination` implementation instance.
+        """
+        from db_able.listable.base import _Listable  # Circular import.
+        assert all(isinstance(datum, _Listable) for datum in self.data), \
+            '`self.data` must be comprised of _Listable descendents.'
+        assert isinstance(self.pagination, ABCPagination), \
+            '`self.pagination` type "%s" must be a descendent of `ABCPagination`.' % type(self.pagination)
+
+
+class LazyRows(list):
+    """
+    List of `_Listable` DataObjects hydrated from their rows on first access. Each row is hydrated at most once:
+    indexing and iterating replace it in place with its DataObject.
+    Caveat: Serializing, comparing or copying with `list` methods directly uses un-hydrated rows as plain dicts.
+    """
+
+    def __init__(self, cls_ref, rows):
+        """
+        :type cls_ref: type[_Listable]
+        :type rows: list of dict
+        """
+        super(LazyRows, self).__init__(rows)
+        self.cls_ref = cls_ref
+
+    def _hydrate(self, index):
+        """
+        :type index: int
+        :rtype: _Listable
+        """
+        datum = list.__getitem__(self, index)
+        if not isinstance(datum, self.cls_ref):
+            datum = self.cls_ref._from_row(datum)
+            list.__setitem__(self, index, datum)
+        return datum
+
+    def __getitem__(self, index):
+        """
+        :type index: int or slice
+        :rtype: _Listable or list of _Listable
+        """
+        if isinstance(index, slice):
+            return [self._hydrate(i) for i in range(*index.indices(len(self)))]
+        return self._hydrate(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._hydrate(i)
+
+    def __reversed__(self):
+        for i in reversed(range(len(self))):
+            yield self._hydrate(i)
+
+    def __contains__(self, item):
+        return any(datum == item for datum in self)
+
+    def copy(self):
+        """
+        Deep copy without hydrating: hydrated DataObjects keep nested values of their rows, so rows are copied too.
+        :rtype: LazyRows
+        """
+        return LazyRows(self.cls_ref, [
+            datum._copy() if isinstance(datum, self.cls_ref) else copy.deepcopy(datum)
+            for datum in list.__iter__(self)
+            ])
+
+
+class LazyPaginatedData(PaginatedData):
+    """
+    Paginated data structure that keeps the page's rows and hydrates DataObjects on first access, for callers that
+    use only some of the page or only its pagination data. Set `paginated_data_cls_ref = LazyPaginatedData` on a
+    `_Listable` implementation to opt in.
+    """
+    _restrictions = {
+        'data': R(LazyRows),
+        'pagination': R()
+        }
+
+    @classmethod
+    def hydrate(cls, cls_ref, rows) -> LazyRows:
+        """
+        :type cls_ref: type[_Listable]
+        :param rows: list of dict; Rows of the list stored procedure.
+        :return: The `data` for a page of `rows`, hydrated on access.
+        :rtype: LazyRows
+        """
+        return LazyRows(cls_ref, rows)
+
+    def _validate(self):
+        """
+        Validate `self.pagination` is a `ABCPagination` implementation instance. Rows are validated on hydration.
+        """
+        assert isinstance(self.pagination, ABCPagination), \
+            '`self.pagination` type "%s" must be a descendent of `ABCPagination`.' % type(self.pagination)
+
+
+class RawPaginatedData(PaginatedData):
+    """
+    Paginated data structure of `list(raw=True)`: the page's rows as the `_Listable` implementation's `row_type`
+    namedtuples, without DataObjects.
+    """
+
+    @classmethod
+    def hydrate(cls, cls_ref, rows) -> list:
+        """
+        :type cls_ref: type[_Listable]
+        :param rows: list of `cls_ref.row_type()`; Rows of the list stored procedure.
+        :rtype: list of tuple
+        """
+        return list(rows)
+
+    def _validate(self):
+        """
+        Validate `self.pagination` is a `ABCPagination` implementation instance. Rows are not validated.
+        """
+        assert isinstance(self.pagination, ABCPagination), \
+            '`self.pagination` type "%s" must be a descendent of `ABCPagination`.' % type(self.pagination)
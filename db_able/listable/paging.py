@@ -0,0 +1,139 @@
+"""
+Helpers of `_Listable` implementations to cache pages in `list_cache` and to fetch pages concurrently.
+:date_created: 2026-10-17
+"""
+import copy
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Generator
+
+from db_able.client.transaction import Transaction
+from db_able.listable.pagination import LazyRows, PaginatedData
+from db_able.mgmt.const import TotalMode
+
+
+def list_cache_key(cls_ref, validated_args):
+    """
+    :type cls_ref: type[db_able.listable.base._Listable]
+    :type validated_args: list of tuple
+    :return: Key into `cls_ref.list_cache`, or None when the class does not cache pages or the args are unhashable.
+    :rtype: tuple or None
+    """
+    if cls_ref.list_cache is None:
+        return None
+    key = (cls_ref, tuple(validated_args))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def copy_page(cls_ref, paginated_data) -> PaginatedData:
+    """
+    :type cls_ref: type[db_able.listable.base._Listable]
+    :type paginated_data: PaginatedData
+    :return: A deep copy of `paginated_data`, so cached pages are never shared with callers.
+    :rtype: PaginatedData
+    """
+    data = paginated_data.data
+    pagination = cls_ref.pagination_data_cls_ref(data=paginated_data.pagination)
+    # Attributes out of `_restrictions`, i.e. `more`.
+    vars(pagination).update(copy.deepcopy(vars(paginated_data.pagination)))
+    return type(paginated_data)({
+        'data': data.copy() if isinstance(data, LazyRows) else [datum._copy() for datum in data],
+        'pagination': pagination
+        })
+
+
+def cached_page(cls_ref, validated_args):
+    """
+    :type cls_ref: type[db_able.listable.base._Listable]
+    :type validated_args: list of tuple
+    :return: A copy of the `cls_ref.list_cache` page for `validated_args`, if any.
+    :rtype: PaginatedData or None
+    """
+    key = list_cache_key(cls_ref, validated_args)
+    if key is not None:
+        paginated_data = cls_ref.list_cache.get(key)
+        if paginated_data is not None:
+            return copy_page(cls_ref, paginated_data)
+    return None
+
+
+def cache_page(cls_ref, validated_args, paginated_data) -> PaginatedData:
+    """
+    Store a copy of `paginated_data` in `cls_ref.list_cache`. Pages read within a `Transaction` may include
+    uncommitted writes and are not cached.
+    :type cls_ref: type[db_able.listable.base._Listable]
+    :type validated_args: list of tuple
+    :type paginated_data: PaginatedData
+    :rtype: PaginatedData
+    """
+    key = list_cache_key(cls_ref, validated_args)
+    if key is not None and Transaction.current() is None:
+        cls_ref.list_cache.set(key, copy_page(cls_ref, paginated_data))
+    return paginated_data
+
+
+def fan_out(cls_ref, workers, ordered, raw=False, **kwargs) -> Generator:
+    """
+    Fetch the first page, then the remaining pages implied by its `total` and `page_size` on a pool of `workers`
+    threads, with at most `2 * workers` pages in flight or buffered. Closing the generator early cancels pages
+    not yet started. Without a total, i.e. FIRST_PAGE starting past page 1, the remaining pages are fetched
+    one by one.
+    Caveats:
+        * Rows created or deleted during the export shift OFFSET pages, as with sequential paging.
+        * Pages are fetched in other threads, outside of any active `Transaction`.
+    :type cls_ref: type[db_able.listable.paginated.Paginated]
+    :type workers: int
+    :param ordered: bool; Yield pages in page order. Otherwise, pages are yielded as completed.
+    :param raw: bool; Refer to `Paginated.list`.
+    :param kwargs: refer to `cls_ref.list_params`
+    :rtype: Generator
+    """
+    assert cls_ref.total_mode in [TotalMode.EXACT, TotalMode.FIRST_PAGE], \
+        '"workers" requires an exact total on the first page; %s.total_mode="%s".' % (
+            cls_ref.__name__, cls_ref.total_mode
+            )
+    cursor_key = cls_ref.pagination_data_cls_ref.cursor_key
+    first_page = cls_ref.list(raw=raw, **kwargs)
+    yield first_page
+    pagination = first_page.pagination
+    if not pagination.has_more:
+        return
+    if pagination.total is None:
+        yield from cls_ref._yield_pages(raw=raw, **dict(kwargs, **{cursor_key: pagination.after}))
+        return
+    last_page = -(-pagination.total // pagination.page_size)
+    pages = iter(range(pagination.page + 1, last_page + 1))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='db_able-fan-out')
+    futures = deque()
+
+    def submit():
+        """
+        :return: The future of the next page, if any.
+        :rtype: concurrent.futures.Future or None
+        """
+        for page in pages:
+            return executor.submit(cls_ref.list, raw=raw, **dict(kwargs, **{cursor_key: page}))
+        return None
+
+    try:
+        futures.extend(future for future in (submit() for _ in range(2 * workers)) if future is not None)
+        while futures:
+            if ordered:
+                done = [futures.popleft()]
+            else:
+                done = wait(futures, return_when=FIRST_COMPLETED).done
+                for future in done:
+                    futures.remove(future)
+            for future in done:
+                yield future.result()
+                future = submit()
+                if future is not None:
+                    futures.append(future)
+    finally:
+        for future in futures:  # `shutdown(cancel_futures=True)` requires Python 3.9.
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,139 @@
+"""
+Mixin to provide an infinite scroll paginated result set.
+:date_created: 2021-11-25
+"""
+from typing import Generator
+
+from do_py.abc import ABCRestrictions
+
+from db_able.listable import paging, streaming
+from db_able.listable.base import _Listable
+from db_able.listable.pagination import InfiniteScroll, PaginatedData, RawPaginatedData
+from db_able.mgmt.const import PaginationType, Phase
+
+
+@ABCRestrictions.require('to_after')
+class Scrollable(_Listable):
+    """
+    Mixin to support Infinite Scroll pagination design.
+    :attribute to_after: method to convert self into the appropriate cursor value for `list` stored procedure.
+    """
+    _is_abstract_ = True
+    pagination_type = PaginationType.INFINITE_SCROLL
+    pagination_data_cls_ref = InfiniteScroll
+
+    @classmethod
+    def __compile__(cls):
+        """
+        Extend compile-time checks to:
+            1. Validate limit restriction is defined.
+            2. Validate limit is defined in `list_params`.
+        """
+        super(Scrollable, cls).__compile__()
+        assert 'limit' in cls._restrictions or 'limit' in cls._extra_restrictions, \
+            '"limit" restriction required for %s.' % cls.__name__
+        assert 'limit' in cls.list_params, '"limit" param required for %s.list_params' % cls.__name__
+
+    @classmethod
+    def list(cls, raw=False, **kwargs) -> PaginatedData:
+        """
+        List multiple `DataObject` in `PaginatedData` structure. Use `cls.list_params` as kwargs reference.
+        Expects to call the stored procedure: '%s_list' % cls.__name__, i.e. 'MyDataObject_list'
+
+        Example:
+            >>> from db_able import Scrollable, Params
+            >>> from do_py import R
+            >>>
+            >>> class A(Scrollable):
+            >>>     db = 'schema_name'
+            >>>     _restrictions = {
+            >>>         'id': R.INT,
+            >>>         'x': R.INT.with_default(0),
+            >>>         'y': R.INT.with_default(1)
+            >>>         }
+            >>>     _extra_restrictions = {
+            >>>         'limit': R.INT.with_default(10),
+            >>>         'after': R.NULL_STR
+            >>>         }
+            >>>     pagination_type = PaginationType.INFINITE_SCROLL
+            >>>     list_params = Params('limit', 'after')  # version=2 allows versioning of the SP, i.e. `A_list_v2`
+            >>>
+            >>> a = A.list(limit=10)
+            >>> list(A.yield_all(limit=10))
+        :param raw: bool; Refer to `Paginated.list`.
+        :param kwargs: refer to `cls.list_params`
+        :rtype: PaginatedData
+        """
+        stored_procedure = '%s_list%s' % (cls.__name__, cls.list_params.version)
+        limit, new_validated_args = cls._validate_list_args(**kwargs)
+        if raw:
+            with cls._list_client(stored_procedure, new_validated_args, raw=True) as conn:
+                return cls._list_result(conn, limit, raw=True)
+        cached = paging.cached_page(cls, new_validated_args)
+        if cached is not None:
+            return cached
+        with cls._db_client(stored_procedure, *new_validated_args) as conn:
+            return paging.cache_page(cls, new_validated_args, cls._list_result(conn, limit))
+
+    @classmethod
+    def _list_result(cls, conn, limit, raw=False) -> PaginatedData:
+        """
+        Read up to `limit` rows; the additional row requested by `cls._validate_list_args` sets `has_more`.
+        :type conn: db_able.client.BaseDBClient
+        :type limit: int
+        :param raw: bool; Refer to `Paginated.list`.
+        :rtype: PaginatedData
+        """
+        paginated_data_cls_ref = RawPaginatedData if raw else cls.paginated_data_cls_ref
+        with conn.timed(Phase.HYDRATE):
+            data = paginated_data_cls_ref.hydrate(cls, conn.data[:limit])
+        pagination = {
+            'has_more': len(conn.data) > limit,
+            'after': cls._to_after(data[-1]) if data else None
+            }
+        return paginated_data_cls_ref({
+            'data': data,
+            'pagination': cls.pagination_data_cls_ref(pagination)
+            })
+
+    @classmethod
+    def _validate_list_args(cls, **kwargs):
+        """
+        Validate `kwargs` against `cls.list_params` and request limit + 1 rows from the stored procedure, fetching
+        one additional row for the `has_more` business logic implementation.
+        Peeling out from validated_args is required to use restriction-defined default limit value.
+        :param kwargs: refer to `cls.list_params`
+        :return: The requested limit and the validated args to pass to the stored procedure.
+        :rtype: tuple[int, list of tuple]
+        """
+        limit = None
+        new_validated_args = []
+        for key, value in cls.kwargs_validator(*cls.list_params, **kwargs):
+            if key == 'limit':
+                new_arg = (key, value + 1)
+                limit = value
+            else:
+                new_arg = (key, value)
+            new_validated_args.append(new_arg)
+        return limit, new_validated_args
+
+    @classmethod
+    def _stream_page(cls, raw=False, **kwargs) -> Generator:
+        """
+        Refer to `streaming.stream_scrollable_page`.
+        :param raw: bool; Refer to `cls.list`.
+        :param kwargs: refer to `cls.list_params`
+        :return: The page's pagination DataObject.
+        :rtype: Generator
+        """
+        return streaming.stream_scrollable_page(cls, raw=raw, **kwargs)
+
+    @classmethod
+    def _to_after(cls, datum):
+        """
+        :param datum: cls or `cls.row_type()` instance; Last row of a page.
+        :return: The cursor value after `datum`, per `cls.to_after`.
+        """
+        if not isinstance(datum, cls):
+            datum = cls._from_row(datum._asdict())
+        return datum.to_after()
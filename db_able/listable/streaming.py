@@ -0,0 +1,90 @@
+"""
+Helpers of `_Listable` implementations to read rows through an unbuffered cursor, hydrating them as they are read.
+:date_created: 2026-10-17
+"""
+from typing import Generator
+
+
+def stream(cls_ref, **kwargs) -> Generator:
+    """
+    Yield every `DataObject` from a single call of the stored procedure '%s_stream' % cls_ref.__name__.
+    :type cls_ref: type[db_able.listable.base._Listable]
+    :param kwargs: refer to `cls_ref.stream_params`
+    :rtype: Generator
+    """
+    stored_procedure = '%s_stream%s' % (cls_ref.__name__, cls_ref.stream_params.version)
+    validated_args = cls_ref.kwargs_validator(*cls_ref.stream_params, **kwargs)
+    with cls_ref._db_client(stored_procedure, *validated_args, stream=True) as conn:
+        for row in conn.iter_data():
+            yield cls_ref._from_row(row)
+
+
+def stream_pages(cls_ref, raw=False, **kwargs) -> Generator:
+    """
+    Yield the rows of every page, each page streamed by `cls_ref._stream_page` and paged by its pagination data.
+    :type cls_ref: type[db_able.listable.base._Listable]
+    :param raw: bool; Refer to `cls_ref.list`.
+    :param kwargs: refer to `cls_ref.list_params`
+    :rtype: Generator
+    """
+    cursor_key = cls_ref.pagination_data_cls_ref.cursor_key
+    after = kwargs.pop(cursor_key, cls_ref.pagination_data_cls_ref._restrictions[cursor_key].default)
+    has_more = True
+    while has_more:
+        kwargs[cursor_key] = after
+        pagination = yield from cls_ref._stream_page(raw=raw, **kwargs)
+        has_more = pagination.has_more
+        after = pagination.after
+
+
+def stream_paginated_page(cls_ref, raw=False, **kwargs) -> Generator:
+    """
+    Streaming counterpart of `Paginated.list`: yield a single page's DataObjects as they are read.
+    :type cls_ref: type[db_able.listable.paginated.Paginated]
+    :param raw: bool; Refer to `Paginated.list`.
+    :param kwargs: refer to `cls_ref.list_params`
+    :return: The page's pagination DataObject.
+    :rtype: Generator
+    """
+    stored_procedure = '%s_list%s' % (cls_ref.__name__, cls_ref.list_params.version)
+    state, validated_args = cls_ref._validate_list_args(**kwargs)
+    count = 0
+    with cls_ref._list_client(stored_procedure, validated_args, raw=raw, stream=True) as conn:
+        for row in conn.iter_data():
+            count += 1
+            if state is None or count <= state['limit']:
+                yield row if raw else cls_ref._from_row(row)
+        assert conn.next_set(), 'Expected 2 result sets from %s.%s' % (cls_ref.db, stored_procedure)
+        pagination_data = list(conn.iter_data())
+        assert len(pagination_data) == 1, \
+            'Expected one row from pagination data result set from %s.%s' % (cls_ref.db, stored_procedure)
+        return cls_ref._pagination(pagination_data[0], state, count)
+
+
+def stream_scrollable_page(cls_ref, raw=False, **kwargs) -> Generator:
+    """
+    Streaming counterpart of `Scrollable.list`: yield a single page's DataObjects as they are read.
+    :type cls_ref: type[db_able.listable.scrollable.Scrollable]
+    :param raw: bool; Refer to `Scrollable.list`.
+    :param kwargs: refer to `cls_ref.list_params`
+    :return: The page's pagination DataObject.
+    :rtype: Generator
+    """
+    stored_procedure = '%s_list%s' % (cls_ref.__name__, cls_ref.list_params.version)
+    limit, new_validated_args = cls_ref._validate_list_args(**kwargs)
+    pagination = {
+        'has_more': False,
+        'after': None
+        }
+    last = None
+    with cls_ref._list_client(stored_procedure, new_validated_args, raw=raw, stream=True) as conn:
+        for i, row in enumerate(conn.iter_data()):
+            if i < limit:
+                last = row if raw else cls_ref._from_row(row)
+                yield last
+            else:
+                pagination['has_more'] = True
+                break
+    if last is not None:
+        pagination['after'] = cls_ref._to_after(last)
+    return cls_ref.pagination_data_cls_ref(pagination)
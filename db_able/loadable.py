@@ -1,10 +1,12 @@
 """
 :date_created: 2021-11-03
 """
+import copy
+
 from do_py.abc import ABCRestrictions
 
 from db_able.base_model.database_abc import Database
-from db_able.client import DBClient
+from db_able.mgmt.const import Phase
 
 
 @ABCRestrictions.require('load_params')
@@ -12,6 +14,16 @@ class Loadable(Database):
     """
     This is a mixin designed to access DB with a standard classmethod action, `load`.
     Supplants the "R" of CRUD.
+    Set `load_cache` to an `LRUCache` to serve repeated loads from memory. `create`, `save` and `delete` keep it up
+    to date; writes made outside of db_able must call `invalidate_load`. Statistics are available through
+    `load_cache.info()`.
+
+    Example:
+        >>> from db_able.utils.cache import LRUCache
+        >>>
+        >>> class A(Loadable):
+        >>>     ...
+        >>>     load_cache = LRUCache(maxsize=10000, ttl=300)
     """
     _is_abstract_ = True
 
@@ -49,6 +61,128 @@ class Loadable(Database):
         """
         stored_procedure = '%s_load%s' % (cls.__name__, cls.load_params.version)
         validated_args = cls.kwargs_validator(*cls.load_params, **kwargs)
-        with DBClient(cls.db, stored_procedure, *validated_args) as conn:
-            for row in conn.data:  # Note: this is a weakness. Load should only return one row.
-                return cls(data=row)
+        cached = cls._cached_load(validated_args)
+        if cached is not None:
+            return cached
+        with cls._db_client(stored_procedure, *validated_args) as conn:
+            with conn.timed(Phase.HYDRATE):
+                return cls._load_result(conn)
+
+    @classmethod
+    def invalidate_load(cls, **kwargs):
+        """
+        Drop the `cls.load_cache` entry for a row changed outside of db_able.
+        :param kwargs: Refer to cls.load_params
+        """
+        cls._uncache_row(cls.kwargs_validator(*cls.load_params, **kwargs))
+
+    @classmethod
+    def _cached_load(cls, validated_args):
+        """
+        :type validated_args: list of tuple
+        :return: Object built from a deep copy of the `cls.load_cache` entry for `validated_args`, if any.
+        :rtype: cls or None
+        """
+        key = cls._load_cache_key(validated_args)
+        if key is not None:
+            row = cls.load_cache.get(key)
+            if row is not None:
+                return cls._from_row(copy.deepcopy(row))
+        return None
+
+    @classmethod
+    def load_many(cls, keys):
+        """
+        Load multiple `DataObject` in a single call. Each key is validated as the kwargs of `cls.load`.
+        Expects to call the stored procedure: '%s_load_many' % cls.__name__, i.e. 'MyDataObject_load_many',
+        with a JSON array of the validated keys.
+
+        Example:
+            >>> a1, a2, missing = A.load_many([1, 2, 404])
+            >>> a1, a2 = A.load_many([{'id': 1}, {'id': 2}])
+
+        :param keys: list of dict or, for a single load param, list of values; refer to `cls.load_params`
+        :return: Objects in the order of `keys`, with None for keys that were not found.
+        :rtype: list of (cls or None)
+        """
+        stored_procedure = '%s_load_many%s' % (cls.__name__, cls.load_params.version)
+        validated_keys = cls._validate_load_many_keys(keys)
+        if not validated_keys:
+            return []
+        with cls._db_client(stored_procedure, ('keys', [dict(key) for key in validated_keys])) as conn:
+            with conn.timed(Phase.HYDRATE):
+                return cls._load_many_result(conn, validated_keys)
+
+    @classmethod
+    async def aload_many(cls, keys):
+        """
+        Async variant of `cls.load_many`.
+        :param keys: list of dict or, for a single load param, list of values; refer to `cls.load_params`
+        :rtype: list of (cls or None)
+        """
+        stored_procedure = '%s_load_many%s' % (cls.__name__, cls.load_params.version)
+        validated_keys = cls._validate_load_many_keys(keys)
+        if not validated_keys:
+            return []
+        async with cls._async_db_client(stored_procedure, ('keys', [dict(key) for key in validated_keys])) as conn:
+            with conn.timed(Phase.HYDRATE):
+                return cls._load_many_result(conn, validated_keys)
+
+    @classmethod
+    def _validate_load_many_keys(cls, keys):
+        """
+        :param keys: list of dict or, for a single load param, list of values; refer to `cls.load_params`
+        :return: Validated args of each key.
+        :rtype: list of list of tuple
+        """
+        assert isinstance(keys, (list, tuple)), 'Expected keys to be a list; got %s.' % type(keys).__name__
+        validated_keys = []
+        for key in keys:
+            if not isinstance(key, dict):
+                assert len(cls.load_params) == 1, \
+                    'Keys must be dicts for %s with load_params %s.' % (cls.__name__, list(cls.load_params))
+                key = {cls.load_params[0]: key}
+            validated_keys.append(cls.kwargs_validator(*cls.load_params, **key))
+        return validated_keys
+
+    @classmethod
+    def _load_many_result(cls, conn, validated_keys):
+        """
+        :type conn: db_able.client.BaseDBClient
+        :type validated_keys: list of list of tuple
+        :rtype: list of (cls or None)
+        """
+        found = {tuple(row[param] for param in cls.load_params): row for row in conn.data}
+        for row in found.values():
+            cls._cache_row(row)
+        results = []
+        for key in validated_keys:
+            row = found.get(tuple(value for _, value in key))
+            results.append(cls._from_row(row) if row is not None else None)
+        return results
+
+    @classmethod
+    async def aload(cls, **kwargs):
+        """
+        Async variant of `cls.load`.
+        :param kwargs: Refer to cls.load_params
+        :rtype: cls or None
+        """
+        stored_procedure = '%s_load%s' % (cls.__name__, cls.load_params.version)
+        validated_args = cls.kwargs_validator(*cls.load_params, **kwargs)
+        cached = cls._cached_load(validated_args)
+        if cached is not None:
+            return cached
+        async with cls._async_db_client(stored_procedure, *validated_args) as conn:
+            with conn.timed(Phase.HYDRATE):
+                return cls._load_result(conn)
+
+    @classmethod
+    def _load_result(cls, conn):
+        """
+        :type conn: db_able.client.BaseDBClient
+        :rtype: cls or None
+        """
+        for row in conn.data:  # Note: this is a weakness. Load should only return one row.
+            cls._cache_row(row)
+            return cls._from_row(row)
@@ -11,3 +11,63 @@ class PaginationType(object):  # Constant):
     PAGINATION = 'pagination'
     INFINITE_SCROLL = 'infinite_scroll'
     allowed = [PAGINATION, INFINITE_SCROLL]
+
+
+class ExecutionMode(object):
+    """
+    Constants for how DBClient executes stored procedures.
+        1. SESSION: `text()` clause executed through a connection-scoped ORM Session.
+        2. DBAPI: CALL executed directly on a pooled DBAPI cursor, bypassing the Session and TextClause machinery.
+    """
+    SESSION = 'session'
+    DBAPI = 'dbapi'
+    allowed = [SESSION, DBAPI]
+
+
+class TotalMode(object):
+    """
+    Constants for how `Paginated` list stored procedures report `Pagination.total`.
+        1. EXACT: `COUNT(*)` of the filtered rows on every page.
+        2. FIRST_PAGE: `COUNT(*)` on the first page only; NULL on later pages.
+        3. NONE: No total; NULL on every page.
+        4. ESTIMATED: The table's row estimate from `information_schema`, ignoring filters.
+        5. CACHED: `COUNT(*)` only when the client has no unexpired total cached for the filter, signaled with the
+            additional `_with_total` stored procedure argument.
+    Every mode but EXACT reads one additional row to determine `has_more`.
+    """
+    EXACT = 'exact'
+    FIRST_PAGE = 'first_page'
+    NONE = 'none'
+    ESTIMATED = 'estimated'
+    CACHED = 'cached'
+    allowed = [EXACT, FIRST_PAGE, NONE, ESTIMATED, CACHED]
+
+
+class Phase(object):
+    """
+    Constants for the timed phases of a stored procedure call, recorded by `db_able.client.telemetry`.
+        1. CHECKOUT: Waiting for a connection from the pool.
+        2. CALL: Executing the CALL statement.
+        3. FETCH: Reading a result set's rows from the cursor.
+        4. DECODE: Decoding rows into dicts, JSON columns included.
+        5. HYDRATE: Building the DataObjects returned by the mixin method.
+    """
+    CHECKOUT = 'checkout'
+    CALL = 'call'
+    FETCH = 'fetch'
+    DECODE = 'decode'
+    HYDRATE = 'hydrate'
+    allowed = [CHECKOUT, CALL, FETCH, DECODE, HYDRATE]
+
+
+class PlanIssue(object):
+    """
+    Constants for the query plan issues flagged by `db_able.utils.explain`.
+        1. FULL_SCAN: A table is read in full (`access_type` ALL).
+        2. FILESORT: Rows are sorted outside of an index.
+        3. TEMPORARY: An internal temporary table is materialized, i.e. for GROUP BY or DISTINCT.
+    """
+    FULL_SCAN = 'full_scan'
+    FILESORT = 'filesort'
+    TEMPORARY = 'temporary_table'
+    allowed = [FULL_SCAN, FILESORT, TEMPORARY]
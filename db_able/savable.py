@@ -4,8 +4,9 @@
 
 from do_py.abc import ABCRestrictions
 
+from db_able import client
 from db_able.base_model.database_abc import Database
-from db_able.client import DBClient
+from db_able.mgmt.const import Phase
 
 
 @ABCRestrictions.require('save_params')
@@ -14,8 +15,14 @@ class Savable(Database):
     This is a mixin designed to access DB with a standard method action, `save`.
     Supplants the "U" of CRUD.
     :requirement save_params: list or Params; usually load_params + create_params
+    :attribute track_changes: Snapshot the updatable fields of instances built from DB rows, so `save` skips the DB
+        call when none of them changed.
+    :attribute partial_save: Send only the changed fields to the '%s_save_partial' stored procedure, as a JSON
+        object, instead of every field to '%s_save'. Implies `track_changes`.
     """
     _is_abstract_ = True
+    track_changes = False
+    partial_save = False
 
     @classmethod
     def __compile__(cls):
@@ -25,12 +32,123 @@ class Savable(Database):
         super(Savable, cls).__compile__()
         cls._validate_params('save_params')
 
-    def save(self):
+    @classmethod
+    def _tracks_changes(cls):
+        """
+        :rtype: bool
+        """
+        return cls.track_changes or cls.partial_save
+
+    @classmethod
+    def _update_fields(cls):
+        """
+        :return: The `save_params` written by a save, i.e. all but the `load_params` identifying the row.
+        :rtype: list of str
+        """
+        load_params = getattr(cls, 'load_params', [])
+        return [param for param in cls.save_params if param not in load_params]
+
+    @staticmethod
+    def _snapshot_value(value):
+        """
+        :return: `value`, with nested dicts and lists frozen as JSON text so in-place changes to them are detected.
+        """
+        return client.JSON_CODEC.dumps(value) if isinstance(value, (dict, list)) else value
+
+    def _snapshot(self):
+        """
+        Record the updatable fields of `self` as saved in DB.
+        """
+        object.__setattr__(self, '_saved', {key: self._snapshot_value(self.get(key)) for key in self._update_fields()})
+
+    @classmethod
+    def _from_row(cls, row):
+        """
+        Refer to `Database._from_row`. Snapshot the row when tracking changes.
+        :type row: dict
+        :rtype: cls
+        """
+        instance = super(Savable, cls)._from_row(row)
+        if cls._tracks_changes():
+            instance._snapshot()
+        return instance
+
+    def _refresh(self, row):
+        """
+        Refer to `Database._refresh`. Snapshot the row when tracking changes.
+        :type row: dict
+        """
+        super(Savable, self)._refresh(row)
+        if self._tracks_changes():
+            self._snapshot()
+
+    @classmethod
+    def _from_written(cls, data):
+        """
+        Refer to `Database._from_written`. Snapshot the written values when tracking changes.
+        :type data: dict
+        :rtype: cls
+        """
+        instance = super(Savable, cls)._from_written(data)
+        if cls._tracks_changes():
+            instance._snapshot()
+        return instance
+
+    def _copy(self):
+        """
+        Refer to `Database._copy`. The copy keeps the snapshot of `self`, so it is exactly as dirty.
+        :rtype: Savable
+        """
+        copy = super(Savable, self)._copy()
+        saved = self.__dict__.get('_saved')
+        if saved is not None:
+            object.__setattr__(copy, '_saved', dict(saved))
+        return copy
+
+    def dirty_fields(self):
+        """
+        :return: Updatable fields changed since `self` was built from, or last saved to, DB. All of them when
+            `self` was built locally or changes are not tracked.
+        :rtype: list of str
+        """
+        saved = self.__dict__.get('_saved')
+        if saved is None:
+            return self._update_fields()
+        return [key for key, value in saved.items() if self._snapshot_value(self.get(key)) != value]
+
+    def _save_call(self, force, echo):
+        """
+        :param force: bool; Save even when no field changed.
+        :param echo: bool; Read the saved row back. Sent as the `echo` arg when `self.echo_writes` is False.
+        :return: Stored procedure name and validated args; None when there is nothing to save.
+        :rtype: tuple[str, list of tuple] or None
+        """
+        assert echo or not self.echo_writes, \
+            '%s: echo=False requires `echo_writes = False` stored procedures.' % self.__class__.__name__
+        dirty = self.dirty_fields()
+        if self._tracks_changes() and not dirty and not force:
+            return None
+        if not self.partial_save:
+            stored_procedure = '%s_save%s' % (self.__class__.__name__, self.save_params.version)
+            validated_args = self.kwargs_validator(*self.save_params, **self)
+        else:
+            stored_procedure = '%s_save_partial%s' % (self.__class__.__name__, self.save_params.version)
+            validated_args = self.kwargs_validator(*self.load_params, **self)
+            validated_args.append(('changes', dict(self.kwargs_validator(*dirty, **self))))
+        if not self.echo_writes:
+            validated_args.append(('echo', echo))
+        return stored_procedure, validated_args
+
+    def save(self, force=False, echo=None):
         """
         Save `DataObject`. Uses data in instance to update DB. Refer to `self.save_params` to see
         what fields are update-able.
         Expects to call the stored procedure: '%s_save' % cls.__name__, i.e. 'MyDataObject_save'
         Note: Standard Savable implementation uses Loadable internally in the stored procedure.
+        With `track_changes`, nothing is sent when no field changed since `self` was built from DB. With
+        `partial_save`, the key params and a JSON object of the changed fields are sent to '%s_save_partial'.
+        With `echo_writes = False`, the stored procedure returns only the affected-row count unless `echo` is True,
+        and `self` is kept as is instead of being refreshed from DB.
 
         Example:
             >>> from db_able import Loadable, Creatable, Savable, Params
@@ -51,12 +169,53 @@ class Savable(Database):
             >>> loaded = A.load(id=a.id)
             >>> assert a == loaded
 
+        :param force: bool; Call the stored procedure even when changes are tracked and no field changed.
+        :param echo: Optional bool; Read the saved row back. Defaults to `self.echo_writes`.
+        :return: True when saved; False when `echo_writes` is False and no row was affected.
+        :rtype: bool
+        """
+        echo = self.echo_writes if echo is None else echo
+        call = self._save_call(force, echo)
+        if call is None:
+            return True
+        stored_procedure, validated_args = call
+        with self._db_client(stored_procedure, *validated_args, rollback=True) as conn:
+            with conn.timed(Phase.HYDRATE):
+                return self._save_result(conn, echo)
+
+    async def asave(self, force=False, echo=None):
+        """
+        Async variant of `self.save`.
+        :param force: bool; Refer to `self.save`.
+        :param echo: Optional bool; Refer to `self.save`.
+        :rtype: bool
+        """
+        echo = self.echo_writes if echo is None else echo
+        call = self._save_call(force, echo)
+        if call is None:
+            return True
+        stored_procedure, validated_args = call
+        async with self._async_db_client(stored_procedure, *validated_args, rollback=True) as conn:
+            with conn.timed(Phase.HYDRATE):
+                return self._save_result(conn, echo)
+
+    def _save_result(self, conn, echo):
+        """
+        :type conn: db_able.client.BaseDBClient
+        :param echo: bool; The saved row was read back, rather than only the affected-row count.
         :rtype: bool
         """
-        stored_procedure = '%s_save%s' % (self.__class__.__name__, self.save_params.version)
-        validated_args = self.kwargs_validator(*self.save_params, **self)
-        with DBClient(self.db, stored_procedure, *validated_args, rollback=True) as conn:
-            assert conn.data, 'DB response required for `%s`.`%s`.' % (self.db, stored_procedure)
-            for row in conn.data:  # Note: this is a weakness. Should always return one and only one row.
-                self(data=row)
+        assert conn.data, 'DB response required for `%s`.`%s`.' % (self.db, conn.stored_procedure)
+        for row in conn.data:  # Note: this is a weakness. Should always return one and only one row.
+            if not echo:
+                if not row['saved']:
+                    return False
+                self._uncache_row(self)
+                self._invalidate_list_cache()
+                if self._tracks_changes():
+                    self._snapshot()
                 return True
+            self._refresh(row)
+            self._cache_row(row)
+            self._invalidate_list_cache()
+            return True
@@ -0,0 +1,175 @@
+"""
+Thread-safe bounded caches with hit/miss accounting.
+:date_created: 2026-10-16
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from do_py import DataObject, R
+
+_MISSING = object()
+
+
+class CacheInfo(DataObject):
+    """
+    Snapshot of a cache's counters.
+    :restriction evictions: Entries dropped to stay within `maxsize`.
+    :restriction expirations: Entries dropped on access after outliving `ttl`.
+    :restriction maxsize: Maximum number of entries held; 0 disables caching.
+    :restriction ttl: Seconds an entry is served for; None never expires.
+    """
+    _restrictions = {
+        'hits': R.INT.with_default(0),
+        'misses': R.INT.with_default(0),
+        'evictions': R.INT.with_default(0),
+        'expirations': R.INT.with_default(0),
+        'size': R.INT.with_default(0),
+        'maxsize': R.INT.with_default(0),
+        'ttl': R(int, float, type(None)).with_default(None),
+        }
+
+
+class LRUCache(object):
+    """
+    Least-recently-used mapping bounded to `maxsize` entries, with optional time-to-live expiry.
+
+    Example:
+        >>> cache = LRUCache(maxsize=2, ttl=60)
+        >>> cache.set('a', 1)
+        >>> cache.get('a')
+        1
+        >>> cache.info()
+        {'hits': 1, 'misses': 0, 'evictions': 0, 'expirations': 0, 'size': 1, 'maxsize': 2, 'ttl': 60}
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        """
+        :param maxsize: int; Maximum number of entries held. 0 disables caching.
+        :param ttl: int or float or None; Seconds an entry is served for after it is set. None never expires.
+        """
+        assert isinstance(maxsize, int) and maxsize >= 0, 'Invalid maxsize="%s".' % (maxsize,)
+        assert ttl is None or (isinstance(ttl, (int, float)) and ttl > 0), 'Invalid ttl="%s".' % (ttl,)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._data = OrderedDict()  # {key: (expires_at or None, value)}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        :type key: collections.abc.Hashable
+        :param default: Returned, and counted as a miss, when `key` is not cached.
+        :return: The cached value for `key`, marked as most recently used.
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Cache `value` for `key`, evicting the least recently used entry once `maxsize` is exceeded.
+        :type key: collections.abc.Hashable
+        :type value: object
+        """
+        if not self.maxsize:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def pop(self, key, default=None):
+        """
+        Invalidate `key`.
+        :type key: collections.abc.Hashable
+        :return: The value that was cached for `key`, else `default`.
+        """
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def discard(self, match):
+        """
+        Invalidate every key for which `match(key)` is truthy.
+        :type match: callable
+        :return: Number of entries dropped.
+        :rtype: int
+        """
+        with self._lock:
+            keys = [key for key in self._data if match(key)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def resize(self, maxsize):
+        """
+        :param maxsize: int; New bound. Least recently used entries are evicted to fit.
+        """
+        assert isinstance(maxsize, int) and maxsize >= 0, 'Invalid maxsize="%s".' % (maxsize,)
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def _evict(self):
+        """
+        Drop least recently used entries until within `maxsize`. Caller holds `self._lock`.
+        """
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Drop every entry and reset the counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def info(self):
+        """
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo({
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl
+                })
+
+    def __contains__(self, key):
+        """
+        Membership test; does not affect recency or counters. Expired entries not yet accessed are included.
+        :type key: collections.abc.Hashable
+        :rtype: bool
+        """
+        return key in self._data
+
+    def __len__(self):
+        """
+        :rtype: int
+        """
+        return len(self._data)
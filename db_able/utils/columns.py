@@ -0,0 +1,104 @@
+"""
+Columnar buffers for `_Listable.to_columns`. Requires `pip install db-able[columns]`.
+:date_created: 2026-10-16
+"""
+from datetime import date, datetime
+
+import numpy
+from do_py.data_object.restriction import _ListTypeRestriction
+
+
+def column_dtype(restriction):
+    """
+    :type restriction: do_py.data_object.restriction.AbstractRestriction
+    :return: int64 for INT, float64 for FLOAT and nullable INT (NULL as NaN), datetime64 for DATETIME and DATE
+        (NULL as NaT), else object.
+    :rtype: numpy.dtype
+    """
+    if isinstance(restriction, _ListTypeRestriction):
+        allowed = [t for t in restriction.allowed if t is not type(None)]
+        nullable = len(allowed) < len(restriction.allowed)
+        if allowed and all(issubclass(t, int) and not issubclass(t, bool) for t in allowed):
+            return numpy.dtype(numpy.float64 if nullable else numpy.int64)
+        if float in allowed and all(t in (float, int) for t in allowed):
+            return numpy.dtype(numpy.float64)
+        if allowed == [datetime]:
+            return numpy.dtype('datetime64[us]')
+        if allowed == [date]:
+            return numpy.dtype('datetime64[D]')
+    return numpy.dtype(object)
+
+
+class ColumnBuffer(object):
+    """
+    Typed array of one column, grown geometrically as values are appended.
+    """
+
+    def __init__(self, dtype, capacity=1024):
+        """
+        :type dtype: numpy.dtype
+        :param capacity: int; Initial number of values allocated.
+        """
+        self.array = numpy.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values):
+        """
+        :param values: tuple; Values of the column for a page of rows.
+        """
+        count = len(values)
+        end = self.size + count
+        if end > len(self.array):
+            array = numpy.empty(max(end, 2 * len(self.array)), dtype=self.array.dtype)
+            array[:self.size] = self.array[:self.size]
+            self.array = array
+        if self.array.dtype == object:
+            values = numpy.fromiter(values, dtype=object, count=count)  # Keep list and dict values as elements.
+        self.array[self.size:end] = values
+        self.size = end
+
+    def finish(self):
+        """
+        :return: The appended values, without the unused capacity.
+        :rtype: numpy.ndarray
+        """
+        if self.size == len(self.array):
+            return self.array
+        return self.array[:self.size].copy()
+
+
+class ColumnBuffers(object):
+    """
+    One `ColumnBuffer` per field of a `_Listable` implementation's `row_type`, typed from its `_restrictions`.
+    """
+
+    def __init__(self, cls_ref, capacity=1024):
+        """
+        :type cls_ref: type[db_able.listable._Listable]
+        :param capacity: int; Initial number of rows allocated.
+        """
+        self.fields = cls_ref.row_type()._fields
+        self.buffers = [ColumnBuffer(column_dtype(cls_ref._restrictions[field]), capacity) for field in self.fields]
+
+    def extend(self, rows):
+        """
+        Append a page of rows, one column at a time.
+        :param rows: list of `cls_ref.row_type()`
+        """
+        if rows:
+            for buffer, values in zip(self.buffers, zip(*rows)):
+                buffer.extend(values)
+
+    def to_dict(self):
+        """
+        :rtype: dict of numpy.ndarray
+        """
+        return {field: buffer.finish() for field, buffer in zip(self.fields, self.buffers)}
+
+    def to_frame(self):
+        """
+        Requires `pip install pandas`.
+        :rtype: pandas.DataFrame
+        """
+        import pandas  # Optional dependency.
+        return pandas.DataFrame(self.to_dict(), columns=list(self.fields))
@@ -0,0 +1,239 @@
+"""
+Audit the query plans of the stored procedures generated by `sql_generator`: each SELECT, UPDATE and DELETE of a
+procedure body is bound to representative parameter values and run through `EXPLAIN FORMAT=JSON`, flagging full
+table scans, filesorts and temporary tables before the procedures are deployed.
+Requires a MySQL 5.7+ server holding the tables, ideally with production-like data, since the optimizer happily scans
+a table of a few rows.
+    python -m db_able.utils.explain examples.a.A examples.c.C
+:date_created: 2026-10-16
+"""
+import argparse
+import importlib
+import json
+import re
+import sys
+from datetime import datetime
+
+from do_py import DataObject, R
+from pymysql.converters import escape_item
+
+from db_able import Deletable, Loadable, Paginated, Savable, Scrollable
+from db_able.client import EngineRegistry
+from db_able.mgmt.const import PlanIssue
+from db_able.utils.sql_generator import CoreStoredProcedure
+
+PARAM_RE = re.compile(r'IN `(_\w+)` (\w+)')
+STATEMENT_RE = re.compile(r'^[ \t]*(SELECT|UPDATE|DELETE)\b', re.MULTILINE)
+INTO_RE = re.compile(r'\s+INTO\s+`_\w+`')
+VARIABLE_RE = re.compile(r'`(_\w+)`')
+
+sql_type_values = {
+    'INT': 1,
+    'BIGINT': 1,
+    'VARCHAR': 'a',
+    'TIMESTAMP': datetime(2021, 1, 1),
+    'FLOAT': 1.0,
+    'JSON': '{}',
+    'BOOL': True,
+    }
+variable_values = {
+    '_limit': 10,
+    '_page': 1,
+    '_page_number': 1,
+    '_offset': 0,
+    '_fetch': 11,
+    }
+
+
+class PlanFinding(DataObject):
+    """
+    One issue in the plan of a generated statement.
+    """
+    _restrictions = {
+        'procedure': R.STR,
+        'issue': R(*PlanIssue.allowed),
+        'table': R.NULL_STR,
+        'rows': R.NULL_INT,
+        'statement': R.STR
+        }
+
+
+def procedures(cls_ref, deferred_join=False):
+    """
+    Stored procedures generated for `cls_ref`, as `print_all_sps` prints them. Create procedures only insert and are
+    left out.
+    :type cls_ref: type[Loadable or Savable or Deletable or Paginated or Scrollable]
+    :param deferred_join: bool; Generate Paginated `list` with `DeferredJoinListProcedure`.
+    :rtype: list of CoreStoredProcedure
+    """
+    mro = cls_ref.mro()
+    methods = []
+    if Loadable in mro:
+        methods += [('load', None), ('load_many', None)]
+    if Savable in mro:
+        methods.append(('save', None))
+        if cls_ref.partial_save:
+            methods.append(('save_partial', None))
+    if Deletable in mro:
+        methods.append(('delete', None))
+    if Paginated in mro:
+        methods += [('list', 'paginated_deferred_join' if deferred_join else 'paginated'), ('stream', None)]
+    if Scrollable in mro:
+        methods += [('list', 'scrollable'), ('stream', None)]
+    return [CoreStoredProcedure.from_db_able(cls_ref, method, procedure_key=key) for method, key in methods]
+
+
+def parameter_values(cls_ref, sp, values=None):
+    """
+    :type cls_ref: type[db_able.base_model.database_abc.Database]
+    :type sp: CoreStoredProcedure
+    :param values: Optional dict overriding the representative value of params, i.e. {'id': 42}.
+    :return: SQL literal per variable of `sp`, i.e. {'_id': '1'}.
+    :rtype: dict
+    """
+    bound = {}
+    for variable, sql_type in PARAM_RE.findall(sp.params):
+        bound[variable] = sql_type_values.get(sql_type)
+    bound.update(variable_values)
+    if '_keys' in bound:
+        bound['_keys'] = json.dumps([{param: 1 for param in cls_ref.load_params}])
+    for param, value in (values or {}).items():
+        bound['_%s' % param] = json.dumps(value) if isinstance(value, (dict, list)) else value
+    return {variable: escape_item(value, 'utf8mb4') for variable, value in bound.items()}
+
+
+def statements(cls_ref, sp, values=None):
+    """
+    The explainable statements of a procedure body, with its variables replaced by representative literals. SELECT
+    ... INTO keeps its query; statements without a table, and reads of `information_schema`, are skipped.
+    :type cls_ref: type[db_able.base_model.database_abc.Database]
+    :type sp: CoreStoredProcedure
+    :param values: Refer to `parameter_values`.
+    :rtype: list of str
+    """
+    literals = parameter_values(cls_ref, sp, values=values)
+    result = []
+    for chunk in sp.procedure.split(';'):
+        match = STATEMENT_RE.search(chunk)
+        if match is None:
+            continue
+        statement = INTO_RE.sub('', chunk[match.start(1):].strip())
+        if match.group(1) == 'SELECT' and ' FROM ' not in statement.replace('\n', ' '):
+            continue
+        if 'information_schema' in statement:
+            continue
+        result.append(VARIABLE_RE.sub(lambda m: literals.get(m.group(1), m.group(0)), statement))
+    return result
+
+
+def plan_findings(plan):
+    """
+    Walk a `EXPLAIN FORMAT=JSON` plan. Full scans of derived tables, i.e. the page keys of a deferred join, are
+    expected and not reported.
+    :param plan: dict; The decoded plan.
+    :return: (issue, table, rows) per issue found.
+    :rtype: list of tuple
+    """
+    findings = []
+
+    def walk(node):
+        if isinstance(node, list):
+            for child in node:
+                walk(child)
+            return
+        if not isinstance(node, dict):
+            return
+        if node.get('access_type') == 'ALL' and 'materialized_from_subquery' not in node:
+            findings.append((PlanIssue.FULL_SCAN, node.get('table_name'), node.get('rows_examined_per_scan')))
+        table = node.get('table', {}).get('table_name') if isinstance(node.get('table'), dict) else None
+        if node.get('using_filesort'):
+            findings.append((PlanIssue.FILESORT, table, None))
+        if node.get('using_temporary_table'):
+            findings.append((PlanIssue.TEMPORARY, table, None))
+        for child in node.values():
+            walk(child)
+
+    walk(plan)
+    return findings
+
+
+def mysql_explain(conn):
+    """
+    :param conn: DBAPI connection, i.e. `EngineRegistry.get().raw_connection()`.
+    :return: callable(statement) -> dict; The decoded plan of `statement`.
+    :rtype: callable
+    """
+    def explain(statement):
+        cursor = conn.cursor()
+        try:
+            cursor.execute('EXPLAIN FORMAT=JSON %s' % statement)
+            return json.loads(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+    return explain
+
+
+def audit(cls_ref, deferred_join=False, values=None, explain=None):
+    """
+    Explain every statement of the stored procedures generated for `cls_ref`.
+
+    Example:
+        >>> from db_able.utils.explain import audit
+        >>>
+        >>> for finding in audit(A, values={'id': 42}):
+        >>>     print(finding.procedure, finding.issue, finding.table)
+
+    :type cls_ref: type[Loadable or Savable or Deletable or Paginated or Scrollable]
+    :param deferred_join: bool; Refer to `procedures`.
+    :param values: Refer to `parameter_values`.
+    :param explain: Optional callable(statement) -> dict; Defaults to `mysql_explain` on a connection of the engine
+        `cls_ref` is bound to.
+    :rtype: list of PlanFinding
+    """
+    if explain is None:
+        conn = EngineRegistry.get(cls_ref.engine_key or cls_ref.db).raw_connection()
+        try:
+            return audit(cls_ref, deferred_join=deferred_join, values=values, explain=mysql_explain(conn))
+        finally:
+            conn.close()
+    findings = []
+    for sp in procedures(cls_ref, deferred_join=deferred_join):
+        procedure = '%s_%s%s' % (sp.cls_name, sp.method, sp.version)
+        for statement in statements(cls_ref, sp, values=values):
+            for issue, table, rows in plan_findings(explain(statement)):
+                findings.append(PlanFinding({
+                    'procedure': procedure,
+                    'issue': issue,
+                    'table': table,
+                    'rows': rows,
+                    'statement': statement
+                    }))
+    return findings
+
+
+def main(argv=None):
+    """
+    Audit the classes named on the command line; exits 1 when any issue not ignored is found.
+    :type argv: list of str or None
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog='python -m db_able.utils.explain', description=__doc__.split('\n')[1])
+    parser.add_argument('classes', nargs='+', help='Dotted path of a DBAble class, i.e. examples.a.A')
+    parser.add_argument('--deferred-join', action='store_true', help='Audit Paginated `list` as a deferred join.')
+    parser.add_argument('--ignore', action='append', default=[], choices=PlanIssue.allowed,
+                        help='Issue to report without failing; repeatable.')
+    args = parser.parse_args(argv)
+    failed = False
+    for path in args.classes:
+        module_name, _, cls_name = path.rpartition('.')
+        cls_ref = getattr(importlib.import_module(module_name), cls_name)
+        for finding in audit(cls_ref, deferred_join=args.deferred_join):
+            failed = failed or finding.issue not in args.ignore
+            print('%s: %s on %s (rows=%s)\n    %s' % (
+                finding.procedure, finding.issue, finding.table, finding.rows, finding.statement.replace('\n', ' ')
+                ))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Background prefetching of iterables on a worker thread.
+:date_created: 2026-10-16
+"""
+import queue
+import threading
+from typing import Generator, Iterable
+
+_DONE = object()
+
+
+def prefetch(iterable: Iterable, depth: int = 1) -> Generator:
+    """
+    Iterate `iterable` on a worker thread, buffering up to `depth` items ahead of the consumer, so producing the next
+    items, i.e. fetching pages from DB, overlaps with consuming the current one.
+    Exceptions raised by `iterable` are re-raised to the consumer. Closing the generator early stops the worker and
+    waits for its in-flight item, so no work outlives the generator.
+    Caveat: `iterable` runs in another thread and does not see the consumer's `Transaction` context.
+
+    Example:
+        >>> for page in prefetch(pages(), depth=2):
+        >>>     process(page)
+
+    :type iterable: Iterable
+    :param depth: int; Maximum number of items buffered ahead of the consumer.
+    :rtype: Generator
+    """
+    assert isinstance(depth, int) and depth > 0, 'Invalid depth="%s".' % (depth,)
+    iterator = iter(iterable)
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        """
+        Block until `item` is buffered or the consumer stops.
+        :rtype: bool
+        """
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        error = None
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except BaseException as e:
+            error = e
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+        put((_DONE, error))
+
+    thread = threading.Thread(target=worker, name='db_able-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
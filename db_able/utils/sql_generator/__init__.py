@@ -0,0 +1,10 @@
+"""
+Utilities to generate SQL templates to simplify creating Stored Procedures for each mixin implementation.
+:date_created: 2021-11-20
+"""
+from db_able.utils.sql_generator.base import ABCSQL, sql_type_mapping
+from db_able.utils.sql_generator.core import CoreStoredProcedure, print_all_sps, procedure_mapping
+from db_able.utils.sql_generator.extended import CreateManyProcedure, DeferredJoinListProcedure, LoadManyProcedure, \
+    NoEchoCreateProcedure, NoEchoPartialSaveProcedure, NoEchoSaveProcedure, PartialSaveProcedure, StreamListProcedure
+from db_able.utils.sql_generator.procedures import CreateProcedure, DeleteProcedure, LoadProcedure, \
+    PaginatedListProcedure, SaveProcedure, ScrollListProcedure
@@ -0,0 +1,65 @@
+"""
+Abstraction of the generators of SQL templates for Stored Procedures.
+:date_created: 2021-11-20
+"""
+from typing import Type, Union
+
+import humps
+from do_py import DataObject, R
+from do_py.abc import ABCRestrictions
+
+from db_able import Creatable, Deletable, Loadable, Paginated, Savable, Scrollable
+
+
+sql_type_mapping = {
+    str(R.INT[0]): 'INT',
+    str(R.NULL_INT[0]): 'INT',
+    str(R.STR[0]): 'VARCHAR(255)',
+    str(R.NULL_STR[0]): 'VARCHAR(255)',
+    str(R.DATETIME[0]): 'TIMESTAMP',
+    str(R.NULL_DATETIME[0]): 'TIMESTAMP',
+    str(R.FLOAT[0]): 'FLOAT',
+    str(R.NULL_FLOAT[0]): 'FLOAT',
+    }
+
+
+@ABCRestrictions.require('BASE_SQL', 'from_db_able')
+class ABCSQL(DataObject):
+    """
+    Abstraction for generating MySQL Stored Procedures from DBAble implementations.
+    """
+    _is_abstract_ = True
+
+    @classmethod
+    def get_table_name(
+            cls,
+            cls_ref: Type[Union[Loadable, Creatable, Savable, Deletable, Paginated, Scrollable]]
+            ) -> str:
+        """
+        Decamelize the `cls_ref.__name__` to get a default table name.
+        """
+        table_name = humps.decamelize(cls_ref.__name__)
+        if table_name == cls_ref.__name__:
+            table_name = cls_ref.__name__.lower()
+        return table_name
+
+    @classmethod
+    def get_sql_type(
+            cls,
+            cls_ref: Type[Union[Loadable, Creatable, Savable, Deletable, Paginated, Scrollable]],
+            param: str
+            ) -> str:
+        """
+        Map the restriction of `param` to a MySQL type. Nested DataObject restrictions map to JSON.
+        :rtype: str or None
+        """
+        allowed = cls_ref._restrictions.get(param, (cls_ref._extra_restrictions or {}).get(param))[0]
+        if isinstance(allowed, type) and issubclass(allowed, DataObject):
+            return 'JSON'
+        return sql_type_mapping.get(str(allowed))
+
+    def as_sql(self) -> str:
+        """
+        :rtype: str
+        """
+        return self.BASE_SQL.format(**self)
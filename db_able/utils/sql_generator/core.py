@@ -0,0 +1,138 @@
+"""
+Generation of the complete Stored Procedure of each mixin method.
+:date_created: 2021-11-20
+"""
+from typing import Type, Union
+
+from do_py import R
+
+from db_able import Creatable, Deletable, Loadable, Paginated, Savable, Scrollable
+from db_able.mgmt.const import TotalMode
+from db_able.utils.sql_generator.base import ABCSQL
+from db_able.utils.sql_generator.extended import CreateManyProcedure, DeferredJoinListProcedure, LoadManyProcedure, \
+    NoEchoCreateProcedure, NoEchoPartialSaveProcedure, NoEchoSaveProcedure, PartialSaveProcedure, StreamListProcedure
+from db_able.utils.sql_generator.procedures import CreateProcedure, DeleteProcedure, LoadProcedure, \
+    PaginatedListProcedure, SaveProcedure, ScrollListProcedure
+
+
+procedure_mapping = {
+    'load': LoadProcedure,
+    'load_many': LoadManyProcedure,
+    'create': CreateProcedure,
+    'create_no_echo': NoEchoCreateProcedure,
+    'create_many': CreateManyProcedure,
+    'save': SaveProcedure,
+    'save_no_echo': NoEchoSaveProcedure,
+    'save_partial': PartialSaveProcedure,
+    'save_partial_no_echo': NoEchoPartialSaveProcedure,
+    'delete': DeleteProcedure,
+    'paginated': PaginatedListProcedure,
+    'paginated_deferred_join': DeferredJoinListProcedure,
+    'scrollable': ScrollListProcedure,
+    'stream': StreamListProcedure
+    }
+
+
+class CoreStoredProcedure(ABCSQL):
+    """
+    :restriction params: Should conform to ``` IN `_variable` TYPE ``` syntax.
+    :restriction procedure: The contents of the SP's execution.
+    """
+    BASE_SQL = '''
+USE `{db}`;
+DROP PROCEDURE IF EXISTS `{db}`.`{cls_name}_{method}{version}`;
+
+DELIMITER $$
+CREATE
+    DEFINER = `root`@`localhost` PROCEDURE `{db}`.`{cls_name}_{method}{version}`
+(
+{params}
+)
+BEGIN
+
+    {procedure}
+
+END;
+$$
+DELIMITER ;
+'''
+    _restrictions = {
+        'db': R.STR,
+        'cls_name': R.STR,
+        'method': R(
+            'create', 'create_many', 'load', 'load_many', 'save', 'save_partial', 'delete', 'list', 'stream'
+            ),
+        'version': R.STR,
+        'params': R.STR,
+        'procedure': R.STR
+        }
+
+    @classmethod
+    def from_db_able(cls, cls_ref: Type[Union[Loadable, Creatable, Savable, Deletable, Paginated, Scrollable]], method,
+                     procedure_key=None):
+        """
+        Creates string representation of SQL file to create a Stored Procedure for given method.
+        The create and save procedures of classes with `echo_writes = False` take the `_echo` flag and default to
+        their no-echo variant.
+        :type cls_ref: Creatable or Loadable or Savable or Deletable
+        :type method: str
+        :type procedure_key: str or None
+        :rtype: CoreStoredProcedure
+        """
+        if method == 'load_many':
+            params_attr = cls_ref.load_params
+            params = '    IN `_keys` JSON'
+        elif method == 'create_many':
+            params_attr = cls_ref.create_params
+            params = '    IN `_rows` JSON,\n    IN `_echo` BOOL'
+        elif method == 'save_partial':
+            params_attr = cls_ref.save_params
+            params = ',\n'.join(
+                ['    IN `_%s` %s' % (param, cls.get_sql_type(cls_ref, param)) for param in cls_ref.load_params]
+                + ['    IN `_changes` JSON']
+                )
+        else:
+            params_attr = getattr(cls_ref, '%s_params' % method)
+            params = ',\n'.join(
+                '    IN `_%s` %s' % (param, cls.get_sql_type(cls_ref, param))
+                for param in params_attr
+                )
+            if method == 'list' and getattr(cls_ref, 'total_mode', None) == TotalMode.CACHED:
+                params += ',\n    IN `_with_total` BOOL'
+        if method in ('create', 'save', 'save_partial') and not getattr(cls_ref, 'echo_writes', True):
+            params += ',\n    IN `_echo` BOOL'
+            procedure_key = procedure_key or '%s_no_echo' % method
+        return cls({
+            'db': cls_ref.db,
+            'cls_name': cls_ref.__name__,
+            'method': method,
+            'version': params_attr.version,
+            'params': params,
+            'procedure': procedure_mapping[procedure_key or method].from_db_able(cls_ref).as_sql()
+            })
+
+
+def print_all_sps(cls_ref, deferred_join=False):
+    """
+    :type cls_ref: Loadable or Creatable # or Savable or Deletable
+    :param deferred_join: bool; Generate Paginated `list` with `DeferredJoinListProcedure`.
+    """
+    if Loadable in cls_ref.mro():
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'load').as_sql())
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'load_many').as_sql())
+    if Creatable in cls_ref.mro():
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'create').as_sql())
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'create_many').as_sql())
+    if Savable in cls_ref.mro():
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'save').as_sql())
+        if cls_ref.partial_save:
+            print(CoreStoredProcedure.from_db_able(cls_ref, 'save_partial').as_sql())
+    if Deletable in cls_ref.mro():
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'delete').as_sql())
+    if Paginated in cls_ref.mro():
+        procedure_key = 'paginated_deferred_join' if deferred_join else 'paginated'
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'list', procedure_key=procedure_key).as_sql())
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'stream').as_sql())
+    if Scrollable in cls_ref.mro():
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'list', procedure_key='scrollable').as_sql())
+        print(CoreStoredProcedure.from_db_able(cls_ref, 'stream').as_sql())
@@ -0,0 +1,293 @@
+"""
+Generators of the SQL templates of the batched, partial, no-echo, deferred join and streaming variants of the Stored
+Procedures each mixin calls.
+:date_created: 2026-10-16
+"""
+from typing import Type, Union
+
+from do_py import R
+
+from db_able import Creatable, Loadable, Paginated, Savable, Scrollable
+from db_able.mgmt.const import TotalMode
+from db_able.utils.sql_generator.base import ABCSQL
+from db_able.utils.sql_generator.procedures import CreateProcedure, PaginatedListProcedure, SaveProcedure
+
+
+class LoadManyProcedure(ABCSQL):
+    """
+    SQL generator helper for `Loadable.load_many`. Keys are passed as a JSON array of objects, i.e. '[{"id": 1}]'.
+    Note: Requires MySQL 8.0.4+ for `JSON_TABLE`.
+    """
+    BASE_SQL = '''SELECT `{table_name}`.* FROM JSON_TABLE(`_keys`, '$[*]' COLUMNS ({columns})) AS `_keys_table`
+    JOIN `{db}`.`{table_name}` ON {join_clause};'''
+    _restrictions = {
+        'db': R.STR,
+        'table_name': R.STR,
+        'columns': R.STR,
+        'join_clause': R.STR
+        }
+
+    @classmethod
+    def from_db_able(cls, cls_ref: Type[Loadable]):
+        """
+        :type cls_ref: type[Loadable]
+        :rtype: LoadManyProcedure
+        """
+        table_name = cls.get_table_name(cls_ref)
+        return cls({
+            'db': cls_ref.db,
+            'table_name': table_name,
+            'columns': ', '.join(
+                '`{param}` {sql_type} PATH \'$.{param}\''.format(
+                    param=param,
+                    sql_type=cls.get_sql_type(cls_ref, param)
+                    )
+                for param in cls_ref.load_params
+                ),
+            'join_clause': ' AND '.join(
+                '`{table_name}`.`{param}` = `_keys_table`.`{param}`'.format(table_name=table_name, param=param)
+                for param in cls_ref.load_params
+                )
+            })
+
+
+class NoEchoCreateProcedure(CreateProcedure):
+    """
+    SQL generator helper for Creatable with `echo_writes = False`: unless `_echo` is true, only the generated key is
+    returned instead of loading the created row.
+    Caveat: Assumes the first load param is the auto-increment primary key.
+    """
+    BASE_SQL = '''INSERT INTO `{db}`.`{table_name}` ({columns}) VALUES ({values_clause});
+    IF `_echo` THEN
+        CALL `{db}`.`{cls_name}_load{load_version}`(LAST_INSERT_ID());
+    ELSE
+        SELECT LAST_INSERT_ID() AS `{id}`;
+    END IF;'''
+    _restrictions = dict(CreateProcedure._restrictions, id=R.STR)
+
+    @classmethod
+    def from_db_able(cls, cls_ref: Type[Creatable]):
+        """
+        :type cls_ref: Creatable
+        :rtype: NoEchoCreateProcedure
+        """
+        return cls(dict(CreateProcedure.from_db_able(cls_ref), id=cls_ref.load_params[0]))
+
+
+class CreateManyProcedure(ABCSQL):
+    """
+    SQL generator helper for `Creatable.create_many`. Rows are passed as a JSON array of objects and inserted by a
+    single multi-row `INSERT ... SELECT` in input order. Created rows, or only their ids when `_echo` is false, are
+    then re-selected in input order as the rows past the last id visible before the insert.
+    A consistent read opens the transaction's read view ahead of the insert. Rows other sessions commit later stay
+    invisible to it, and rows committed earlier hold lower ids, so only the rows inserted here are re-selected, in id
+    order, whatever `innodb_autoinc_lock_mode` interleaves. A count mismatch, e.g. under READ COMMITTED, is an error.
+    Note: Requires MySQL 8.0.4+ for `JSON_TABLE`, and REPEATABLE READ isolation, MySQL's default.
+    Caveat: Assumes the first load param is the auto-increment primary key.
+    """
+    BASE_SQL = '''DECLARE `_last_id` BIGINT;
+
+    SELECT COALESCE(MAX(`{id}`), 0) INTO `_last_id` FROM `{db}`.`{table_name}`;
+    INSERT INTO `{db}`.`{table_name}` ({columns})
+    SELECT {select_columns}
+    FROM JSON_TABLE(`_rows`, '$[*]' COLUMNS (`_ordinality` FOR ORDINALITY, {json_columns})) AS `_row`
+    ORDER BY `_ordinality`;
+
+    IF (SELECT COUNT(*) FROM `{db}`.`{table_name}` WHERE `{id}` > `_last_id`) <> JSON_LENGTH(`_rows`) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Rows of concurrent sessions are visible; use REPEATABLE READ.';
+    END IF;
+
+    IF `_echo` THEN
+        SELECT * FROM `{db}`.`{table_name}` WHERE `{id}` > `_last_id` ORDER BY `{id}`;
+    ELSE
+        SELECT `{id}` FROM `{db}`.`{table_name}` WHERE `{id}` > `_last_id` ORDER BY `{id}`;
+    END IF;'''
+    _restrictions = {
+        'db': R.STR,
+        'table_name': R.STR,
+        'columns': R.STR,
+        'select_columns': R.STR,
+        'json_columns': R.STR,
+        'id': R.STR
+        }
+
+    @classmethod
+    def from_db_able(cls, cls_ref: Type[Creatable]):
+        """
+        :type cls_ref: Creatable
+        :rtype: CreateManyProcedure
+        """
+        return cls({
+            'db': cls_ref.db,
+            'table_name': cls.get_table_name(cls_ref),
+            'columns': ', '.join('`%s`' % param for param in cls_ref.create_params),
+            'select_columns': ', '.join(
+                # JSON null in a JSON column is stored as SQL NULL.
+                "NULLIF(`%s`, CAST('null' AS JSON))" % param if cls.get_sql_type(cls_ref, param) == 'JSON'
+                else '`%s`' % param
+                for param in cls_ref.create_params
+                ),
+            'json_columns': ', '.join(
+                '`{param}` {sql_type} PATH \'$.{param}\''.format(
+                    param=param,
+                    sql_type=cls.get_sql_type(cls_ref, param)
+                    )
+                for param in cls_ref.create_params
+                ),
+            'id': cls_ref.load_params[0]
+            })
+
+
+class NoEchoSaveProcedure(SaveProcedure):
+    """
+    SQL generator helper for Savable with `echo_writes = False`: unless `_echo` is true, only the affected-row count
+    is returned instead of loading the saved row.
+    Caveat: `ROW_COUNT()` counts matched rather than changed rows only with the `CLIENT_FOUND_ROWS` connection flag,
+    which SQLAlchemy's MySQL dialects and `AsyncEngineRegistry` pools set.
+    """
+    BASE_SQL = '''UPDATE `{db}`.`{table_name}` SET {set_clause} WHERE {where_clause};
+    IF `_echo` THEN
+        CALL `{db}`.`{cls_name}_load{load_version}`({load_params});
+    ELSE
+        SELECT ROW_COUNT() AS `saved`;
+    END IF;'''
+
+
+class PartialSaveProcedure(ABCSQL):
+    """
+    SQL generator helper for Savable with `partial_save`. The changed fields are passed as a JSON object; columns
+    absent from it keep their value, so unchanged columns are neither rewritten nor logged.
+    Note: Requires MySQL 8.0.4+ for `JSON_TABLE`.
+    """
+    BASE_SQL = '''UPDATE `{db}`.`{table_name}`,
+        JSON_TABLE(`_changes`, '$' COLUMNS ({json_columns})) AS `_changes_table`
+    SET {set_clause}
+    WHERE {where_clause};
+    CALL `{db}`.`{cls_name}_load{load_version}`({load_params});'''
+    _restrictions = {
+        'db': R.STR,
+        'table_name': R.STR,
+        'json_columns': R.STR,
+        'set_clause': R.STR,
+        'where_clause': R.STR,
+        'cls_name': R.STR,
+        'load_version': R.STR,
+        'load_params': R.STR
+        }
+
+    @classmethod
+    def from_db_able(cls, cls_ref: Type[Savable]):
+        """
+        :type cls_ref: Savable
+        :rtype: PartialSaveProcedure
+        """
+        table_name = cls.get_table_name(cls_ref)
+        params = cls_ref._update_fields()
+        return cls({
+            'db': cls_ref.db,
+            'table_name': table_name,
+            'json_columns': ', '.join(
+                '`{param}` {sql_type} PATH \'$.{param}\''.format(
+                    param=param,
+                    sql_type=cls.get_sql_type(cls_ref, param)
+                    )
+                for param in params
+                ),
+            'set_clause': ', '.join(
+                '`{table_name}`.`{param}` = IF(JSON_CONTAINS_PATH(`_changes`, \'one\', \'$.{param}\'), '
+                '{value}, `{table_name}`.`{param}`)'.format(
+                    table_name=table_name,
+                    param=param,
+                    # JSON null in a JSON column is stored as SQL NULL.
+                    value="NULLIF(`_changes_table`.`%s`, CAST('null' AS JSON))" % param
+                    if cls.get_sql_type(cls_ref, param) == 'JSON' else '`_changes_table`.`%s`' % param
+                    )
+                for param in params
+                ),
+            'where_clause': ' AND '.join(
+                '`{table_name}`.`{param}` = `_{param}`'.format(table_name=table_name, param=param)
+                for param in cls_ref.load_params
+                ),
+            'cls_name': cls_ref.__name__,
+            'load_version': cls_ref.load_params.version,
+            'load_params': ', '.join('`_%s`' % param for param in cls_ref.load_params)
+            })
+
+
+class NoEchoPartialSaveProcedure(PartialSaveProcedure):
+    """
+    SQL generator helper for Savable with `partial_save` and `echo_writes = False`. Refer to `NoEchoSaveProcedure`.
+    """
+    BASE_SQL = '''UPDATE `{db}`.`{table_name}`,
+        JSON_TABLE(`_changes`, '$' COLUMNS ({json_columns})) AS `_changes_table`
+    SET {set_clause}
+    WHERE {where_clause};
+    IF `_echo` THEN
+        CALL `{db}`.`{cls_name}_load{load_version}`({load_params});
+    ELSE
+        SELECT ROW_COUNT() AS `saved`;
+    END IF;'''
+
+
+class DeferredJoinListProcedure(PaginatedListProcedure):
+    """
+    SQL generator helper for Paginated, using a deferred join: LIMIT/OFFSET walks only the key columns, ideally within
+    an index, and full rows are read for the page's keys alone. Deep pages then skip rows without reading them.
+    Rows are ordered by the key columns: `load_params` for Loadable implementations, otherwise `id`.
+    Caveats:
+        * The key columns should be the primary key, or a unique index covering the filter columns.
+        * Order by clause will need to be adjusted manually for a different sort, keeping the key columns last
+          for a deterministic order.
+    """
+    PAGE_QUERY = '''SELECT `{table_name}`.* FROM (
+        SELECT {key_columns} FROM `{db}`.`{table_name}`{opt_where_clause}
+        ORDER BY {key_columns} LIMIT {limit} OFFSET `_offset`
+        ) AS `_page_keys`
+    JOIN `{db}`.`{table_name}` USING ({key_columns})
+    ORDER BY {key_columns};'''
+    _restrictions = {
+        'db': R.STR,
+        'table_name': R.STR,
+        'key_columns': R.STR,
+        'opt_where_clause': R.STR.with_default(''),
+        'total_mode': R(*TotalMode.allowed).with_default(TotalMode.EXACT)
+        }
+
+    @classmethod
+    def from_db_able(cls, cls_ref: Type[Paginated]):
+        """
+        :type cls_ref: Paginated
+        :rtype: DeferredJoinListProcedure
+        """
+        data = cls.get_list_data(cls_ref)
+        data['key_columns'] = ', '.join(
+            '`%s`' % param for param in (cls_ref.load_params if Loadable in cls_ref.mro() else ['id'])
+            )
+        return cls(data)
+
+
+class StreamListProcedure(ABCSQL):
+    """
+    SQL generator helper for streaming all rows of a Paginated or Scrollable implementation in a single result set.
+    Caveats:
+        * Order by clause will need to be implemented manually.
+    """
+    BASE_SQL = '''SELECT * FROM `{db}`.`{table_name}`{opt_where_clause};'''
+    _restrictions = {
+        'db': R.STR,
+        'table_name': R.STR,
+        'opt_where_clause': R.STR.with_default('')
+        }
+
+    @classmethod
+    def from_db_able(cls, cls_ref: Type[Union[Paginated, Scrollable]]):
+        """
+        :type cls_ref: Paginated or Scrollable
+        :rtype: StreamListProcedure
+        """
+        where_clause = ' AND '.join('`{param}` = `_{param}`'.format(param=param) for param in cls_ref.stream_params)
+        return cls({
+            'db': cls_ref.db,
+            'table_name': cls.get_table_name(cls_ref),
+            'opt_where_clause': ' WHERE %s' % where_clause if where_clause else ''
+            })
@@ -1,41 +1,14 @@
 """
-Utilities to generate SQL templates to simplify creating Stored Procedures for each mixin implementation.
+Generators of the SQL templates of the Stored Procedures each mixin calls.
 :date_created: 2021-11-20
 """
-from typing import Type, Union
+from typing import Type
 
-import humps
-from do_py import DataObject, R
-from do_py.abc import ABCRestrictions
+from do_py import R
 
 from db_able import Creatable, Deletable, Loadable, Paginated, Savable, Scrollable
-
-
-@ABCRestrictions.require('BASE_SQL', 'from_db_able')
-class ABCSQL(DataObject):
-    """
-    Abstraction for generating MySQL Stored Procedures from DBAble implementations.
-    """
-    _is_abstract_ = True
-
-    @classmethod
-    def get_table_name(
-            cls,
-            cls_ref: Type[Union[Loadable, Creatable, Savable, Deletable, Paginated, Scrollable]]
-            ) -> str:
-        """
-        Decamelize the `cls_ref.__name__` to get a default table name.
-        """
-        table_name = humps.decamelize(cls_ref.__name__)
-        if table_name == cls_ref.__name__:
-            table_name = cls_ref.__name__.lower()
-        return table_name
-
-    def as_sql(self) -> str:
-        """
-        :rtype: str
-        """
-        return self.BASE_SQL.format(**self)
+from db_able.mgmt.const import TotalMode
+from db_able.utils.sql_generator.base import ABCSQL
 
 
 class LoadProcedure(ABCSQL):
@@ -161,19 +134,48 @@ class DeleteProcedure(ABCSQL):
 
 class PaginatedListProcedure(ABCSQL):
     """
-    SQL generator helper for Paginated.
+    SQL generator helper for Paginated. The total is reported according to `cls_ref.total_mode`; every mode but
+    EXACT reads one additional row for `has_more`. Refer to `TotalMode`.
     """
     BASE_SQL = '''DECLARE `_offset` INT;
     DECLARE `_page_number` INT;
     SET `_page_number` = IFNULL(`_page`, 1);
     SET `_offset` = (`_page_number` - 1) * `_limit`;
 
-    SELECT * FROM `{db}`.`{table_name}` {opt_where_clause} LIMIT `_limit` OFFSET `_offset`;
-    SELECT `_page_number` as `page`, COUNT(*) as `total`, `_limit` as `page_size` FROM `{db}`.`{table_name}`;'''
+    {page_query}
+    SELECT `_page_number` as `page`, COUNT(*) as `total`, `_limit` as `page_size`
+    FROM `{db}`.`{table_name}`{opt_where_clause};'''
+    PEEK_SQL = '''DECLARE `_offset` INT;
+    DECLARE `_page_number` INT;
+    DECLARE `_fetch` INT;
+    DECLARE `_total` BIGINT DEFAULT NULL;
+    SET `_page_number` = IFNULL(`_page`, 1);
+    SET `_offset` = (`_page_number` - 1) * `_limit`;
+    SET `_fetch` = `_limit` + 1;{total_query}
+
+    {page_query}
+    SELECT `_page_number` as `page`, `_total` as `total`, `_limit` as `page_size`;'''
+    PAGE_QUERY = '''SELECT * FROM `{db}`.`{table_name}`{opt_where_clause} LIMIT {limit} OFFSET `_offset`;'''
+    COUNT_QUERY = '''SELECT COUNT(*) INTO `_total` FROM `{db}`.`{table_name}`{opt_where_clause};'''
+    TOTAL_QUERIES = {
+        TotalMode.FIRST_PAGE: '''
+    IF `_page_number` = 1 THEN
+        %s
+    END IF;''' % COUNT_QUERY,
+        TotalMode.NONE: '',
+        TotalMode.ESTIMATED: '''
+    SELECT `TABLE_ROWS` INTO `_total` FROM `information_schema`.`TABLES`
+    WHERE `TABLE_SCHEMA` = '{db}' AND `TABLE_NAME` = '{table_name}';''',
+        TotalMode.CACHED: '''
+    IF `_with_total` THEN
+        %s
+    END IF;''' % COUNT_QUERY,
+        }
     _restrictions = {
         'db': R.STR,
         'table_name': R.STR,
-        'opt_where_clause': R.STR.with_default('')
+        'opt_where_clause': R.STR.with_default(''),
+        'total_mode': R(*TotalMode.allowed).with_default(TotalMode.EXACT)
         }
 
     @classmethod
@@ -182,15 +184,38 @@ class PaginatedListProcedure(ABCSQL):
         :type cls_ref: Paginated
         :rtype: PaginatedListProcedure
         """
-        return cls({
+        return cls(cls.get_list_data(cls_ref))
+
+    @classmethod
+    def get_list_data(cls, cls_ref: Type[Paginated]) -> dict:
+        """
+        :type cls_ref: Paginated
+        :return: Data common to the Paginated list procedures.
+        :rtype: dict
+        """
+        where_clause = ' AND '.join(
+            '`{param}` = `_{param}`'.format(param=param)
+            for param in cls_ref.list_params
+            if param not in ['limit', 'page']
+            )
+        return {
             'db': cls_ref.db,
             'table_name': cls.get_table_name(cls_ref),
-            'opt_where_clause': ' AND '.join(
-                '`{param}` = `_{param}`'.format(param=param)
-                for param in cls_ref.list_params
-                if param not in ['limit', 'page']
-                )
-            })
+            'opt_where_clause': ' WHERE %s' % where_clause if where_clause else '',
+            'total_mode': getattr(cls_ref, 'total_mode', TotalMode.EXACT)
+            }
+
+    def as_sql(self) -> str:
+        """
+        :rtype: str
+        """
+        if self.total_mode == TotalMode.EXACT:
+            return self.BASE_SQL.format(page_query=self.PAGE_QUERY.format(limit='`_limit`', **self), **self)
+        return self.PEEK_SQL.format(
+            total_query=self.TOTAL_QUERIES[self.total_mode].format(**self),
+            page_query=self.PAGE_QUERY.format(limit='`_fetch`', **self),
+            **self
+            )
 
 
 class ScrollListProcedure(ABCSQL):
@@ -222,107 +247,3 @@ class ScrollListProcedure(ABCSQL):
                 if param not in ['limit']
                 )
             })
-
-
-procedure_mapping = {
-    'load': LoadProcedure,
-    'create': CreateProcedure,
-    'save': SaveProcedure,
-    'delete': DeleteProcedure,
-    'paginated': PaginatedListProcedure,
-    'scrollable': ScrollListProcedure
-    }
-
-
-class CoreStoredProcedure(ABCSQL):
-    """
-    :restriction params: Should conform to ``` IN `_variable` TYPE ``` syntax.
-    :restriction procedure: The contents of the SP's execution.
-    """
-    BASE_SQL = '''
-USE `{db}`;
-DROP PROCEDURE IF EXISTS `{db}`.`{cls_name}_{method}{version}`;
-
-DELIMITER $$
-CREATE
-    DEFINER = `root`@`localhost` PROCEDURE `{db}`.`{cls_name}_{method}{version}`
-(
-{params}
-)
-BEGIN
-
-    {procedure}
-
-END;
-$$
-DELIMITER ;
-'''
-    _restrictions = {
-        'db': R.STR,
-        'cls_name': R.STR,
-        'method': R('create', 'load', 'save', 'delete', 'list'),
-        'version': R.STR,
-        'params': R.STR,
-        'procedure': R.STR
-        }
-
-    @classmethod
-    def from_db_able(cls, cls_ref: Type[Union[Loadable, Creatable, Savable, Deletable, Paginated, Scrollable]], method,
-                     procedure_key=None):
-        """
-        Creates string representation of SQL file to create a Stored Procedure for given method.
-        :type cls_ref: Creatable or Loadable or Savable or Deletable
-        :type method: str
-        :type procedure_key: str or None
-        :rtype: CoreStoredProcedure
-        """
-        params_attr = getattr(cls_ref, '%s_params' % method)
-        sql_type_mapping = {
-            str(R.INT[0]): 'INT',
-            str(R.NULL_INT[0]): 'INT',
-            str(R.STR[0]): 'VARCHAR(255)',
-            str(R.NULL_STR[0]): 'VARCHAR(255)',
-            str(R.DATETIME[0]): 'TIMESTAMP',
-            str(R.NULL_DATETIME[0]): 'TIMESTAMP',
-            str(R.FLOAT[0]): 'FLOAT',
-            str(R.NULL_FLOAT[0]): 'FLOAT',
-            }
-        return cls({
-            'db': cls_ref.db,
-            'cls_name': cls_ref.__name__,
-            'method': method,
-            'version': params_attr.version,
-            'params': ',\n'.join(
-                '    IN `_%s` %s' % (
-                    param,
-                    sql_type_mapping.get(
-                        str(
-                            cls_ref._restrictions.get(
-                                param,
-                                (cls_ref._extra_restrictions or {}).get(param)
-                                )[0]
-                            )
-                        )
-                    )
-                for param in params_attr
-                ),
-            'procedure': procedure_mapping[procedure_key or method].from_db_able(cls_ref).as_sql()
-            })
-
-
-def print_all_sps(cls_ref):
-    """
-    :type cls_ref: Loadable or Creatable # or Savable or Deletable
-    """
-    if Loadable in cls_ref.mro():
-        print(CoreStoredProcedure.from_db_able(cls_ref, 'load').as_sql())
-    if Creatable in cls_ref.mro():
-        print(CoreStoredProcedure.from_db_able(cls_ref, 'create').as_sql())
-    if Savable in cls_ref.mro():
-        print(CoreStoredProcedure.from_db_able(cls_ref, 'save').as_sql())
-    if Deletable in cls_ref.mro():
-        print(CoreStoredProcedure.from_db_able(cls_ref, 'delete').as_sql())
-    if Paginated in cls_ref.mro():
-        print(CoreStoredProcedure.from_db_able(cls_ref, 'list', procedure_key='paginated').as_sql())
-    if Scrollable in cls_ref.mro():
-        print(CoreStoredProcedure.from_db_able(cls_ref, 'list', procedure_key='scrollable').as_sql())
@@ -37,6 +37,10 @@ setuptools.setup(
         'pymysql>=1',
         'pyhumps>=3',
         ],
+    extras_require={
+        'async': ['aiomysql>=0.1'],
+        'columns': ['numpy>=1.23'],
+        },
     # https://pypi.org/classifiers/
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -3,9 +3,12 @@
 """
 import pytest
 from do_py import R
+from do_py.exceptions import DataObjectError
 
 from db_able import Params
+from db_able.base_model import hydration
 from db_able.base_model.database_abc import Database
+from db_able.mgmt.const import ExecutionMode
 
 
 class DummyDatabase(Database):
@@ -40,5 +43,48 @@ class TestDatabase(object):
         self.class_ref._validate_params(params_attr_name)
         try:
             assert isinstance(getattr(self.class_ref, params_attr_name), Params)
+            assert self.class_ref._kwargs_plans[tuple(getattr(self.class_ref, params_attr_name))].steps == (
+                ('x', R.INT, None),
+                )
         except AssertionError:
             raise MyTestException('pytest exception')
+
+    @pytest.mark.parametrize('attrs, kwargs, expected_output', [
+        ({}, {}, (None, ExecutionMode.SESSION)),
+        ({'engine_key': 'other', 'execution_mode': ExecutionMode.DBAPI}, {}, ('other', ExecutionMode.DBAPI)),
+        ({'execution_mode': ExecutionMode.DBAPI}, {'execution_mode': ExecutionMode.SESSION},
+         (None, ExecutionMode.SESSION)),
+        ])
+    def test_db_client(self, monkeypatch, attrs, kwargs, expected_output):
+        """
+        `_db_client` binds the class's engine and execution settings unless overridden per call.
+        :type monkeypatch: pytest.MonkeyPatch
+        :type attrs: dict
+        :type kwargs: dict
+        :type expected_output: tuple
+        """
+        for key, value in attrs.items():
+            monkeypatch.setattr(self.class_ref, key, value)
+        inst = self.class_ref._db_client('sp', ('x', 1), **kwargs)
+        assert (inst.kwargs['engine_key'], inst.execution_mode) == expected_output
+        assert inst.database == self.class_ref.db
+        assert inst.args == [('x', 1)]
+
+    @pytest.mark.parametrize('trusted_hydration, full_validation', [
+        (True, False),
+        pytest.param(False, False, marks=pytest.mark.xfail(raises=DataObjectError)),
+        pytest.param(True, True, marks=pytest.mark.xfail(raises=DataObjectError)),
+        ])
+    def test_from_row(self, monkeypatch, trusted_hydration, full_validation):
+        """
+        Trusted hydration skips restriction validation unless `DB_FULL_VALIDATION` switches it back on.
+        :type monkeypatch: pytest.MonkeyPatch
+        :type trusted_hydration: bool
+        :type full_validation: bool
+        """
+        monkeypatch.setattr(self.class_ref, 'trusted_hydration', trusted_hydration)
+        monkeypatch.setattr(hydration, 'FULL_VALIDATION', full_validation)
+        inst = self.class_ref._from_row({'x': '1'})
+        assert inst.x == '1'
+        inst._refresh({'x': '2'})
+        assert inst.x == '2'
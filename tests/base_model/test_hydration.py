@@ -0,0 +1,87 @@
+"""
+:date_created: 2026-10-16
+"""
+from datetime import datetime
+
+import pytest
+from do_py import R
+from do_py.data_object.validator import Validator
+from do_py.exceptions import DataObjectError, RestrictionError
+
+from db_able.base_model.hydration import HydrationPlan
+from examples.a import A, Json
+
+ROW = {'id': 1, 'string': 'a', 'json': {'x': 1, 'y': 2}, 'int': 1, 'float': 1.5, 'datetime': datetime(2021, 11, 18)}
+
+
+class Ordered(Validator):
+    """ Validator with cross-field validation. """
+    _restrictions = {
+        'low': R.INT,
+        'high': R.INT
+        }
+
+    def _validate(self):
+        assert self.low <= self.high, 'low must not exceed high.'
+
+
+class TestHydrationPlan(object):
+    class_ref = HydrationPlan
+
+    @pytest.mark.parametrize('row', [
+        ROW,
+        dict(ROW, json='{"x": 1, "y": 2}', datetime='2021-11-18 00:00:00'),
+        dict(ROW, json=b'{"x": 1, "y": 2}', datetime='2021-11-18T00:00:00'),
+        ])
+    def test_hydrate(self, row):
+        """
+        JSON text and datetime text are coerced; nested DataObjects are built from their own plan.
+        :type row: dict
+        """
+        a = self.class_ref.get(A).hydrate(row)
+        assert type(a) is A
+        assert a == A(ROW)
+        assert type(a.json) is Json
+        assert a.json is not ROW['json']
+        a.id = 2
+        assert a.id == 2
+        with pytest.raises(RestrictionError):
+            a.id = 'abc'
+
+    def test_hydrate_trusts_types(self):
+        """
+        Values are not type checked.
+        """
+        assert self.class_ref.get(A).hydrate(dict(ROW, id='1')).id == '1'
+
+    @pytest.mark.parametrize('row', [
+        {'id': 1},
+        dict(ROW, extra=1),
+        ])
+    def test_hydrate_keys(self, row):
+        """
+        Rows that do not match the restrictions are validated in full.
+        :type row: dict
+        """
+        with pytest.raises(DataObjectError):
+            self.class_ref.get(A).hydrate(row)
+
+    def test_hydrate_into(self):
+        a = A(ROW)
+        assert self.class_ref.get(A).hydrate(dict(ROW, string='b', json=None), into=a) is a
+        assert a == A(dict(ROW, string='b', json=None))
+
+    @pytest.mark.parametrize('row', [
+        {'low': 1, 'high': 2},
+        pytest.param({'low': 2, 'high': 1}, marks=pytest.mark.xfail(raises=AssertionError)),
+        ])
+    def test_hydrate_validator(self, row):
+        """
+        `Validator._validate` still runs.
+        :type row: dict
+        """
+        assert self.class_ref.get(Ordered).hydrate(row) == row
+
+    def test_get(self):
+        assert self.class_ref.get(Json) is self.class_ref.get(Json)
+        assert self.class_ref.get(Json).cls_ref is Json
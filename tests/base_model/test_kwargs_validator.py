@@ -3,9 +3,9 @@
 """
 import pytest
 from do_py import R
-from do_py.exceptions import DataObjectError
+from do_py.exceptions import DataObjectError, RestrictionError
 
-from db_able.base_model.kwargs_validator import KwargsValidator
+from db_able.base_model.kwargs_validator import KwargsPlan, KwargsValidator
 
 
 class DummyKwargsValidator(KwargsValidator):
@@ -64,3 +64,38 @@ class TestKwargsValidator(object):
         :type expected_output: list of tuple
         """
         assert expected_output == self.class_ref.kwargs_validator(*signature, **kwargs)
+
+    @pytest.mark.parametrize('signature, kwargs, expected_output', [
+        (['x', 'y'], {'x': 1}, [('x', 1), ('y', 5)]),
+        pytest.param(['x'], {'x': 'abc'}, [], marks=pytest.mark.xfail(raises=DataObjectError)),
+        pytest.param(['z'], {}, [], marks=pytest.mark.xfail(raises=KeyError)),
+        ])
+    def test_compile_kwargs_plan(self, signature, kwargs, expected_output):
+        """
+        Compiled plans are reused by `kwargs_validator` for the same signature.
+        :type signature: list
+        :type kwargs: dict
+        :type expected_output: list of tuple
+        """
+        plan = self.class_ref.compile_kwargs_plan(*signature)
+        assert isinstance(plan, KwargsPlan)
+        assert self.class_ref._kwargs_plans[tuple(signature)] is plan
+        assert expected_output == plan.validate(kwargs) == self.class_ref.kwargs_validator(*signature, **kwargs)
+
+    def test_kwargs_plan_unattributed_error(self):
+        """
+        A `RestrictionError` that no argument reproduces on its own is re-raised rather than swallowed.
+        """
+        calls = []
+
+        def flaky(value):
+            calls.append(value)
+            if len(calls) == 1:
+                raise RestrictionError.bad_data(value, 'a second call')
+            return value
+
+        plan = KwargsPlan(self.class_ref, ['x'])
+        plan.steps = (('x', flaky, None),)
+        with pytest.raises(RestrictionError):
+            plan.validate({'x': 1})
+        assert calls == [1, 1]
@@ -0,0 +1,398 @@
+"""
+In-memory stand-in for a pymysql connection, for UTs and benchmarks that run without a MySQL server.
+Stored procedures are registered as Python callables returning a list of `ResultSet`.
+:date_created: 2026-10-16
+"""
+import re
+
+from pymysql.constants import FIELD_TYPE
+from sqlalchemy import create_engine
+
+CALL_RE = re.compile(r'CALL `(?P<database>[^`]+)`\.`(?P<stored_procedure>[^`]+)`\((?P<args>.*)\);?', re.DOTALL)
+
+
+class ResultSet(object):
+    """
+    A single result set, as returned by a stored procedure.
+    """
+
+    def __init__(self, columns, rows):
+        """
+        :param columns: list of 2-tuple; (column name, pymysql FIELD_TYPE)
+        :type rows: list of tuple
+        """
+        self.description = tuple((name, field_type, None, None, None, None, True) for name, field_type in columns)
+        self.rows = rows
+
+    @classmethod
+    def from_dicts(cls, rows, types=None):
+        """
+        Build a result set from a list of dicts. Column types default to `FIELD_TYPE.VAR_STRING`.
+        :type rows: list of dict
+        :param types: dict; {column name: pymysql FIELD_TYPE}
+        :rtype: ResultSet
+        """
+        types = types or {}
+        names = list(rows[0]) if rows else list(types)
+        return cls(
+            [(name, types.get(name, FIELD_TYPE.VAR_STRING)) for name in names],
+            [tuple(row[name] for name in names) for row in rows]
+            )
+
+
+# Responses to the queries issued by SQLAlchemy's MySQL dialect on first connect.
+DIALECT_RESPONSES = [
+    ('isolation', ResultSet([('isolation', FIELD_TYPE.VAR_STRING)], [('REPEATABLE-READ',)])),
+    ('version', ResultSet([('version', FIELD_TYPE.VAR_STRING)], [('8.0.30',)])),
+    ('database()', ResultSet([('database', FIELD_TYPE.VAR_STRING)], [(None,)])),
+    ('lower_case_table_names', ResultSet(
+        [('Variable_name', FIELD_TYPE.VAR_STRING), ('Value', FIELD_TYPE.VAR_STRING)],
+        [('lower_case_table_names', '0')]
+        )),
+    ('sql_mode', ResultSet(
+        [('Variable_name', FIELD_TYPE.VAR_STRING), ('Value', FIELD_TYPE.VAR_STRING)],
+        [('sql_mode', 'TRADITIONAL')]
+        )),
+    ]
+
+
+class MockCursor(object):
+    """
+    Implements the subset of `pymysql.cursors.Cursor` used by SQLAlchemy and DBClient.
+    """
+    rowcount = 0
+    lastrowid = None
+    arraysize = 1
+
+    def __init__(self, connection, cursor_cls=None):
+        """
+        :type connection: MockConnection
+        :param cursor_cls: pymysql cursor class requested by the caller.
+        """
+        self.connection = connection
+        self.cursor_cls = cursor_cls
+        self.result_sets = []
+        self.description = None
+        self.rows = []
+        self.position = 0
+        self.closed = False
+
+    def execute(self, query, args=None):
+        """
+        :type query: str
+        :type args: list or tuple or dict or None
+        :rtype: int
+        """
+        self.connection.queries.append((query, args))
+        match = CALL_RE.match(query.strip())
+        if match:
+            self.result_sets = list(self.connection.database.call(
+                match.group('database'),
+                match.group('stored_procedure'),
+                self._args(match.group('args'), args)
+                ))
+        else:
+            lowered = query.lower()
+            self.result_sets = [
+                result_set for key, result_set in DIALECT_RESPONSES if key in lowered
+                ][:1]
+        self._load(self.result_sets.pop(0) if self.result_sets else None)
+        return self.rowcount
+
+    @staticmethod
+    def _args(placeholders, args):
+        """
+        Normalize pyformat (dict) or format (sequence) parameters to a positional list.
+        :type placeholders: str
+        :type args: list or tuple or dict or None
+        :rtype: list
+        """
+        if isinstance(args, dict):
+            return [args[name] for name in re.findall(r'%\((\w+)\)s', placeholders)]
+        return list(args or [])
+
+    def _load(self, result_set):
+        """
+        :type result_set: ResultSet or None
+        """
+        if result_set is None:
+            self.description = None
+            self.rows = []
+        else:
+            self.description = result_set.description
+            self.rows = result_set.rows
+        self.position = 0
+        self.rowcount = len(self.rows)
+
+    def fetchone(self):
+        """
+        :rtype: tuple or None
+        """
+        if self.position >= len(self.rows):
+            return None
+        self.position += 1
+        return self.rows[self.position - 1]
+
+    def fetchmany(self, size=None):
+        """
+        :type size: int or None
+        :rtype: list of tuple
+        """
+        size = size or self.arraysize
+        rows = self.rows[self.position:self.position + size]
+        self.position += len(rows)
+        return rows
+
+    def fetchall(self):
+        """
+        :rtype: list of tuple
+        """
+        rows = self.rows[self.position:]
+        self.position = len(self.rows)
+        return rows
+
+    def nextset(self):
+        """
+        :rtype: bool or None
+        """
+        if not self.result_sets:
+            self._load(None)
+            return None
+        self._load(self.result_sets.pop(0))
+        return True
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self):
+        """ Close the cursor. """
+        self.closed = True
+
+
+class MockConnection(object):
+    """
+    Implements the subset of `pymysql.connections.Connection` used by SQLAlchemy and DBClient.
+    """
+
+    def __init__(self, database):
+        """
+        :type database: MockDatabase
+        """
+        self.database = database
+        self.queries = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.cursors = []
+        self.open = True
+
+    def cursor(self, cursor=None):
+        """
+        :param cursor: Cursor class; recorded for assertions.
+        :rtype: MockCursor
+        """
+        cursor = MockCursor(self, cursor_cls=cursor)
+        self.cursors.append(cursor)
+        return cursor
+
+    def commit(self):
+        """ Track commits. """
+        self.commits += 1
+        self.database.commits += 1
+
+    def rollback(self):
+        """ Track rollbacks. """
+        self.rollbacks += 1
+
+    def close(self):
+        """ Close the connection. """
+        self.open = False
+
+    def ping(self, reconnect=False):
+        """
+        :rtype: bool
+        """
+        return True
+
+    def get_server_info(self):
+        """
+        :rtype: str
+        """
+        return '8.0.30'
+
+    def character_set_name(self):
+        """
+        :rtype: str
+        """
+        return 'utf8mb4'
+
+
+class AsyncMockCursor(object):
+    """
+    Implements the subset of `aiomysql.Cursor` used by AsyncDBClient, over a `MockCursor`.
+    """
+
+    def __init__(self, cursor):
+        """
+        :type cursor: MockCursor
+        """
+        self.cursor = cursor
+
+    @property
+    def description(self):
+        """
+        :rtype: tuple or None
+        """
+        return self.cursor.description
+
+    async def execute(self, query, args=None):
+        """
+        :type query: str
+        :type args: list or tuple or dict or None
+        :rtype: int
+        """
+        return self.cursor.execute(query, args)
+
+    async def fetchall(self):
+        """
+        :rtype: list of tuple
+        """
+        return self.cursor.fetchall()
+
+    async def nextset(self):
+        """
+        :rtype: bool or None
+        """
+        return self.cursor.nextset()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.cursor.close()
+
+
+class AsyncMockConnection(object):
+    """
+    Implements the subset of `aiomysql.Connection` used by AsyncDBClient, over a `MockConnection`.
+    """
+
+    def __init__(self, connection):
+        """
+        :type connection: MockConnection
+        """
+        self.connection = connection
+
+    def cursor(self):
+        """
+        :rtype: AsyncMockCursor
+        """
+        return AsyncMockCursor(self.connection.cursor())
+
+    async def commit(self):
+        """ Track commits. """
+        self.connection.commit()
+
+    async def rollback(self):
+        """ Track rollbacks. """
+        self.connection.rollback()
+
+    async def ping(self, reconnect=False):
+        """
+        :rtype: bool
+        """
+        return self.connection.ping(reconnect=reconnect)
+
+
+class AsyncMockPool(object):
+    """
+    Implements the subset of `aiomysql.Pool` used by AsyncEngineRegistry, recycling `AsyncMockConnection`.
+    """
+
+    def __init__(self, database):
+        """
+        :type database: MockDatabase
+        """
+        self.database = database
+        self.free = []
+        self.used = set()
+        self.closed = False
+
+    async def acquire(self):
+        """
+        :rtype: AsyncMockConnection
+        """
+        conn = self.free.pop() if self.free else AsyncMockConnection(self.database.connect())
+        self.used.add(conn)
+        return conn
+
+    async def release(self, conn):
+        """
+        :type conn: AsyncMockConnection
+        """
+        self.used.remove(conn)
+        self.free.append(conn)
+
+    def close(self):
+        """ Close the pool. """
+        self.closed = True
+
+    async def wait_closed(self):
+        """ Wait for the pool to close. """
+
+
+class MockDatabase(object):
+    """
+    Registry of mocked stored procedures and factory for SQLAlchemy engines backed by `MockConnection`.
+
+    Example:
+        >>> db = MockDatabase()
+        >>> db.register('testing', 'A_load', lambda _id: [ResultSet.from_dicts([{'id': _id}])])
+        >>> EngineRegistry.register_engine('testing', db.engine())
+    """
+
+    def __init__(self):
+        self.procedures = {}
+        self.connections = []
+        self.calls = []
+        self.commits = 0
+
+    def register(self, database, stored_procedure, procedure):
+        """
+        :type database: str
+        :type stored_procedure: str
+        :param procedure: callable; Accepts the positional SP arguments and returns a list of `ResultSet`.
+        """
+        self.procedures[(database, stored_procedure)] = procedure
+
+    def call(self, database, stored_procedure, args):
+        """
+        :type database: str
+        :type stored_procedure: str
+        :type args: list
+        :rtype: list of ResultSet
+        """
+        self.calls.append((database, stored_procedure, args))
+        return self.procedures[(database, stored_procedure)](*args)
+
+    def connect(self):
+        """
+        DBAPI `connect` replacement for use as a SQLAlchemy `creator`.
+        :rtype: MockConnection
+        """
+        connection = MockConnection(self)
+        self.connections.append(connection)
+        return connection
+
+    def engine(self, **kwargs):
+        """
+        :param kwargs: Keyword arguments for `sqlalchemy.create_engine`.
+        :rtype: sqlalchemy.engine.base.Engine
+        """
+        return create_engine('mysql+pymysql://', creator=self.connect, **kwargs)
+
+    def pool(self):
+        """
+        aiomysql pool replacement for use with `AsyncEngineRegistry.register_pool`.
+        :rtype: AsyncMockPool
+        """
+        return AsyncMockPool(self)
@@ -0,0 +1,81 @@
+/**
+    Stored procedure to create many of the testing `A` DataObject, by a JSON array of rows.
+    Reading `_last_id` opens the read view before inserting, so only the inserted rows are visible past it.
+    :date_created: 2026-10-16
+ */
+
+USE `testing`;
+DROP PROCEDURE IF EXISTS `testing`.`A_create_many`;
+
+DELIMITER $$
+CREATE
+    DEFINER = `root`@`localhost` PROCEDURE `testing`.`A_create_many`
+(
+    IN `_rows` JSON,
+    IN `_echo` BOOL
+)
+BEGIN
+
+    DECLARE `_last_id` BIGINT;
+
+    SELECT
+        COALESCE(MAX(`id`), 0)
+    INTO
+        `_last_id`
+    FROM
+        `testing`.`a`;
+
+    INSERT INTO
+        `testing`.`a`
+        (
+            `string`,
+            `json`,
+            `int`,
+            `float`,
+            `datetime`
+        )
+    SELECT
+        `string`,
+        NULLIF(`json`, CAST('null' AS JSON)),
+        `int`,
+        `float`,
+        `datetime`
+    FROM
+        JSON_TABLE(
+            `_rows`,
+            '$[*]' COLUMNS (
+                `_ordinality` FOR ORDINALITY,
+                `string` VARCHAR(45) PATH '$.string',
+                `json` JSON PATH '$.json',
+                `int` INT PATH '$.int',
+                `float` FLOAT PATH '$.float',
+                `datetime` TIMESTAMP PATH '$.datetime'
+            )
+        ) AS `_row`
+    ORDER BY `_ordinality`;
+
+    IF (SELECT COUNT(*) FROM `testing`.`a` WHERE `id` > `_last_id`) <> JSON_LENGTH(`_rows`) THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Rows of concurrent sessions are visible; use REPEATABLE READ.';
+    END IF;
+
+    IF `_echo` THEN
+        SELECT
+            *
+        FROM
+            `testing`.`a`
+        WHERE
+            `id` > `_last_id`
+        ORDER BY `id`;
+    ELSE
+        SELECT
+            `id`
+        FROM
+            `testing`.`a`
+        WHERE
+            `id` > `_last_id`
+        ORDER BY `id`;
+    END IF;
+
+END;
+$$
+DELIMITER ;
@@ -0,0 +1,24 @@
+/**
+    Stored procedure to load many of the testing `A` DataObject, by a JSON array of keys, i.e. '[{"id": 1}]'.
+    :date_created: 2026-10-16
+ */
+
+USE `testing`;
+DROP PROCEDURE IF EXISTS `testing`.`A_load_many`;
+
+DELIMITER $$
+CREATE
+    DEFINER = `root`@`localhost` PROCEDURE `testing`.`A_load_many`
+(
+    IN `_keys` JSON
+)
+BEGIN
+
+    SELECT `a`.*
+    FROM
+        JSON_TABLE(`_keys`, '$[*]' COLUMNS (`id` INT PATH '$.id')) AS `_keys_table`
+        JOIN `testing`.`a` ON `a`.`id` = `_keys_table`.`id`;
+
+END;
+$$
+DELIMITER ;
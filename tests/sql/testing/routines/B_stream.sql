@@ -0,0 +1,20 @@
+/**
+    Stored procedure to stream out all rows of the B Scrollable implementation.
+    :date_created: 2026-10-16
+ */
+
+USE `testing`;
+DROP PROCEDURE IF EXISTS `testing`.`B_stream`;
+
+DELIMITER $$
+CREATE
+    DEFINER = `root`@`localhost` PROCEDURE `testing`.`B_stream`
+(
+)
+BEGIN
+
+    SELECT * FROM `testing`.`b` ORDER BY `id`;
+
+END;
+$$
+DELIMITER ;
@@ -0,0 +1,20 @@
+/**
+    Stored procedure to stream out all rows of the C Paginated implementation.
+    :date_created: 2026-10-16
+ */
+
+USE `testing`;
+DROP PROCEDURE IF EXISTS `testing`.`C_stream`;
+
+DELIMITER $$
+CREATE
+    DEFINER = `root`@`localhost` PROCEDURE `testing`.`C_stream`
+(
+)
+BEGIN
+
+    SELECT * FROM `testing`.`c` ORDER BY `id`;
+
+END;
+$$
+DELIMITER ;
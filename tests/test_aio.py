@@ -0,0 +1,213 @@
+"""
+:date_created: 2026-10-16
+"""
+import asyncio
+from collections import namedtuple
+
+import aiomysql
+import pytest
+from pymysql.constants import CLIENT, FIELD_TYPE
+
+from db_able.client import EngineRegistry
+from db_able.client.aio import AsyncDBClient, AsyncEngineRegistry
+from examples.a import A
+from examples.b import B
+from examples.c import C
+from tests.mock_db import ResultSet
+
+ROW = {'id': 1, 'string': 'a', 'json': '{"x": 1, "y": 2}', 'int': 1, 'float': 1.5, 'datetime': None}
+TYPES = {'json': FIELD_TYPE.JSON}
+
+
+def run(coroutine):
+    """
+    :type coroutine: collections.abc.Coroutine
+    """
+    return asyncio.run(coroutine)
+
+
+class TestAsyncEngineRegistry(object):
+    class_ref = AsyncEngineRegistry
+
+    @pytest.fixture(autouse=True)
+    def registry(self, monkeypatch):
+        """
+        Isolate the registries and record `aiomysql.create_pool` calls.
+        :type monkeypatch: pytest.MonkeyPatch
+        :rtype: list of dict
+        """
+        calls = []
+
+        async def create_pool(**kwargs):
+            calls.append(kwargs)
+            return object()
+
+        monkeypatch.setattr(EngineRegistry, '_configs', {})
+        monkeypatch.setattr(EngineRegistry, '_engines', {})
+        monkeypatch.setattr(self.class_ref, '_pools', {})
+        monkeypatch.setattr(aiomysql, 'create_pool', create_pool)
+        return calls
+
+    def test_get(self, registry):
+        """
+        Pools are built from the `PoolConfig` registered for the key and shared with unregistered keys.
+        :type registry: list of dict
+        """
+        EngineRegistry.register(None, conn_str='mysql+pymysql://u:p@db:3307/testing?charset=utf8mb4', pool_size=2)
+        pool = run(self.class_ref.get('testing'))
+        assert run(self.class_ref.get()) is pool
+        assert registry == [{
+            'host': 'db',
+            'port': 3307,
+            'user': 'u',
+            'password': 'p',
+            'db': 'testing',
+            'maxsize': 12,
+            'pool_recycle': -1,
+            'autocommit': False,
+            'client_flag': CLIENT.FOUND_ROWS,
+            'charset': 'utf8mb4'
+            }]
+
+    def test_register_pool(self, registry):
+        """
+        :type registry: list of dict
+        """
+        pool = object()
+        self.class_ref.register_pool('reporting', pool)
+        assert run(self.class_ref.get('reporting')) is pool
+        assert self.class_ref.has_conn_str('reporting')
+        assert registry == []
+
+
+class TestAsyncDBClient(object):
+    class_ref = AsyncDBClient
+
+    def test_next_set(self, mock_db):
+        """
+        Result sets are decoded with the same semantics as `DBClient`.
+        :type mock_db: tests.mock_db.MockDatabase
+        """
+        mock_db.register('db', 'sp', lambda x: [
+            ResultSet.from_dicts([{'x': x, 'y': '{"a": 1}'}], types={'y': FIELD_TYPE.JSON}),
+            ResultSet.from_dicts([{'total': 1}]),
+            ])
+
+        async def call():
+            async with self.class_ref('db', 'sp', ('x', 1)) as conn:
+                assert conn.data == [{'x': 1, 'y': {'a': 1}}]
+                assert conn.next_set()
+                assert conn.data == [{'total': 1}]
+                assert not conn.next_set()
+                assert conn.data == []
+
+        run(call())
+        assert mock_db.calls == [('db', 'sp', [1])]
+        assert mock_db.commits == 1
+
+    @pytest.mark.parametrize('rollback, commits', [(True, 0), (False, 1)])
+    def test_rollback(self, mock_db, rollback, commits):
+        """
+        :type mock_db: tests.mock_db.MockDatabase
+        :type rollback: bool
+        :type commits: int
+        """
+        mock_db.register('db', 'sp', lambda: [ResultSet.from_dicts([{'x': 1}])])
+
+        async def call():
+            async with self.class_ref('db', 'sp', rollback=rollback):
+                raise ValueError('rollback')
+
+        with pytest.raises(ValueError):
+            run(call())
+        assert mock_db.commits == commits
+
+    def test_enter_failure(self, mock_db):
+        """
+        A call whose result fails to decode is rolled back and its connection released to the pool.
+        :type mock_db: tests.mock_db.MockDatabase
+        """
+        mock_db.register('db', 'sp', lambda: [ResultSet.from_dicts([{'x': 1}])])
+
+        async def call():
+            async with self.class_ref('db', 'sp', row_type=namedtuple('Row', ['y'])):
+                pass
+
+        with pytest.raises(AssertionError):
+            run(call())
+        pool = run(AsyncEngineRegistry.get('db'))
+        assert not pool.used and len(pool.free) == 1
+        assert mock_db.connections[0].rollbacks == 1 and not mock_db.commits
+
+    def test_shared_pool(self, mock_db):
+        """
+        Concurrent calls check connections out of the pool and return them for reuse.
+        :type mock_db: tests.mock_db.MockDatabase
+        """
+        mock_db.register('db', 'sp', lambda x: [ResultSet.from_dicts([{'x': x}])])
+
+        async def call(x):
+            async with self.class_ref('db', 'sp', ('x', x)) as conn:
+                await asyncio.sleep(0)
+                return conn.data[0]['x']
+
+        async def gather():
+            return await asyncio.gather(*[call(x) for x in range(20)])
+
+        assert run(gather()) == list(range(20))
+        connections = len(mock_db.connections)
+        assert run(gather()) == list(range(20))
+        assert len(mock_db.connections) == connections
+        assert mock_db.commits == 40
+
+
+def test_crud(mock_db):
+    """
+    Async variants of the CRUD mixin methods.
+    :type mock_db: tests.mock_db.MockDatabase
+    """
+    mock_db.register('testing', 'A_load', lambda _id: [ResultSet.from_dicts([dict(ROW, id=_id)], types=TYPES)])
+    mock_db.register('testing', 'A_create', lambda *args: [ResultSet.from_dicts([ROW], types=TYPES)])
+    mock_db.register('testing', 'A_save', lambda _id, *args: [
+        ResultSet.from_dicts([dict(ROW, id=_id, string=args[0])], types=TYPES)
+        ])
+    mock_db.register('testing', 'A_delete', lambda _id: [ResultSet.from_dicts([{'deleted': 1}])])
+
+    async def crud():
+        created = await A.acreate(string='a', json={'x': 1, 'y': 2}, int=1, float=1.5, datetime=None)
+        assert created == A(dict(ROW, json={'x': 1, 'y': 2}))
+        assert await A.aload(id=1) == created
+        created.string = 'b'
+        assert await created.asave()
+        assert created.string == 'b'
+        assert await created.adelete()
+
+    run(crud())
+    assert [call[1] for call in mock_db.calls] == ['A_create', 'A_load', 'A_save', 'A_delete']
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_listable(mock_db, cls_ref):
+    """
+    `alist` and `ayield_all` page through the same stored procedure calls as `list` and `yield_all`.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type cls_ref: type[B or C]
+    """
+    rows = [{'id': i, 'x': i, 'y': i} for i in range(1, 12)]
+    mock_db.register('testing', 'B_list', lambda limit, after: [
+        ResultSet.from_dicts([row for row in rows if row['id'] > (after or 0)][:limit])
+        ])
+    mock_db.register('testing', 'C_list', lambda limit, page: [
+        ResultSet.from_dicts(rows[(page - 1) * limit:page * limit]),
+        ResultSet.from_dicts([{'page': page, 'total': len(rows), 'page_size': limit}])
+        ])
+
+    async def yield_all():
+        assert (await cls_ref.alist(limit=5)) == cls_ref.list(limit=5)
+        return [datum async for datum in cls_ref.ayield_all(limit=5)]
+
+    expected = list(cls_ref.yield_all(limit=5))
+    calls = list(mock_db.calls)
+    del mock_db.calls[:]
+    assert run(yield_all()) == expected
+    assert mock_db.calls == calls[:1] * 2 + calls  # `alist` and `list` of the first page, then `ayield_all`.
@@ -1,12 +1,19 @@
 """
 :date_created: 2021-11-20
 """
+from collections import namedtuple
+
 import pytest
+from do_py.exceptions import DataObjectError
 from pymysql.constants import FIELD_TYPE
+from pymysql.cursors import SSCursor
 from sqlalchemy import text
 
 from db_able import client
-from db_able.client import Data, Args, DBClient
+from db_able.client import Data, Args, DBClient, EngineRegistry, Transaction
+from db_able.mgmt.const import ExecutionMode
+from db_able.utils.cache import CacheInfo, LRUCache
+from tests.mock_db import ResultSet
 
 
 class DummyObject(object):
@@ -63,6 +70,112 @@ class TestArgs(object):
         assert obj.args == expected_output
 
 
+class TestEngineRegistry(object):
+    """
+    Test the per-database engine registry, EngineRegistry.
+    """
+    class_ref = EngineRegistry
+
+    @pytest.fixture(autouse=True)
+    def registry(self, monkeypatch):
+        """
+        Isolate registrations and capture `create_engine` calls.
+        :type monkeypatch: pytest.MonkeyPatch
+        :rtype: list of tuple
+        """
+        calls = []
+
+        def create_engine(conn_str, **kwargs):
+            calls.append((conn_str, kwargs))
+            return DummyEngine(conn_str)
+
+        monkeypatch.setattr(self.class_ref, '_configs', {})
+        monkeypatch.setattr(self.class_ref, '_engines', {})
+        monkeypatch.setattr('db_able.client.registry.create_engine', create_engine)
+        return calls
+
+    def test_default_engine(self, registry):
+        """
+        Unregistered keys share the default engine built from `CONN_STR`.
+        """
+        assert self.class_ref.get('db1') is self.class_ref.get('db2') is self.class_ref.get()
+        assert registry == [(client.CONN_STR, {
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_timeout': 30,
+            'pool_recycle': -1,
+            'pool_pre_ping': False
+            })]
+
+    def test_register(self, registry):
+        """
+        Registered keys get their own engine and pool settings.
+        """
+        self.class_ref.register('db1', conn_str='mysql+pymysql://other', pool_size=20, pool_pre_ping=True)
+        assert self.class_ref.get('db1') is not self.class_ref.get('db2')
+        assert registry[0] == ('mysql+pymysql://other', {
+            'pool_size': 20,
+            'max_overflow': 10,
+            'pool_timeout': 30,
+            'pool_recycle': -1,
+            'pool_pre_ping': True
+            })
+
+    def test_register_disposes_engine(self):
+        """
+        Re-registering a key replaces its engine.
+        """
+        self.class_ref.register('db1', pool_size=2)
+        engine = self.class_ref.get('db1')
+        self.class_ref.register('db1', pool_size=1)
+        assert engine.disposed
+        assert self.class_ref.get('db1') is not engine
+
+    def test_register_engine(self):
+        """
+        Pre-built engines are used as-is.
+        """
+        engine = DummyEngine('mysql+pymysql://prebuilt')
+        self.class_ref.register_engine('db1', engine)
+        assert self.class_ref.get('db1') is engine
+        assert DBClient('db2', 'sp', engine_key='db1').engine is engine
+
+    def test_dispose(self):
+        """
+        `dispose` drops every engine; the next `get` rebuilds it.
+        """
+        engine = self.class_ref.get()
+        self.class_ref.dispose()
+        assert engine.disposed
+        assert self.class_ref.get() is not engine
+
+    @pytest.mark.parametrize('kwargs', [
+        {'pool_size': 1, 'pool_recycle': 3600},
+        pytest.param({'pool_size': 'abc'}, marks=pytest.mark.xfail(raises=DataObjectError)),
+        pytest.param({'invalid': 1}, marks=pytest.mark.xfail(raises=DataObjectError)),
+        ])
+    def test_register_validation(self, kwargs):
+        """
+        :type kwargs: dict
+        """
+        self.class_ref.register('db1', **kwargs)
+
+
+class DummyEngine(object):
+    """ Dummy engine for use with EngineRegistry. """
+
+    def __init__(self, url):
+        """
+        :type url: str
+        """
+        self.url = url
+        self.disposed = False
+
+    def dispose(self):
+        """ Track disposal. """
+        self.disposed = True
+
+
 # TODO: conn, session, __enter__, __exit__; kwarg `rollback` functionality
 class TestDBClient(object):
     """
@@ -110,3 +223,210 @@ class TestDBClient(object):
         """
         inst = self.class_ref('db', 'sp', *args)
         assert inst.sql.text == expected_output
+
+    def test_call_sql_property(self):
+        """
+        `call_sql` uses pymysql's positional paramstyle.
+        """
+        inst = self.class_ref('db', 'sp', ('x', 1), ('y', 2))
+        assert inst.call_sql == 'CALL `db`.`sp`(%s,%s);'
+
+    def test_statement_cache(self, monkeypatch):
+        """
+        Statements are compiled once per (database, stored_procedure, argument names).
+        :type monkeypatch: pytest.MonkeyPatch
+        """
+        monkeypatch.setattr(self.class_ref, 'statement_cache', LRUCache(maxsize=2))
+        inst = self.class_ref('db', 'sp', ('x', 1), ('y', 2))
+        assert self.class_ref('db', 'sp', ('x', 3), ('y', 4)).sql is inst.sql
+        assert self.class_ref('db', 'sp', ('x', 3)).sql is not inst.sql
+        assert self.class_ref.statement_cache.info() == CacheInfo({
+            'hits': 1, 'misses': 2, 'evictions': 0, 'expirations': 0, 'size': 2, 'maxsize': 2, 'ttl': None
+            })
+
+    @pytest.mark.parametrize('execution_mode', [
+        ExecutionMode.SESSION,
+        ExecutionMode.DBAPI,
+        pytest.param('invalid', marks=pytest.mark.xfail(raises=AssertionError)),
+        ])
+    def test_execution_mode(self, mock_db, execution_mode):
+        """
+        Both execution modes call the SP with the same arguments and read every result set.
+        :type mock_db: tests.mock_db.MockDatabase
+        :type execution_mode: str
+        """
+        mock_db.register('db', 'sp', lambda x, y: [
+            ResultSet.from_dicts([{'x': x, 'y': y}], types={'y': FIELD_TYPE.JSON}),
+            ResultSet.from_dicts([{'total': 1}]),
+            ])
+        with self.class_ref('db', 'sp', ('x', 1), ('y', {'a': 1}), execution_mode=execution_mode) as conn:
+            assert conn.data == [{'x': 1, 'y': {'a': 1}}]
+            assert conn.next_set()
+            assert conn.data == [{'total': 1}]
+        assert mock_db.calls == [('db', 'sp', [1, '{"a": 1}'])]
+        assert mock_db.commits == 1
+
+    @pytest.mark.parametrize('execution_mode', [ExecutionMode.SESSION, ExecutionMode.DBAPI])
+    @pytest.mark.parametrize('rollback, commits', [(True, 0), (False, 1)])
+    def test_rollback(self, mock_db, execution_mode, rollback, commits):
+        """
+        Exceptions raised within the context only skip the commit with `rollback=True`.
+        :type mock_db: tests.mock_db.MockDatabase
+        :type execution_mode: str
+        :type rollback: bool
+        :type commits: int
+        """
+        mock_db.register('db', 'sp', lambda: [ResultSet.from_dicts([{'x': 1}])])
+        with pytest.raises(ValueError):
+            with self.class_ref('db', 'sp', rollback=rollback, execution_mode=execution_mode):
+                raise ValueError('rollback')
+        assert mock_db.commits == commits
+
+
+    @pytest.mark.parametrize('execution_mode', [ExecutionMode.SESSION, ExecutionMode.DBAPI])
+    def test_enter_failure(self, mock_db, execution_mode):
+        """
+        A call whose result fails to decode is rolled back and its connection returned to the pool.
+        :type mock_db: tests.mock_db.MockDatabase
+        :type execution_mode: str
+        """
+        mock_db.register('db', 'sp', lambda: [ResultSet.from_dicts([{'x': 1}])])
+        with pytest.raises(AssertionError):
+            with self.class_ref('db', 'sp', row_type=namedtuple('Row', ['y']), execution_mode=execution_mode):
+                pass
+        [connection] = mock_db.connections
+        assert connection.rollbacks and not mock_db.commits
+        assert EngineRegistry.get('db').pool.checkedout() == 0
+
+    def test_stream(self, mock_db):
+        """
+        Streaming reads rows through an unbuffered cursor and skips result sets that were not consumed.
+        :type mock_db: tests.mock_db.MockDatabase
+        """
+        mock_db.register('db', 'sp', lambda: [
+            ResultSet.from_dicts([{'x': 1, 'y': '{"a": 1}'}, {'x': 2, 'y': None}], types={'y': FIELD_TYPE.JSON}),
+            ResultSet.from_dicts([{'x': 3}, {'x': 4}]),
+            ResultSet.from_dicts([{'total': 4}]),
+            ])
+        with self.class_ref('db', 'sp', stream=True) as conn:
+            assert conn.execution_mode == ExecutionMode.DBAPI
+            assert conn.data == []
+            assert list(conn.iter_data()) == [{'x': 1, 'y': {'a': 1}}, {'x': 2, 'y': None}]
+            assert conn.next_set()
+            assert conn.next_set()
+            assert list(conn.iter_data()) == [{'total': 4}]
+            assert not conn.next_set()
+        [connection] = mock_db.connections
+        assert connection.cursors[-1].cursor_cls is SSCursor
+        assert connection.cursors[-1].closed
+        assert mock_db.commits == 1
+
+
+class TestTransaction(object):
+    """
+    Test the unit-of-work context, Transaction.
+    """
+    class_ref = Transaction
+
+    @pytest.fixture
+    def mock_db(self, mock_db):
+        """
+        :type mock_db: tests.mock_db.MockDatabase
+        :rtype: tests.mock_db.MockDatabase
+        """
+        mock_db.register('db', 'sp', lambda x: [ResultSet.from_dicts([{'x': x}])])
+        return mock_db
+
+    @staticmethod
+    def call(x, **kwargs):
+        """
+        :type x: int
+        :rtype: list of dict
+        """
+        with DBClient('db', 'sp', ('x', x), **kwargs) as conn:
+            return conn.data
+
+    @pytest.mark.parametrize('execution_mode', [ExecutionMode.SESSION, ExecutionMode.DBAPI])
+    def test_shared_connection(self, mock_db, execution_mode):
+        """
+        Calls within the context share one connection and one COMMIT.
+        :type mock_db: tests.mock_db.MockDatabase
+        :type execution_mode: str
+        """
+        with self.class_ref():
+            for x in range(3):
+                assert self.call(x, execution_mode=execution_mode) == [{'x': x}]
+            assert mock_db.commits == 0
+        assert mock_db.commits == 1
+        assert len([query for query, _ in mock_db.connections[-1].queries if query.startswith('CALL')]) == 3
+
+    @pytest.mark.parametrize('rollback, commits', [(True, 0), (False, 1)])
+    def test_rollback(self, mock_db, rollback, commits):
+        """
+        :type mock_db: tests.mock_db.MockDatabase
+        :type rollback: bool
+        :type commits: int
+        """
+        with pytest.raises(ValueError):
+            with self.class_ref(rollback=rollback):
+                self.call(1)
+                raise ValueError('rollback')
+        assert mock_db.commits == commits
+
+    def test_rollback_only(self, mock_db):
+        """
+        A failed `rollback=True` call rolls back the unit of work even if the exception is handled.
+        :type mock_db: tests.mock_db.MockDatabase
+        """
+        with self.class_ref():
+            self.call(1)
+            try:
+                with DBClient('db', 'sp', ('x', 2), rollback=True):
+                    raise ValueError('rollback')
+            except ValueError:
+                pass
+        assert mock_db.commits == 0
+
+    def test_nested(self, mock_db):
+        """
+        Nested contexts join the outermost unit of work.
+        :type mock_db: tests.mock_db.MockDatabase
+        """
+        with self.class_ref() as outer:
+            with self.class_ref() as inner:
+                assert inner is outer
+                self.call(1)
+            assert self.class_ref.current() is outer
+            assert mock_db.commits == 0
+            self.call(2)
+        assert self.class_ref.current() is None
+        assert mock_db.commits == 1
+
+    def test_reentered(self, mock_db):
+        """
+        Entering the same instance again joins its unit of work; only the outermost exit commits.
+        :type mock_db: tests.mock_db.MockDatabase
+        """
+        transaction = self.class_ref()
+        with transaction:
+            with transaction:
+                self.call(1)
+            assert self.class_ref.current() is transaction
+            assert mock_db.commits == 0
+            self.call(2)
+        assert self.class_ref.current() is None
+        assert mock_db.commits == 1
+        assert len(mock_db.connections) == 1
+
+    def test_decorator(self, mock_db):
+        """
+        :type mock_db: tests.mock_db.MockDatabase
+        """
+        @self.class_ref()
+        def handler():
+            assert self.class_ref.current() is not None
+            return [self.call(x) for x in range(2)]
+
+        assert handler() == [[{'x': 0}], [{'x': 1}]]
+        assert handler() == [[{'x': 0}], [{'x': 1}]]
+        assert mock_db.commits == 2
@@ -0,0 +1,134 @@
+"""
+:date_created: 2026-10-16
+"""
+from collections import namedtuple
+from datetime import date, datetime
+
+import pytest
+from pymysql.constants import FIELD_TYPE
+
+from db_able import client
+from db_able.client.codec import DecodedRows, JSONCodec, OrjsonCodec, RowDecoder, UjsonCodec, codecs, get_codec
+
+DESCRIPTION = (
+    ('id', FIELD_TYPE.LONG, None, None, None, None, True),
+    ('json', FIELD_TYPE.JSON, None, None, None, None, True),
+    )
+
+
+def installed(name):
+    """
+    :type name: str
+    :rtype: bool
+    """
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize('name', [
+    'json',
+    pytest.param('orjson', marks=pytest.mark.skipif(not installed('orjson'), reason='orjson is not installed')),
+    pytest.param('ujson', marks=pytest.mark.skipif(not installed('ujson'), reason='ujson is not installed')),
+    pytest.param('invalid', marks=pytest.mark.xfail(raises=AssertionError)),
+    ])
+def test_get_codec(name):
+    """
+    Every codec round-trips JSON column values.
+    :type name: str
+    """
+    codec = get_codec(name)
+    assert isinstance(codec, codecs[name])
+    dumped = codec.dumps({'x': [1, 2]})
+    assert isinstance(dumped, str)
+    assert codec.loads(dumped) == {'x': [1, 2]}
+
+
+@pytest.mark.parametrize('value, expected_output', [
+    ([datetime(2021, 11, 18, 1, 2, 3)], '["2021-11-18 01:02:03"]'),
+    ([date(2021, 11, 18)], '["2021-11-18"]'),
+    pytest.param([object()], None, marks=pytest.mark.xfail(raises=TypeError)),
+    ])
+def test_dumps_default(value, expected_output):
+    """
+    Dates are encoded in a MySQL-compatible format.
+    :type value: list
+    :type expected_output: str
+    """
+    assert JSONCodec().dumps(value) == expected_output
+
+
+def test_get_codec_auto():
+    """
+    "auto" prefers the fastest installed codec and falls back to the standard library.
+    """
+    expected = next((codec for codec in [OrjsonCodec, UjsonCodec] if installed(codec.name)), JSONCodec)
+    assert type(get_codec('auto')) is expected
+
+
+class TestRowDecoder(object):
+    class_ref = RowDecoder
+
+    def test_from_description(self):
+        """
+        Plans are built once per description and codec.
+        """
+        codec = JSONCodec()
+        inst = self.class_ref.from_description(DESCRIPTION, codec)
+        assert inst.names == ('id', 'json')
+        assert inst.json_keys == ('json',)
+        assert inst.data_types == {'id': FIELD_TYPE.LONG, 'json': FIELD_TYPE.JSON}
+        assert self.class_ref.from_description(DESCRIPTION, codec) is inst
+        assert self.class_ref.from_description(DESCRIPTION, JSONCodec()) is not inst
+
+    @pytest.mark.parametrize('description, rows, expected_output', [
+        (DESCRIPTION, [], []),
+        (DESCRIPTION, [(1, '{"x": 1}'), (2, None)], [{'id': 1, 'json': {'x': 1}}, {'id': 2, 'json': None}]),
+        (DESCRIPTION[:1], [(1,), (2,)], [{'id': 1}, {'id': 2}]),
+        ])
+    def test_decode(self, description, rows, expected_output):
+        """
+        :type description: tuple of tuple
+        :type rows: list of tuple
+        :type expected_output: list of dict
+        """
+        inst = self.class_ref(description, JSONCodec())
+        data = inst.decode_all(rows)
+        assert isinstance(data, DecodedRows)
+        assert data == expected_output
+        assert [inst.decode(row) for row in rows] == expected_output
+
+    @pytest.mark.parametrize('fields, expected_output', [
+        (('id', 'json'), [(1, {'x': 1}), (2, None)]),
+        (('json', 'id'), [({'x': 1}, 1), (None, 2)]),
+        pytest.param(('id',), None, marks=pytest.mark.xfail(raises=AssertionError)),
+        pytest.param(('id', 'json', 'other'), None, marks=pytest.mark.xfail(raises=AssertionError)),
+        ])
+    def test_decode_all_as(self, fields, expected_output):
+        """
+        Rows are decoded into the row type's field order; columns that do not match its fields raise.
+        :type fields: tuple of str
+        :type expected_output: list of tuple
+        """
+        row_type = namedtuple('Row', fields)
+        inst = self.class_ref(DESCRIPTION, JSONCodec())
+        data = inst.decode_all_as([(1, '{"x": 1}'), (2, None)], row_type)
+        assert data == expected_output
+        assert isinstance(data, DecodedRows)
+        assert all(type(datum) is row_type for datum in data)
+        assert inst.tuple_decoder(row_type) is inst.tuple_decoder(row_type)
+
+
+def test_client_codec(monkeypatch):
+    """
+    `Args` encodes with the configured `client.JSON_CODEC`.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    class Codec(JSONCodec):
+        def dumps(self, value):
+            return 'dumped'
+
+    monkeypatch.setattr(client, 'JSON_CODEC', Codec())
+    assert client.DBClient('db', 'sp', ('x', {'y': 1}), ('z', 1)).args == [('x', 'dumped'), ('z', 1)]
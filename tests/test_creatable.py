@@ -0,0 +1,148 @@
+"""
+:date_created: 2026-10-16
+"""
+import asyncio
+import json
+
+import pytest
+from do_py.exceptions import DataObjectError
+from pymysql.constants import FIELD_TYPE
+
+from examples.a import A
+from tests.mock_db import ResultSet
+
+TYPES = {'id': FIELD_TYPE.LONG, 'json': FIELD_TYPE.JSON}
+
+
+class Table(object):
+    """
+    In-memory `testing`.`a` table behind the mocked `A_create_many` stored procedure.
+    """
+
+    def __init__(self):
+        self.rows = []
+
+    def create_many(self, rows, echo):
+        """
+        :type rows: str
+        :type echo: bool
+        :rtype: list of ResultSet
+        """
+        first_id = len(self.rows) + 1
+        for row in json.loads(rows):
+            row['json'] = json.dumps(row['json']) if row['json'] is not None else None
+            self.rows.append(dict(row, id=len(self.rows) + 1))
+        if echo:
+            return [ResultSet.from_dicts(self.rows[first_id - 1:], types=TYPES)]
+        return [ResultSet.from_dicts([{'id': row['id']} for row in self.rows[first_id - 1:]], types=TYPES)]
+
+    def create(self, string, json_, int_, float_, datetime_, echo):
+        """
+        Mocked `A_create` of `echo_writes = False`.
+        :type echo: bool
+        :rtype: list of ResultSet
+        """
+        self.rows.append({
+            'id': len(self.rows) + 1, 'string': string, 'json': json_, 'int': int_, 'float': float_,
+            'datetime': datetime_
+            })
+        if echo:
+            return [ResultSet.from_dicts(self.rows[-1:], types=TYPES)]
+        return [ResultSet.from_dicts([{'id': len(self.rows)}], types=TYPES)]
+
+
+@pytest.fixture
+def table(mock_db):
+    """
+    :type mock_db: tests.mock_db.MockDatabase
+    :rtype: Table
+    """
+    table = Table()
+    mock_db.register('testing', 'A_create_many', table.create_many)
+    mock_db.register('testing', 'A_create', table.create)
+    return table
+
+
+def rows(count):
+    """
+    :type count: int
+    :rtype: list of dict
+    """
+    return [
+        {'string': str(i), 'json': {'x': i, 'y': i}, 'int': i, 'float': None, 'datetime': None}
+        for i in range(count)
+        ]
+
+
+@pytest.mark.parametrize('count, chunk_size, calls', [
+    (0, 2, 0),
+    (5, 2, 3),
+    (5, 5, 1),
+    pytest.param(5, 0, 0, marks=pytest.mark.xfail(raises=AssertionError)),
+    ])
+def test_create_many(mock_db, table, count, chunk_size, calls):
+    """
+    Rows are created in chunks, within one transaction, and returned in order.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type table: Table
+    :type count: int
+    :type chunk_size: int
+    :type calls: int
+    """
+    created = A.create_many(rows(count), chunk_size=chunk_size)
+    assert created == [A(dict(row, id=i + 1)) for i, row in enumerate(rows(count))]
+    assert len(mock_db.calls) == calls
+    assert mock_db.commits == (1 if calls else 0)
+
+
+def test_create_many_ids(table):
+    """
+    :type table: Table
+    """
+    assert A.create_many(rows(3), echo=False) == [1, 2, 3]
+    assert A.create_many(rows(2), chunk_size=1, echo=False) == [4, 5]
+
+
+def test_create_many_validation(mock_db, table):
+    """
+    Every row is validated before connecting to DB.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type table: Table
+    """
+    with pytest.raises(DataObjectError):
+        A.create_many(rows(3) + [{'int': 'abc'}])
+    assert mock_db.connections == []
+
+
+def test_create_many_rollback(mock_db, table):
+    """
+    A failed chunk rolls back the chunks created before it.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type table: Table
+    """
+    def create_many(rows, echo):
+        if len(table.rows) >= 2:
+            raise ValueError('Duplicate entry')
+        return table.create_many(rows, echo)
+
+    mock_db.register('testing', 'A_create_many', create_many)
+    with pytest.raises(ValueError):
+        A.create_many(rows(4), chunk_size=2)
+    assert len(mock_db.calls) == 2
+    assert mock_db.commits == 0
+    assert mock_db.connections[0].rollbacks
+
+
+def test_create_no_echo(mock_db, table, monkeypatch):
+    """
+    With `echo_writes = False`, only the generated id is returned and merged with the validated kwargs.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type table: Table
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(A, 'echo_writes', False)
+    row = rows(2)[1]
+    assert A.create(**row) == A(dict(row, id=1))
+    assert asyncio.run(A.acreate(**row)) == A(dict(row, id=2))
+    assert [call[2][-1] for call in mock_db.calls] == [False, False]
+    assert len(table.rows) == 2
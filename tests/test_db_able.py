@@ -33,6 +33,14 @@ def test_db_able():
     assert loaded != created
     loaded = A.load(id=created.id)
     assert loaded == created
+    assert A.load_many([created.id, -1, created.id]) == [created, None, created]
+    # Create many
+    rows = [{'string': str(i), 'json': {'x': i, 'y': i}, 'int': i, 'float': None, 'datetime': None} for i in range(5)]
+    created_many = A.create_many(rows, chunk_size=2)
+    assert [a.string for a in created_many] == [row['string'] for row in rows]
+    assert A.load_many([a.id for a in created_many]) == created_many
+    ids = A.create_many(rows, echo=False)
+    assert [a.string for a in A.load_many(ids)] == [row['string'] for row in rows]
     # Delete
     created.delete()
     assert created != loaded
@@ -47,3 +55,12 @@ def test_listable(cls_ref: Type[Union[B, C]]):
     """
     data = list(cls_ref.yield_all(limit=5))
     assert len(data) == 11  # 11 seed_data points in SQL setup. Ref: tests/sql/testing/seed_data/*.sql
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_listable_stream(cls_ref: Type[Union[B, C]]):
+    """
+    Integration test for the server-side streaming paths of `Scrollable` (`B`) and `Paginated` (`C`) implementations.
+    """
+    assert list(cls_ref.yield_all(limit=5, stream=True)) == list(cls_ref.yield_all(limit=5))
+    assert len(list(cls_ref.stream())) == 11
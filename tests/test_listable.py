@@ -0,0 +1,376 @@
+"""
+:date_created: 2026-10-16
+"""
+from typing import Type, Union
+
+import pytest
+from do_py import R
+from pymysql.constants import FIELD_TYPE
+
+from db_able import Paginated, Transaction
+from db_able.listable import LazyPaginatedData, LazyRows, PaginatedData, RawPaginatedData
+from db_able.mgmt.const import TotalMode
+from db_able.utils.cache import LRUCache
+from examples.b import B
+from examples.c import C
+from tests.mock_db import ResultSet
+
+ROWS = [{'id': i, 'x': i * 10, 'y': i * 100} for i in range(1, 12)]
+
+
+@pytest.fixture
+def listable_db(mock_db):
+    """
+    Mock `B_list`, `C_list` and the `_stream` stored procedures over 11 rows.
+    :type mock_db: tests.mock_db.MockDatabase
+    :rtype: tests.mock_db.MockDatabase
+    """
+    def b_list(limit, after):
+        return [ResultSet.from_dicts([row for row in ROWS if row['id'] > (after or 0)][:limit])]
+
+    def c_list(limit, page):
+        return [
+            ResultSet.from_dicts(ROWS[(page - 1) * limit:page * limit]),
+            ResultSet.from_dicts([{'page': page, 'total': len(ROWS), 'page_size': limit}])
+            ]
+
+    mock_db.register('testing', 'B_list', b_list)
+    mock_db.register('testing', 'C_list', c_list)
+    mock_db.register('testing', 'B_stream', lambda: [ResultSet.from_dicts(ROWS, types={'id': FIELD_TYPE.LONG})])
+    mock_db.register('testing', 'C_stream', lambda: [ResultSet.from_dicts(ROWS, types={'id': FIELD_TYPE.LONG})])
+    return mock_db
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_stream_params(cls_ref: Type[Union[B, C]]):
+    """
+    `stream_params` defaults to `list_params` without the paging params.
+    """
+    assert cls_ref.stream_params == []
+    assert cls_ref.stream_params.version == ''
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_stream(listable_db, cls_ref: Type[Union[B, C]]):
+    """
+    `stream` hydrates every row of a single stored procedure call.
+    """
+    assert list(cls_ref.stream()) == [cls_ref(row) for row in ROWS]
+    assert listable_db.calls == [('testing', '%s_stream' % cls_ref.__name__, [])]
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_yield_all_stream(listable_db, cls_ref: Type[Union[B, C]]):
+    """
+    `yield_all(stream=True)` pages through the same `list` stored procedure calls as the buffered path.
+    """
+    expected = list(cls_ref.yield_all(limit=5))
+    calls = list(listable_db.calls)
+    del listable_db.calls[:]
+    assert list(cls_ref.yield_all(limit=5, stream=True)) == expected == [cls_ref(row) for row in ROWS]
+    assert listable_db.calls == calls
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_list_cache(listable_db, monkeypatch, cls_ref: Type[Union[B, C]]):
+    """
+    Identical `list` calls are served from `list_cache` until the class is written to.
+    """
+    monkeypatch.setattr(cls_ref, 'list_cache', LRUCache(maxsize=10))
+    page = cls_ref.list(limit=5)
+    page.data[0].x = -1  # Callers get their own copy of the cached page.
+    assert cls_ref.list(limit=5) == cls_ref.list(limit=5) != page
+    assert cls_ref.list(limit=4) != page
+    assert len(listable_db.calls) == 2
+    with Transaction():
+        cls_ref.list(limit=3)
+    assert len(cls_ref.list_cache) == 2
+    cls_ref._invalidate_list_cache()
+    assert len(cls_ref.list_cache) == 0
+    cls_ref.list(limit=5)
+    assert len(listable_db.calls) == 4
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_yield_all_prefetch(listable_db, cls_ref: Type[Union[B, C]]):
+    """
+    `yield_all(prefetch=N)` pages through the same `list` stored procedure calls on a worker thread.
+    """
+    expected = list(cls_ref.yield_all(limit=2))
+    calls = list(listable_db.calls)
+    del listable_db.calls[:]
+    assert list(cls_ref.yield_all(limit=2, prefetch=2)) == expected == [cls_ref(row) for row in ROWS]
+    assert listable_db.calls == calls
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_yield_all_prefetch_close(listable_db, cls_ref: Type[Union[B, C]]):
+    """
+    Closing the generator early stops fetching pages.
+    """
+    items = cls_ref.yield_all(limit=2, prefetch=1)
+    assert next(items) == cls_ref(ROWS[0])
+    items.close()
+    assert len(listable_db.calls) <= 3
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_yield_all_workers(listable_db, ordered):
+    """
+    `yield_all(workers=N)` fetches every page implied by the first page's pagination data.
+    :type ordered: bool
+    """
+    items = list(C.yield_all(limit=2, workers=3, ordered=ordered))
+    if ordered:
+        assert items == [C(row) for row in ROWS]
+    else:
+        assert sorted(items, key=lambda c: c.id) == [C(row) for row in ROWS]
+    assert sorted(call[2] for call in listable_db.calls) == [[2, page] for page in range(1, 7)]
+
+
+@pytest.mark.parametrize('cls_ref, kwargs', [
+    pytest.param(B, {'workers': 2}, marks=pytest.mark.xfail(raises=AssertionError)),
+    pytest.param(C, {'workers': 2, 'stream': True}, marks=pytest.mark.xfail(raises=AssertionError)),
+    pytest.param(C, {'workers': -1}, marks=pytest.mark.xfail(raises=AssertionError)),
+    ])
+def test_yield_all_workers_invalid(listable_db, cls_ref: Type[Union[B, C]], kwargs):
+    """
+    :type kwargs: dict
+    """
+    next(cls_ref.yield_all(limit=2, **kwargs))
+
+
+def test_yield_all_workers_close(listable_db):
+    """
+    Closing the generator early cancels pages not yet started.
+    """
+    items = C.yield_all(limit=1, workers=1)
+    assert next(items) == C(ROWS[0])
+    assert next(items) == C(ROWS[1])
+    items.close()
+    assert len(listable_db.calls) < len(ROWS)
+
+
+@pytest.fixture(params=TotalMode.allowed)
+def total_mode_cls(request, mock_db):
+    """
+    Paginated implementation over `ROWS` for each `TotalMode`, with a mocked `D_list` stored procedure that behaves
+    like its generated template.
+    :type request: pytest.SubRequest
+    :type mock_db: tests.mock_db.MockDatabase
+    :rtype: Type[Paginated]
+    """
+    total_mode = request.param
+
+    def d_list(limit, page, with_total=None):
+        fetch = limit if total_mode == TotalMode.EXACT else limit + 1
+        total = {
+            TotalMode.EXACT: len(ROWS),
+            TotalMode.FIRST_PAGE: len(ROWS) if page == 1 else None,
+            TotalMode.NONE: None,
+            TotalMode.ESTIMATED: 100,
+            TotalMode.CACHED: len(ROWS) if with_total else None,
+            }[total_mode]
+        return [
+            ResultSet.from_dicts(ROWS[(page - 1) * limit:(page - 1) * limit + fetch]),
+            ResultSet.from_dicts([{'page': page, 'total': total, 'page_size': limit}])
+            ]
+
+    mock_db.register('testing', 'D_list', d_list)
+    return type('D', (Paginated,), {
+        '__module__': __name__,
+        'db': 'testing',
+        '_restrictions': C._restrictions,
+        '_extra_restrictions': C._extra_restrictions,
+        'list_params': ['limit', 'page'],
+        'total_mode': total_mode
+        })
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_total_mode(mock_db, total_mode_cls: Type[Paginated], stream):
+    """
+    `has_more` is correct in every `TotalMode`; the total is only as exact as the mode.
+    :type stream: bool
+    """
+    pages = list(total_mode_cls._yield_pages(limit=5))
+    assert [len(page.data) for page in pages] == [5, 5, 1]
+    assert [page.pagination.has_more for page in pages] == [True, True, False]
+    assert list(total_mode_cls.yield_all(limit=5, stream=stream)) == [total_mode_cls(row) for row in ROWS]
+    totals = [page.pagination.total for page in pages]
+    assert totals == {
+        TotalMode.EXACT: [11, 11, 11],
+        TotalMode.FIRST_PAGE: [11, None, None],
+        TotalMode.NONE: [None, None, None],
+        TotalMode.ESTIMATED: [100, 100, 100],
+        TotalMode.CACHED: [11, 11, 11],
+        }[total_mode_cls.total_mode]
+    if total_mode_cls.total_mode == TotalMode.CACHED:
+        assert [call[2][2] for call in mock_db.calls] == [True] + [False] * 5  # The total is counted once.
+        total_mode_cls._invalidate_list_cache()
+        total_mode_cls.list(limit=5)
+        assert mock_db.calls[-1][2][2] is True
+
+
+def test_total_mode_pagination(monkeypatch, total_mode_cls: Type[Paginated]):
+    """
+    Pagination data serializes to the same keys in every `TotalMode`; `more` is an attribute kept by cached copies.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(total_mode_cls, 'list_cache', LRUCache(maxsize=10))
+    page = total_mode_cls.list(limit=5)
+    assert dict(page.pagination) == {'page': 1, 'page_size': 5, 'total': page.pagination.total}
+    assert page.pagination.more is (None if total_mode_cls.total_mode == TotalMode.EXACT else True)
+    cached = total_mode_cls.list(limit=5)
+    assert cached is not page
+    assert cached.pagination.more is page.pagination.more
+    assert cached.pagination.has_more
+
+
+def test_total_mode_workers(total_mode_cls: Type[Paginated]):
+    """
+    `yield_all(workers=N)` requires an exact total on the first page; without one past page 1, the remaining pages
+    are fetched one by one.
+    """
+    if total_mode_cls.total_mode in [TotalMode.EXACT, TotalMode.FIRST_PAGE]:
+        assert list(total_mode_cls.yield_all(limit=5, workers=2)) == [total_mode_cls(row) for row in ROWS]
+        assert list(total_mode_cls.yield_all(limit=3, page=2, workers=2)) == [total_mode_cls(row) for row in ROWS[3:]]
+    else:
+        with pytest.raises(AssertionError):
+            next(total_mode_cls.yield_all(limit=5, workers=2))
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_lazy_paginated_data(listable_db, monkeypatch, cls_ref: Type[Union[B, C]]):
+    """
+    `LazyPaginatedData` hydrates each row on first access only, and otherwise matches `PaginatedData`.
+    """
+    expected = cls_ref.list(limit=5)
+    monkeypatch.setattr(cls_ref, 'paginated_data_cls_ref', LazyPaginatedData)
+    page = cls_ref.list(limit=5)
+    assert isinstance(page, LazyPaginatedData) and isinstance(page.data, LazyRows)
+    assert not isinstance(list.__getitem__(page.data, 0), cls_ref)
+    assert page.pagination == expected.pagination
+    assert page.data[0] is page.data[0] == expected.data[0]
+    assert not isinstance(list.__getitem__(page.data, 1), cls_ref)
+    assert page.data[-2:] == expected.data[-2:]
+    assert page.data == expected.data and list(page.data) == list(expected.data)
+    assert list(cls_ref.yield_all(limit=5)) == [cls_ref(row) for row in ROWS]
+
+
+def test_lazy_rows_copy():
+    """
+    Copies deep copy both un-hydrated rows and hydrated DataObjects.
+    """
+    rows = LazyRows(C, [dict(row) for row in ROWS[:2]])
+    rows[0].x = -1
+    copy = rows.copy()
+    assert copy == rows and copy[0] is not rows[0]
+    assert list.__getitem__(copy, 1) == list.__getitem__(rows, 1)
+    assert list.__getitem__(copy, 1) is not list.__getitem__(rows, 1)
+
+
+@pytest.mark.parametrize('paginated_data_cls_ref', [PaginatedData, LazyPaginatedData])
+def test_list_cache_isolation(mock_db, paginated_data_cls_ref):
+    """
+    Mutating nested values of a listed object never leaks into `list_cache`, nor into later cache hits, including
+    for the caller whose call filled the cache.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type paginated_data_cls_ref: type[PaginatedData]
+    """
+    mock_db.register('testing', 'Tagged_list', lambda limit, page: [
+        ResultSet.from_dicts([{'id': 1, 'tags': '["a"]'}], types={'id': FIELD_TYPE.LONG, 'tags': FIELD_TYPE.JSON}),
+        ResultSet.from_dicts([{'page': page, 'total': 1, 'page_size': limit}])
+        ])
+    tagged = type('Tagged', (Paginated,), {
+        '__module__': __name__,
+        'db': 'testing',
+        '_restrictions': {'id': R.INT, 'tags': R.LIST},
+        '_extra_restrictions': C._extra_restrictions,
+        'list_params': ['limit', 'page'],
+        'list_cache': LRUCache(maxsize=10),
+        'paginated_data_cls_ref': paginated_data_cls_ref
+        })
+    first = tagged.list(limit=5)
+    first.data[0].tags.append('mutated')
+    hit = tagged.list(limit=5)
+    assert hit.data[0].tags == ['a']
+    hit.data[0].tags.append('mutated')
+    assert tagged.list(limit=5).data[0].tags == ['a']
+    assert first.data[0].tags == ['a', 'mutated']
+    assert len(mock_db.calls) == 1
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+def test_list_raw(listable_db, cls_ref: Type[Union[B, C]]):
+    """
+    `list(raw=True)` returns the same page as `row_type` namedtuples, bypassing `list_cache`.
+    """
+    row_type = cls_ref.row_type()
+    assert row_type is cls_ref.row_type() and row_type._fields == ('id', 'x', 'y')
+    expected = cls_ref.list(limit=5)
+    page = cls_ref.list(limit=5, raw=True)
+    assert type(page) is RawPaginatedData
+    assert all(type(datum) is row_type for datum in page.data)
+    assert [datum._asdict() for datum in page.data] == expected.data
+    assert page.pagination == expected.pagination
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+@pytest.mark.parametrize('stream', [False, True])
+def test_list_raw_columns_mismatch(listable_db, cls_ref: Type[Union[B, C]], stream):
+    """
+    Rows whose columns do not match `row_type` raise rather than being returned as dicts.
+    :type stream: bool
+    """
+    listable_db.register('testing', '%s_list' % cls_ref.__name__, lambda limit, cursor: [
+        ResultSet.from_dicts([{'id': 1, 'x': 1}]),
+        ResultSet.from_dicts([{'page': 1, 'total': 1, 'page_size': limit}])
+        ])
+    with pytest.raises(AssertionError):
+        list(cls_ref.yield_all(limit=5, raw=True, stream=stream))
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+@pytest.mark.parametrize('kwargs', [{}, {'stream': True}, {'prefetch': 1}, {'workers': 2}])
+def test_yield_all_raw(listable_db, cls_ref: Type[Union[B, C]], kwargs):
+    """
+    `yield_all(raw=True)` yields every row as a `row_type` namedtuple, through the same stored procedure calls.
+    :type kwargs: dict
+    """
+    if 'workers' in kwargs and cls_ref is B:
+        pytest.skip('"workers" requires Paginated.')
+    list(cls_ref.yield_all(limit=5, **kwargs))
+    calls = list(listable_db.calls)
+    del listable_db.calls[:]
+    assert list(cls_ref.yield_all(limit=5, raw=True, **kwargs)) == [cls_ref.row_type()(**row) for row in ROWS]
+    assert sorted(listable_db.calls, key=repr) == sorted(calls, key=repr)
+
+
+@pytest.mark.parametrize('cls_ref', [B, C])
+@pytest.mark.parametrize('prefetch', [0, 1])
+def test_to_columns(listable_db, cls_ref: Type[Union[B, C]], prefetch):
+    """
+    `to_columns` pages through the same `list` stored procedure calls as `yield_all` into typed columns.
+    :type prefetch: int
+    """
+    numpy = pytest.importorskip('numpy')
+    list(cls_ref.yield_all(limit=5))
+    calls = list(listable_db.calls)
+    del listable_db.calls[:]
+    columns = cls_ref.to_columns(limit=5, prefetch=prefetch)
+    assert list(columns) == ['id', 'x', 'y']
+    for key, column in columns.items():
+        assert column.dtype == numpy.int64
+        assert column.tolist() == [row[key] for row in ROWS]
+    assert listable_db.calls == calls
+
+
+def test_to_columns_dataframe(listable_db):
+    """
+    `to_columns(dataframe=True)` wraps the same columns in a `pandas.DataFrame`.
+    """
+    pandas = pytest.importorskip('pandas')
+    frame = C.to_columns(limit=5, dataframe=True)
+    assert isinstance(frame, pandas.DataFrame)
+    assert frame.to_dict('records') == ROWS
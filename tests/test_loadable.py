@@ -0,0 +1,185 @@
+"""
+:date_created: 2026-10-16
+"""
+import asyncio
+import json
+
+import pytest
+from do_py import R
+from do_py.exceptions import DataObjectError
+from pymysql.constants import FIELD_TYPE
+
+from db_able import Loadable, Transaction
+from db_able.utils.cache import LRUCache
+from examples.a import A
+from tests.mock_db import ResultSet
+
+ROWS = {i: {'id': i, 'string': str(i), 'json': None, 'int': i, 'float': None, 'datetime': None} for i in range(1, 4)}
+
+
+@pytest.fixture
+def loadable_db(mock_db):
+    """
+    Mock `A_load_many` over `ROWS`, returning found rows in arbitrary order.
+    :type mock_db: tests.mock_db.MockDatabase
+    :rtype: tests.mock_db.MockDatabase
+    """
+    def load_many(keys):
+        ids = {key['id'] for key in json.loads(keys)}
+        return [ResultSet.from_dicts(
+            [ROWS[i] for i in sorted(ids, reverse=True) if i in ROWS],
+            types={'id': FIELD_TYPE.LONG, 'json': FIELD_TYPE.JSON}
+            )]
+
+    mock_db.register('testing', 'A_load_many', load_many)
+    return mock_db
+
+
+@pytest.mark.parametrize('keys', [
+    [3, 404, 1, 3],
+    [{'id': 3}, {'id': 404}, {'id': 1}, {'id': 3}],
+    pytest.param(['abc'], marks=pytest.mark.xfail(raises=DataObjectError)),
+    pytest.param(3, marks=pytest.mark.xfail(raises=AssertionError)),
+    ])
+def test_load_many(loadable_db, keys):
+    """
+    One call returns objects in request order, with None for misses.
+    :type loadable_db: tests.mock_db.MockDatabase
+    :type keys: list
+    """
+    assert A.load_many(keys) == [A(ROWS[3]), None, A(ROWS[1]), A(ROWS[3])]
+    assert loadable_db.calls == [('testing', 'A_load_many', ['[{"id": 3}, {"id": 404}, {"id": 1}, {"id": 3}]'])]
+
+
+def test_load_many_empty(loadable_db):
+    """
+    :type loadable_db: tests.mock_db.MockDatabase
+    """
+    assert A.load_many([]) == []
+    assert loadable_db.calls == []
+
+
+def test_aload_many(loadable_db):
+    """
+    :type loadable_db: tests.mock_db.MockDatabase
+    """
+    assert asyncio.run(A.aload_many([2, 404])) == [A(ROWS[2]), None]
+
+
+@pytest.fixture
+def cached_db(mock_db, monkeypatch):
+    """
+    Mock the CRUD stored procedures of `A` over a copy of `ROWS`, with `A.load_cache` enabled.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type monkeypatch: pytest.MonkeyPatch
+    :rtype: tests.mock_db.MockDatabase
+    """
+    rows = {i: dict(row) for i, row in ROWS.items()}
+
+    def load(_id):
+        return [ResultSet.from_dicts([rows[_id]] if _id in rows else [])]
+
+    def create(*args):
+        rows[4] = dict(ROWS[1], id=4, string=args[0])
+        return load(4)
+
+    def save(_id, *args):
+        rows[_id]['string'] = args[0]
+        return load(_id)
+
+    def delete(_id):
+        return [ResultSet.from_dicts([{'deleted': int(rows.pop(_id, None) is not None)}])]
+
+    for sp, fn in [('A_load', load), ('A_create', create), ('A_save', save), ('A_delete', delete)]:
+        mock_db.register('testing', sp, fn)
+    monkeypatch.setattr(A, 'load_cache', LRUCache(maxsize=2))
+    return mock_db
+
+
+def test_load_cache(cached_db):
+    """
+    Loads read through `A.load_cache`; create populates it, save refreshes it and delete invalidates it.
+    :type cached_db: tests.mock_db.MockDatabase
+    """
+    a = A.load(id=1)
+    assert A.load(id=1) == a
+    assert A.load_cache.info().hits == 1 and A.load_cache.info().misses == 1
+    a.string = 'changed'
+    assert a.save()
+    assert A.load(id=1) == a
+    assert a.delete()
+    assert A.load(id=1) is None
+    created = A.create(string='created', json=None, int=1, float=None, datetime=None)
+    assert A.load(id=4) == created
+    assert [call[1] for call in cached_db.calls] == ['A_load', 'A_save', 'A_delete', 'A_load', 'A_create']
+    assert asyncio.run(A.aload(id=4)) == created
+    assert len(cached_db.calls) == 5
+
+
+def test_load_cache_invalidation(cached_db):
+    """
+    Writes within a `Transaction` and `invalidate_load` drop the cached entry rather than refreshing it.
+    :type cached_db: tests.mock_db.MockDatabase
+    """
+    a = A.load(id=1)
+    with Transaction():
+        a.string = 'changed'
+        a.save()
+    assert (A, 1) not in A.load_cache
+    assert A.load(id=1) == a
+    A.invalidate_load(id=1)
+    assert A.load(id=1) == a
+    assert [call[1] for call in cached_db.calls] == ['A_load', 'A_save', 'A_load', 'A_load']
+
+
+class Tagged(Loadable):
+    """
+    Cached `Loadable` implementation with a nested mutable field.
+    """
+    db = 'testing'
+    _restrictions = {
+        'id': R.INT,
+        'tags': R.LIST
+        }
+    load_params = ['id']
+
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_load_cache_isolation(mock_db, monkeypatch, trusted):
+    """
+    Mutating nested values of a loaded object never leaks into `load_cache`, nor into later cache hits.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type monkeypatch: pytest.MonkeyPatch
+    :type trusted: bool
+    """
+    mock_db.register('testing', 'Tagged_load', lambda _id: [ResultSet.from_dicts(
+        [{'id': _id, 'tags': '["a"]'}], types={'id': FIELD_TYPE.LONG, 'tags': FIELD_TYPE.JSON}
+        )])
+    monkeypatch.setattr(Tagged, 'load_cache', LRUCache(maxsize=2))
+    monkeypatch.setattr(Tagged, 'trusted_hydration', trusted)
+    tagged = Tagged.load(id=1)
+    tagged.tags.append('mutated')
+    hit = Tagged.load(id=1)
+    assert hit.tags == ['a']
+    hit.tags.append('mutated')
+    assert Tagged.load(id=1).tags == ['a']
+    assert tagged.tags == ['a', 'mutated']
+    assert len(mock_db.calls) == 1
+
+
+def test_trusted_hydration(cached_db, monkeypatch):
+    """
+    Load, save and create build the same objects through `HydrationPlan` as through full validation.
+    :type cached_db: tests.mock_db.MockDatabase
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(A, 'trusted_hydration', True)
+    a = A.load(id=1)
+    assert a == A(ROWS[1]) and type(a) is A
+    a.string = 'changed'
+    assert a.save()
+    assert a == A(dict(ROWS[1], string='changed'))
+    assert A.load(id=1) == a
+    assert A.create(string='created', json=None, int=1, float=None, datetime=None) == A(
+        dict(ROWS[1], id=4, string='created')
+        )
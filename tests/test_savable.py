@@ -0,0 +1,227 @@
+"""
+:date_created: 2026-10-16
+"""
+import asyncio
+import json
+from datetime import datetime
+
+import aiomysql
+import pytest
+from do_py import R
+from pymysql.constants import CLIENT, FIELD_TYPE
+
+from db_able import Loadable, Paginated, Savable
+from db_able.client.aio import AsyncEngineRegistry
+from db_able.listable import LazyPaginatedData, PaginatedData
+from db_able.utils.cache import LRUCache
+from examples.a import A
+from tests.mock_db import ResultSet
+
+ROW = {'id': 1, 'string': 'a', 'json': {'x': 1, 'y': 2}, 'int': 1, 'float': None, 'datetime': None}
+TYPES = {'id': FIELD_TYPE.LONG, 'json': FIELD_TYPE.JSON}
+
+
+class Listed(Loadable, Savable, Paginated):
+    """
+    Change-tracked `Paginated` implementation with a page cache.
+    """
+    db = 'testing'
+    _restrictions = {
+        'id': R.INT,
+        'x': R.INT
+        }
+    _extra_restrictions = {
+        'limit': R.INT.with_default(10),
+        'page': R.INT.with_default(1)
+        }
+    load_params = ['id']
+    save_params = ['id', 'x']
+    list_params = ['limit', 'page']
+    track_changes = True
+    list_cache = LRUCache(maxsize=10)
+
+
+@pytest.fixture
+def savable_db(mock_db):
+    """
+    Mock `A_load`, `A_save` and `A_save_partial` over a single row.
+    :type mock_db: tests.mock_db.MockDatabase
+    :rtype: tests.mock_db.MockDatabase
+    """
+    row = dict(ROW)
+
+    def load(_id):
+        return [ResultSet.from_dicts([dict(row, json=json.dumps(row['json']))], types=TYPES)]
+
+    def saved(_id, echo):
+        """
+        Echo the row, or only the affected-row count, as `echo_writes = False` stored procedures do.
+        """
+        if not echo:
+            return [ResultSet.from_dicts([{'saved': int(_id == row['id'])}])]
+        return load(_id)
+
+    def save(_id, string, json_, int_, float_, datetime_, echo=True):
+        row.update(string=string, json=json.loads(json_), int=int_, float=float_, datetime=datetime_)
+        return saved(_id, echo)
+
+    def save_partial(_id, changes, echo=True):
+        changes = json.loads(changes)
+        if changes.get('datetime') is not None:
+            changes['datetime'] = datetime.fromisoformat(changes['datetime'])
+        row.update(changes)
+        return saved(_id, echo)
+
+    for sp, fn in [('A_load', load), ('A_save', save), ('A_save_partial', save_partial)]:
+        mock_db.register('testing', sp, fn)
+    return mock_db
+
+
+@pytest.mark.parametrize('track_changes', [False, True])
+def test_dirty_fields(monkeypatch, track_changes):
+    """
+    Instances built from DB rows are clean when tracking changes; any other instance is fully dirty.
+    :type monkeypatch: pytest.MonkeyPatch
+    :type track_changes: bool
+    """
+    monkeypatch.setattr(A, 'track_changes', track_changes)
+    update_fields = ['string', 'json', 'int', 'float', 'datetime']
+    assert A(ROW).dirty_fields() == update_fields
+    a = A._from_row(dict(ROW))
+    assert a.dirty_fields() == ([] if track_changes else update_fields)
+    a.int = 2
+    a.json.x = 3  # In-place change of a nested value.
+    assert a.dirty_fields() == (['json', 'int'] if track_changes else update_fields)
+    a.int = 1
+    a.json.x = 1
+    assert a.dirty_fields() == ([] if track_changes else update_fields)
+
+
+@pytest.mark.parametrize('paginated_data_cls_ref', [PaginatedData, LazyPaginatedData])
+def test_list_cache_tracked(mock_db, monkeypatch, paginated_data_cls_ref):
+    """
+    Objects served from `list_cache` keep their snapshot, so only their own changes are dirty.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type monkeypatch: pytest.MonkeyPatch
+    :type paginated_data_cls_ref: type[PaginatedData]
+    """
+    mock_db.register('testing', 'Listed_list', lambda limit, page: [
+        ResultSet.from_dicts([{'id': 1, 'x': 1}, {'id': 2, 'x': 2}]),
+        ResultSet.from_dicts([{'page': page, 'total': 2, 'page_size': limit}])
+        ])
+    monkeypatch.setattr(Listed, 'paginated_data_cls_ref', paginated_data_cls_ref)
+    Listed._invalidate_list_cache()
+    for _ in range(3):  # From DB, then from the cache.
+        page = Listed.list()
+        assert [datum.dirty_fields() for datum in page.data] == [[], []]
+        page.data[0].x = 3
+        assert [datum.dirty_fields() for datum in page.data] == [['x'], []]
+    assert len(mock_db.calls) == 1
+
+
+def test_save_untracked(savable_db):
+    """
+    Without tracking, every save sends every field.
+    :type savable_db: tests.mock_db.MockDatabase
+    """
+    a = A.load(id=1)
+    assert a.save()
+    assert [call[1] for call in savable_db.calls] == ['A_load', 'A_save']
+
+
+def test_save_tracked(savable_db, monkeypatch):
+    """
+    No-op saves skip DB, unless forced; a save refreshes the snapshot.
+    :type savable_db: tests.mock_db.MockDatabase
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(A, 'track_changes', True)
+    a = A.load(id=1)
+    assert a.save()
+    assert asyncio.run(a.asave())
+    a.string = 'b'
+    assert a.save()
+    assert a.dirty_fields() == []
+    assert a.save()
+    assert a.save(force=True)
+    assert [call[1] for call in savable_db.calls] == ['A_load', 'A_save', 'A_save']
+
+
+def test_save_partial(savable_db, monkeypatch):
+    """
+    Only the key params and the changed fields are sent.
+    :type savable_db: tests.mock_db.MockDatabase
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(A, 'partial_save', True)
+    a = A.load(id=1)
+    assert a.save()
+    a.string = 'b'
+    a.datetime = datetime(2021, 11, 18)
+    assert a.save()
+    assert a == A(dict(ROW, string='b', datetime=datetime(2021, 11, 18)))
+    assert a.dirty_fields() == []
+    a.json = None
+    assert asyncio.run(a.asave())
+    assert a.json is None
+    assert [call[1:] for call in savable_db.calls[1:]] == [
+        ('A_save_partial', [1, '{"string": "b", "datetime": "2021-11-18 00:00:00"}']),
+        ('A_save_partial', [1, '{"json": null}']),
+        ]
+
+
+@pytest.mark.parametrize('partial_save', [False, True])
+def test_save_no_echo(savable_db, monkeypatch, partial_save):
+    """
+    With `echo_writes = False`, only the affected-row count is returned unless echoing, and the object is kept as is.
+    :type savable_db: tests.mock_db.MockDatabase
+    :type monkeypatch: pytest.MonkeyPatch
+    :type partial_save: bool
+    """
+    monkeypatch.setattr(A, 'echo_writes', False)
+    monkeypatch.setattr(A, 'partial_save', partial_save)
+    a = A.load(id=1)
+    a.string = 'b'
+    assert a.save()
+    assert a.dirty_fields() == ([] if partial_save else ['string', 'json', 'int', 'float', 'datetime'])
+    assert A.load(id=1) == a
+    a.int = 2
+    assert asyncio.run(a.asave(echo=True))
+    assert a == A(dict(ROW, string='b', int=2))
+    assert [call[2][-1] for call in savable_db.calls if call[1] != 'A_load'] == [False, True]
+    assert not A(dict(ROW, id=404)).save(force=True)
+
+
+def test_asave_no_echo_unchanged(savable_db, monkeypatch):
+    """
+    Without echo, saving an unchanged row reports it saved through the aiomysql pool too, which is created with
+    `CLIENT.FOUND_ROWS` so `ROW_COUNT()` counts matched rows like the sync engine.
+    :type savable_db: tests.mock_db.MockDatabase
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    client_flags = []
+
+    async def create_pool(**kwargs):
+        client_flags.append(kwargs.get('client_flag', 0))
+        return savable_db.pool()
+
+    def save(_id, string, json_, int_, float_, datetime_, echo):
+        # The row is unchanged: MySQL only counts it with `CLIENT.FOUND_ROWS`.
+        return [ResultSet.from_dicts([{'saved': int(bool(client_flags[-1] & CLIENT.FOUND_ROWS))}])]
+
+    monkeypatch.setattr(aiomysql, 'create_pool', create_pool)
+    monkeypatch.setattr(AsyncEngineRegistry, '_pools', {})
+    monkeypatch.setattr(A, 'echo_writes', False)
+    savable_db.register('testing', 'A_save', save)
+    a = A.load(id=1)
+    assert asyncio.run(a.asave())
+    assert client_flags == [CLIENT.FOUND_ROWS]
+
+
+def test_save_echo_required(savable_db):
+    """
+    Classes with `echo_writes` always read the saved row back.
+    :type savable_db: tests.mock_db.MockDatabase
+    """
+    with pytest.raises(AssertionError):
+        A.load(id=1).save(echo=False)
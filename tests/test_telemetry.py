@@ -0,0 +1,126 @@
+"""
+:date_created: 2026-10-16
+"""
+import asyncio
+import logging
+
+import pytest
+from pymysql.constants import FIELD_TYPE
+
+from db_able.client import DBClient, telemetry
+from db_able.mgmt.const import ExecutionMode, Phase
+from examples.a import A
+from examples.c import C
+from tests.mock_db import ResultSet
+
+ROW = {'id': 1, 'string': 'a', 'json': '{"x": 1, "y": 2}', 'int': 1, 'float': 1.5, 'datetime': None}
+
+
+@pytest.fixture
+def histogram(monkeypatch):
+    """
+    Record into a fresh `HistogramSink` only.
+    :type monkeypatch: pytest.MonkeyPatch
+    :rtype: telemetry.HistogramSink
+    """
+    monkeypatch.setattr(telemetry, 'sinks', [])
+    return telemetry.add_sink(telemetry.HistogramSink())
+
+
+class TestHistogramSink(object):
+    class_ref = telemetry.HistogramSink
+
+    def test_summary(self):
+        inst = self.class_ref()
+        for seconds in [0.001] * 98 + [0.05, 1.0]:
+            inst.timing('testing.A_load', Phase.CALL, seconds)
+        summary = inst.summary('testing.A_load', Phase.CALL)
+        assert summary['count'] == 100
+        assert summary['min'] == 0.001 and summary['max'] == 1.0
+        assert summary['total'] == pytest.approx(1.148)
+        assert 0.001 <= summary['p50'] < 0.002
+        assert 0.001 <= summary['p95'] < 0.002
+        assert 0.05 <= summary['p99'] < 0.1
+        assert inst.summary('testing.A_load', Phase.FETCH) is None
+        inst.gauge('default', 'checked_out', 3)
+        assert inst.gauges == {('default', 'checked_out'): 3}
+        inst.clear()
+        assert inst.histograms == {} and inst.gauges == {}
+
+
+def test_sink_required():
+    """
+    Sink implementations must define both `timing` and `gauge`.
+    """
+    with pytest.raises(AssertionError):
+        type('TimingOnly', (telemetry.Sink,), {'timing': lambda self, name, phase, seconds: None})
+
+
+def test_callback_sink():
+    calls = []
+    inst = telemetry.CallbackSink(timing=lambda *args: calls.append(args), gauge=lambda *args: calls.append(args))
+    inst.timing('testing.A_load', Phase.CALL, 0.0015)
+    inst.gauge('default', 'overflow', 0)
+    assert calls == [('db.testing.A_load.call', 1.5), ('db.pool.default.overflow', 0)]
+
+
+def test_logging_sink(caplog):
+    """
+    :type caplog: pytest.LogCaptureFixture
+    """
+    inst = telemetry.LoggingSink()
+    with caplog.at_level(logging.DEBUG, logger='db_able.telemetry'):
+        inst.timing('testing.A_load', Phase.CALL, 0.0015)
+        inst.gauge('default', 'checked_out', 1)
+    assert caplog.messages == ['testing.A_load call 1.500ms', 'pool default checked_out=1']
+
+
+def test_disabled(monkeypatch):
+    """
+    Without sinks, phases share a no-op context manager.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(telemetry, 'sinks', [])
+    conn = DBClient('testing', 'A_load')
+    assert conn.timed(Phase.CALL) is conn.timed(Phase.FETCH) is telemetry.null_timer
+
+
+@pytest.mark.parametrize('execution_mode', ExecutionMode.allowed)
+def test_phases(mock_db, histogram, monkeypatch, execution_mode):
+    """
+    Every phase of a mixin call is recorded under '%s.%s' % (database, stored_procedure), with pool gauges.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type histogram: telemetry.HistogramSink
+    :type monkeypatch: pytest.MonkeyPatch
+    :type execution_mode: str
+    """
+    monkeypatch.setattr(A, 'execution_mode', execution_mode)
+    mock_db.register('testing', 'A_load', lambda _id: [ResultSet.from_dicts([ROW], types={'json': FIELD_TYPE.JSON})])
+    assert A.load(id=1).json.x == 1
+    assert sorted(phase for name, phase in histogram.histograms if name == 'testing.A_load') == sorted(Phase.allowed)
+    assert histogram.gauges == {('default', 'checked_out'): 1, ('default', 'overflow'): 0}
+
+
+def test_phases_list(mock_db, histogram):
+    """
+    Hydration of a page is recorded once per call; both result sets are fetched and decoded.
+    :type mock_db: tests.mock_db.MockDatabase
+    :type histogram: telemetry.HistogramSink
+    """
+    mock_db.register('testing', 'C_list', lambda limit, page: [
+        ResultSet.from_dicts([{'id': 1, 'x': 1, 'y': 1}]),
+        ResultSet.from_dicts([{'page': page, 'total': 1, 'page_size': limit}])
+        ])
+    C.list()
+    counts = {phase: histogram.summary('testing.C_list', phase)['count'] for phase in Phase.allowed}
+    assert counts == {Phase.CHECKOUT: 1, Phase.CALL: 1, Phase.FETCH: 2, Phase.DECODE: 2, Phase.HYDRATE: 1}
+
+
+def test_phases_async(mock_db, histogram):
+    """
+    :type mock_db: tests.mock_db.MockDatabase
+    :type histogram: telemetry.HistogramSink
+    """
+    mock_db.register('testing', 'A_load', lambda _id: [ResultSet.from_dicts([ROW], types={'json': FIELD_TYPE.JSON})])
+    assert asyncio.run(A.aload(id=1)).id == 1
+    assert sorted(phase for name, phase in histogram.histograms if name == 'testing.A_load') == sorted(Phase.allowed)
@@ -0,0 +1,104 @@
+"""
+:date_created: 2026-10-16
+"""
+import time
+
+import pytest
+
+from db_able.utils.cache import CacheInfo, LRUCache
+
+
+class TestLRUCache(object):
+    class_ref = LRUCache
+
+    @pytest.mark.parametrize('maxsize', [
+        0,
+        1,
+        pytest.param(-1, marks=pytest.mark.xfail(raises=AssertionError)),
+        pytest.param('1', marks=pytest.mark.xfail(raises=AssertionError)),
+        ])
+    def test_init(self, maxsize):
+        """
+        :type maxsize: int
+        """
+        assert self.class_ref(maxsize=maxsize).maxsize == maxsize
+
+    def test_get_set(self):
+        inst = self.class_ref(maxsize=2)
+        assert inst.get('a') is None
+        inst.set('a', 1)
+        assert inst.get('a') == 1
+        assert inst.get('b', default=2) == 2
+        assert inst.info() == CacheInfo({
+            'hits': 1, 'misses': 2, 'evictions': 0, 'expirations': 0, 'size': 1, 'maxsize': 2, 'ttl': None
+            })
+
+    def test_eviction(self):
+        """
+        The least recently used entry is evicted first.
+        """
+        inst = self.class_ref(maxsize=2)
+        inst.set('a', 1)
+        inst.set('b', 2)
+        inst.get('a')
+        inst.set('c', 3)
+        assert 'a' in inst and 'c' in inst and 'b' not in inst
+        inst.resize(1)
+        assert len(inst) == 1 and 'c' in inst
+        assert inst.info().evictions == 2
+
+    @pytest.mark.parametrize('ttl', [
+        None,
+        0.5,
+        10,
+        pytest.param(0, marks=pytest.mark.xfail(raises=AssertionError)),
+        pytest.param('10', marks=pytest.mark.xfail(raises=AssertionError)),
+        ])
+    def test_init_ttl(self, ttl):
+        """
+        :type ttl: int or float or None
+        """
+        assert self.class_ref(ttl=ttl).ttl == ttl
+
+    def test_ttl(self, monkeypatch):
+        """
+        Entries expire `ttl` seconds after they are set; expired reads count as misses.
+        :type monkeypatch: pytest.MonkeyPatch
+        """
+        now = [100.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+        inst = self.class_ref(ttl=10)
+        inst.set('a', 1)
+        now[0] += 9
+        assert inst.get('a') == 1
+        now[0] += 1
+        assert inst.get('a') is None
+        assert 'a' not in inst
+        assert inst.info() == CacheInfo({
+            'hits': 1, 'misses': 1, 'evictions': 0, 'expirations': 1, 'size': 0, 'maxsize': 128, 'ttl': 10
+            })
+
+    def test_disabled(self):
+        inst = self.class_ref(maxsize=0)
+        inst.set('a', 1)
+        assert inst.get('a') is None
+        assert len(inst) == 0
+
+    def test_discard(self):
+        inst = self.class_ref()
+        for key in [('a', 1), ('a', 2), ('b', 1)]:
+            inst.set(key, 1)
+        assert inst.discard(lambda key: key[0] == 'a') == 2
+        assert len(inst) == 1 and ('b', 1) in inst
+
+    def test_pop_clear(self):
+        inst = self.class_ref()
+        inst.set('a', 1)
+        assert inst.pop('a') == 1
+        assert inst.pop('a') is None
+        inst.set('a', 1)
+        inst.get('a')
+        inst.clear()
+        assert inst.info() == CacheInfo({
+            'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'size': 0, 'maxsize': 128, 'ttl': None
+            })
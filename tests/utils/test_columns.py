@@ -0,0 +1,73 @@
+"""
+:date_created: 2026-10-16
+"""
+from datetime import date, datetime
+
+import pytest
+from do_py import R
+
+from examples.a import Json
+from examples.c import C
+
+numpy = pytest.importorskip('numpy')
+
+from db_able.utils.columns import ColumnBuffer, ColumnBuffers, column_dtype  # noqa: E402  Requires numpy.
+
+
+@pytest.mark.parametrize('restriction, expected_output', [
+    (R.INT, numpy.int64),
+    (R.NULL_INT, numpy.float64),
+    (R.FLOAT, numpy.float64),
+    (R.NULL_FLOAT, numpy.float64),
+    (R(float, int), numpy.float64),
+    (R.NULL_DATETIME, 'datetime64[us]'),
+    (R(date), 'datetime64[D]'),
+    (R.NULL_STR, object),
+    (R.BOOL, object),
+    (R(Json, type(None)), object),
+    ])
+def test_column_dtype(restriction, expected_output):
+    """
+    :type restriction: do_py.data_object.restriction.AbstractRestriction
+    :type expected_output: type or str
+    """
+    assert column_dtype(restriction) == numpy.dtype(expected_output)
+
+
+class TestColumnBuffer(object):
+    class_ref = ColumnBuffer
+
+    @pytest.mark.parametrize('dtype, pages, expected_output', [
+        (numpy.int64, [(1, 2), (3,), (4, 5, 6)], [1, 2, 3, 4, 5, 6]),
+        (numpy.float64, [(1.5, None)], [1.5, numpy.nan]),
+        ('datetime64[us]', [(datetime(2021, 11, 18), None)], ['2021-11-18T00:00:00', 'NaT']),
+        (object, [([1, 2], {'x': 1}), ([3, 4], None)], [[1, 2], {'x': 1}, [3, 4], None]),
+        ])
+    def test_extend(self, dtype, pages, expected_output):
+        """
+        Capacity grows geometrically; the result holds only the appended values.
+        :type dtype: type or str
+        :type pages: list of tuple
+        :type expected_output: list
+        """
+        inst = self.class_ref(numpy.dtype(dtype), capacity=2)
+        capacities = []
+        for values in pages:
+            inst.extend(values)
+            capacities.append(len(inst.array))
+        assert capacities == sorted(capacities) and all(c in (2, 4, 8) for c in capacities)
+        array = inst.finish()
+        assert array.dtype == numpy.dtype(dtype) and len(array) == len(expected_output)
+        if dtype == object:
+            assert list(array) == expected_output
+        else:
+            numpy.testing.assert_array_equal(array, numpy.array(expected_output, dtype=dtype))
+
+
+def test_column_buffers():
+    inst = ColumnBuffers(C, capacity=1)
+    inst.extend([C.row_type()(1, 10, 100), C.row_type()(2, 20, 200)])
+    inst.extend([])
+    columns = inst.to_dict()
+    assert list(columns) == ['id', 'x', 'y']
+    assert [list(column) for column in columns.values()] == [[1, 2], [10, 20], [100, 200]]
@@ -0,0 +1,155 @@
+"""
+:date_created: 2026-10-16
+"""
+import pytest
+
+from db_able.mgmt.const import PlanIssue, TotalMode
+from db_able.utils.explain import PlanFinding, audit, main, parameter_values, plan_findings, procedures, statements
+from db_able.utils.sql_generator import CoreStoredProcedure
+from examples.a import A
+from examples.c import C
+
+FULL_SCAN_PLAN = {
+    'query_block': {
+        'select_id': 1,
+        'ordering_operation': {
+            'using_filesort': True,
+            'table': {'table_name': 'c', 'access_type': 'ALL', 'rows_examined_per_scan': 100}
+            }
+        }
+    }
+DEFERRED_JOIN_PLAN = {
+    'query_block': {
+        'select_id': 1,
+        'nested_loop': [
+            {'table': {
+                'table_name': '_page_keys',
+                'access_type': 'ALL',
+                'materialized_from_subquery': {
+                    'using_temporary_table': True,
+                    'query_block': {'table': {'table_name': 'c', 'access_type': 'index'}}
+                    }
+                }},
+            {'table': {'table_name': 'c', 'access_type': 'eq_ref'}}
+            ]
+        }
+    }
+
+
+@pytest.mark.parametrize('cls_ref, deferred_join, expected_output', [
+    (A, False, ['load', 'load_many', 'save', 'delete']),
+    (C, False, ['list', 'stream']),
+    (C, True, ['list', 'stream']),
+    ])
+def test_procedures(cls_ref, deferred_join, expected_output):
+    """
+    :type cls_ref: type
+    :type deferred_join: bool
+    :type expected_output: list of str
+    """
+    assert [sp.method for sp in procedures(cls_ref, deferred_join=deferred_join)] == expected_output
+
+
+@pytest.mark.parametrize('method, values, expected_output', [
+    ('load', None, {'_id': '1'}),
+    ('load', {'id': 42}, {'_id': '42'}),
+    ('load_many', None, {'_keys': '\'[{\\"id\\": 1}]\''}),
+    ('delete', {'id': "1' OR '1'='1"}, {'_id': "'1\\' OR \\'1\\'=\\'1'"}),
+    ])
+def test_parameter_values(method, values, expected_output):
+    """
+    :type method: str
+    :type values: dict or None
+    :type expected_output: dict
+    """
+    sp = CoreStoredProcedure.from_db_able(A, method)
+    literals = parameter_values(A, sp, values=values)
+    assert {k: literals[k] for k in expected_output} == expected_output
+
+
+@pytest.mark.parametrize('cls_ref, method, procedure_key, expected_output', [
+    (A, 'load', None, ['SELECT * FROM `testing`.`a` WHERE `id` = 1']),
+    (A, 'save', None, [
+        "UPDATE `testing`.`a` SET `string`='a', `json`='{}', `int`=1, `float`=1.0e0, "
+        "`datetime`='2021-01-01 00:00:00' WHERE `id` = 1"
+        ]),
+    (A, 'delete', None, ['DELETE FROM `testing`.`a` WHERE `id` = 1']),
+    (C, 'list', 'paginated', [
+        'SELECT * FROM `testing`.`c` LIMIT 10 OFFSET 0',
+        'SELECT 1 as `page`, COUNT(*) as `total`, 10 as `page_size`\n    FROM `testing`.`c`'
+        ]),
+    ])
+def test_statements(cls_ref, method, procedure_key, expected_output):
+    """
+    :type cls_ref: type
+    :type method: str
+    :type procedure_key: str or None
+    :type expected_output: list of str
+    """
+    sp = CoreStoredProcedure.from_db_able(cls_ref, method, procedure_key=procedure_key)
+    assert statements(cls_ref, sp) == expected_output
+
+
+@pytest.mark.parametrize('total_mode, expected_output', [
+    (TotalMode.NONE, ['SELECT * FROM `testing`.`c` LIMIT 11 OFFSET 0']),
+    (TotalMode.FIRST_PAGE, ['SELECT COUNT(*) FROM `testing`.`c`', 'SELECT * FROM `testing`.`c` LIMIT 11 OFFSET 0']),
+    (TotalMode.ESTIMATED, ['SELECT * FROM `testing`.`c` LIMIT 11 OFFSET 0']),
+    ])
+def test_statements_peek(monkeypatch, total_mode, expected_output):
+    """
+    SELECT ... INTO keeps its query; variable-only selects and `information_schema` reads are skipped.
+    :type total_mode: str
+    :type expected_output: list of str
+    """
+    monkeypatch.setattr(C, 'total_mode', total_mode)
+    sp = CoreStoredProcedure.from_db_able(C, 'list', procedure_key='paginated')
+    assert statements(C, sp) == expected_output
+
+
+@pytest.mark.parametrize('plan, expected_output', [
+    ({'query_block': {'select_id': 1, 'table': {'table_name': 'a', 'access_type': 'const'}}}, []),
+    (FULL_SCAN_PLAN, [(PlanIssue.FILESORT, 'c', None), (PlanIssue.FULL_SCAN, 'c', 100)]),
+    (DEFERRED_JOIN_PLAN, [(PlanIssue.TEMPORARY, None, None)]),
+    ])
+def test_plan_findings(plan, expected_output):
+    """
+    :type plan: dict
+    :type expected_output: list of tuple
+    """
+    assert plan_findings(plan) == expected_output
+
+
+def test_audit():
+    explained = []
+
+    def explain(statement):
+        explained.append(statement)
+        return FULL_SCAN_PLAN if 'OFFSET' in statement else {'query_block': {}}
+
+    findings = audit(C, explain=explain)
+    assert len(explained) == 3
+    assert findings == [
+        PlanFinding({
+            'procedure': 'C_list',
+            'issue': issue,
+            'table': 'c',
+            'rows': rows,
+            'statement': 'SELECT * FROM `testing`.`c` LIMIT 10 OFFSET 0'
+            })
+        for issue, rows in [(PlanIssue.FILESORT, None), (PlanIssue.FULL_SCAN, 100)]
+        ]
+
+
+@pytest.mark.parametrize('argv, expected_output', [
+    (['examples.c.C'], 1),
+    (['examples.c.C', '--ignore', 'full_scan', '--ignore', 'filesort'], 0),
+    ])
+def test_main(monkeypatch, argv, expected_output):
+    """
+    :type argv: list of str
+    :type expected_output: int
+    """
+    monkeypatch.setattr('db_able.utils.explain.audit', lambda cls_ref, **kwargs: audit(
+        cls_ref, explain=lambda statement: FULL_SCAN_PLAN, **kwargs
+        ))
+    assert main(argv) == expected_output
@@ -0,0 +1,71 @@
+"""
+:date_created: 2026-10-16
+"""
+import threading
+
+import pytest
+
+from db_able.utils.prefetch import prefetch
+
+
+def test_prefetch():
+    """
+    Items are produced on a worker thread and consumed in order.
+    """
+    threads = []
+
+    def produce():
+        for i in range(10):
+            threads.append(threading.current_thread())
+            yield i
+
+    assert list(prefetch(produce(), depth=3)) == list(range(10))
+    assert set(threads) == {threads[0]} and threads[0] is not threading.current_thread()
+
+
+@pytest.mark.parametrize('depth', [
+    pytest.param(0, marks=pytest.mark.xfail(raises=AssertionError)),
+    pytest.param('1', marks=pytest.mark.xfail(raises=AssertionError)),
+    ])
+def test_prefetch_depth(depth):
+    """
+    :type depth: int
+    """
+    next(prefetch([1], depth=depth))
+
+
+def test_prefetch_error():
+    """
+    Errors raised while producing are re-raised to the consumer after the items produced before them.
+    """
+    def produce():
+        yield 1
+        raise ValueError('produce')
+
+    consumed = []
+    with pytest.raises(ValueError):
+        for item in prefetch(produce()):
+            consumed.append(item)
+    assert consumed == [1]
+
+
+def test_prefetch_close():
+    """
+    Closing the consumer stops the worker, bounded by `depth`, and closes the producer.
+    """
+    produced = []
+    closed = threading.Event()
+
+    def produce():
+        try:
+            for i in range(1000):
+                produced.append(i)
+                yield i
+        finally:
+            closed.set()
+
+    items = prefetch(produce(), depth=2)
+    assert next(items) == 0
+    items.close()
+    assert closed.is_set()
+    assert len(produced) <= 4
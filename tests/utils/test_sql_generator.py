@@ -7,8 +7,11 @@ import pytest
 from do_py import R
 
 from db_able import Creatable, Deletable, Loadable, Paginated, Savable, Scrollable
-from db_able.utils.sql_generator import ABCSQL, CoreStoredProcedure, CreateProcedure, DeleteProcedure, LoadProcedure, \
-    PaginatedListProcedure, SaveProcedure, ScrollListProcedure, print_all_sps, procedure_mapping
+from db_able.mgmt.const import TotalMode
+from db_able.utils.sql_generator import ABCSQL, CoreStoredProcedure, CreateManyProcedure, CreateProcedure, \
+    DeferredJoinListProcedure, DeleteProcedure, LoadManyProcedure, LoadProcedure, NoEchoCreateProcedure, \
+    NoEchoPartialSaveProcedure, NoEchoSaveProcedure, PaginatedListProcedure, PartialSaveProcedure, SaveProcedure, \
+    ScrollListProcedure, StreamListProcedure, print_all_sps, procedure_mapping
 from examples.a import A
 from examples.b import B
 from examples.c import C
@@ -66,6 +69,20 @@ class TestABCSQL(object):
         """
         assert self.class_ref.get_table_name(cls_ref) == expected_output
 
+    @pytest.mark.parametrize('param, expected_output', [
+        ('id', 'INT'),
+        ('string', 'VARCHAR(255)'),
+        ('json', 'JSON'),
+        ('float', 'FLOAT'),
+        ('datetime', 'TIMESTAMP'),
+        ])
+    def test_get_sql_type(self, param, expected_output):
+        """
+        :type param: str
+        :type expected_output: str
+        """
+        assert self.class_ref.get_sql_type(A, param) == expected_output
+
     def test_as_sql(self):
         """
         Basic coverage of `as_sql` method.
@@ -122,6 +139,54 @@ class TestLoadProcedure(object):
         assert self.class_ref.from_db_able(cls_ref) == expected_output
 
 
+class TestLoadManyProcedure(object):
+    class_ref = LoadManyProcedure
+
+    @pytest.fixture(params=['A'])
+    def cls_ref(self, request):
+        """
+        :type request: pytest.SubRequest
+        :rtype: type
+        """
+        return type(request.param, (Loadable,), {
+            '__module__': 'pytesting',
+            'db': 'testing',
+            '_restrictions': {
+                'x': R.INT,
+                'y': R.STR
+                },
+            'load_params': ['x', 'y']
+            })
+
+    @pytest.fixture
+    def expected_output(self, request):
+        """
+        :type request: pytest.SubRequest
+        :rtype: LoadManyProcedure
+        """
+        data = {
+            'db': 'testing',
+            'columns': "`x` INT PATH '$.x', `y` VARCHAR(255) PATH '$.y'",
+            'join_clause': '`{table_name}`.`x` = `_keys_table`.`x` AND `{table_name}`.`y` = `_keys_table`.`y`'.format(
+                **request.param
+                )
+            }
+        data.update(request.param)
+        return self.class_ref(data)
+
+    @pytest.mark.parametrize('cls_ref, expected_output', [
+        ('A', {'table_name': 'a'}),
+        ('User', {'table_name': 'user'}),
+        ('CouchPotato', {'table_name': 'couch_potato'})
+        ], indirect=True)
+    def test_from_db_able(self, cls_ref, expected_output):
+        """
+        :type cls_ref: type[Loadable]
+        :type expected_output: LoadManyProcedure
+        """
+        assert self.class_ref.from_db_able(cls_ref) == expected_output
+
+
 class TestCreateProcedure(object):
     class_ref = CreateProcedure
 
@@ -299,7 +364,8 @@ class TestPaginatedListProcedure(object):
         """
         data = {
             'db': 'testing',
-            'opt_where_clause': ''
+            'opt_where_clause': '',
+            'total_mode': TotalMode.EXACT
             }
         data.update(request.param)
         return self.class_ref(data)
@@ -316,6 +382,81 @@ class TestPaginatedListProcedure(object):
         """
         assert self.class_ref.from_db_able(cls_ref) == expected_output
 
+    def test_where_clause(self, cls_ref: Type[Paginated]):
+        """
+        Filters apply to both the page and its total.
+        :type cls_ref: Type[Paginated]
+        """
+        cls_ref.list_params = ['limit', 'page', 'x']
+        sql = self.class_ref.from_db_able(cls_ref).as_sql()
+        assert 'SELECT * FROM `testing`.`a` WHERE `x` = `_x` LIMIT `_limit` OFFSET `_offset`;' in sql
+        assert 'FROM `testing`.`a` WHERE `x` = `_x`;' in sql
+
+    @pytest.mark.parametrize('total_mode, total_query', [
+        (TotalMode.EXACT, 'COUNT(*) as `total`'),
+        (TotalMode.FIRST_PAGE, 'IF `_page_number` = 1 THEN\n        SELECT COUNT(*) INTO `_total`'),
+        (TotalMode.NONE, None),
+        (TotalMode.ESTIMATED, 'SELECT `TABLE_ROWS` INTO `_total` FROM `information_schema`.`TABLES`'),
+        (TotalMode.CACHED, 'IF `_with_total` THEN\n        SELECT COUNT(*) INTO `_total`'),
+        ])
+    def test_total_mode(self, cls_ref: Type[Paginated], total_mode, total_query):
+        """
+        Every mode but EXACT reads one additional row.
+        :type cls_ref: Type[Paginated]
+        :type total_mode: str
+        :type total_query: str or None
+        """
+        cls_ref.total_mode = total_mode
+        sql = self.class_ref.from_db_able(cls_ref).as_sql()
+        limit = '`_limit`' if total_mode == TotalMode.EXACT else '`_fetch`'
+        assert 'SELECT * FROM `testing`.`a` LIMIT %s OFFSET `_offset`;' % limit in sql
+        assert ('COUNT(*)' in sql or 'TABLE_ROWS' in sql) is (total_query is not None)
+        if total_query is not None:
+            assert total_query in sql
+
+
+class TestDeferredJoinListProcedure(object):
+    class_ref = DeferredJoinListProcedure
+
+    @pytest.mark.parametrize('bases, list_params, expected_output', [
+        ((Paginated,), ['limit', 'page'], {'key_columns': '`id`', 'opt_where_clause': ''}),
+        ((Paginated,), ['limit', 'page', 'x'], {'key_columns': '`id`', 'opt_where_clause': ' WHERE `x` = `_x`'}),
+        ((Paginated, Loadable), ['limit', 'page'], {'key_columns': '`x`, `y`', 'opt_where_clause': ''}),
+        ])
+    def test_from_db_able(self, bases, list_params, expected_output):
+        """
+        Key columns are the `load_params` of Loadable implementations, otherwise `id`.
+        :type bases: tuple of type
+        :type list_params: list of str
+        :type expected_output: dict
+        """
+        cls_ref = type('CouchPotato', bases, {
+            '__module__': 'pytesting',
+            'db': 'testing',
+            '_restrictions': {
+                'id': R.INT,
+                'x': R.INT,
+                'y': R.INT
+                },
+            '_extra_restrictions': {
+                'limit': R.INT.with_default(10),
+                'page': R.INT.with_default(1)
+                },
+            'list_params': list_params,
+            'load_params': ['x', 'y']
+            })
+        assert self.class_ref.from_db_able(cls_ref) == self.class_ref(dict(
+            expected_output,
+            db='testing',
+            table_name='couch_potato',
+            total_mode=TotalMode.EXACT
+            ))
+
+    def test_as_sql(self):
+        sql = self.class_ref.from_db_able(C).as_sql()
+        assert 'SELECT `id` FROM `testing`.`c`\n        ORDER BY `id` LIMIT `_limit` OFFSET `_offset`' in sql
+        assert 'JOIN `testing`.`c` USING (`id`)' in sql
+
 
 class TestScrollListProcedure(object):
     class_ref = ScrollListProcedure
@@ -369,6 +510,61 @@ class TestScrollListProcedure(object):
         assert self.class_ref.from_db_able(cls_ref) == expected_output
 
 
+class TestStreamListProcedure(object):
+    class_ref = StreamListProcedure
+
+    @pytest.fixture(params=['A'])
+    def cls_ref(self, request):
+        """
+        :type request: pytest.SubRequest
+        :rtype: Type[Scrollable]
+        """
+        return type(request.param, (Scrollable,), {
+            '__module__': 'pytesting',
+            'db': 'testing',
+            '_restrictions': {
+                'id': R.INT,
+                'x': R.INT,
+                'y': R.INT
+                },
+            '_extra_restrictions': {
+                'limit': R.INT.with_default(10),
+                'after': R.INT.with_default(0)
+                },
+            'list_params': ['limit', 'after', 'x'],
+            'to_after': lambda x: x.id
+            })
+
+    @pytest.fixture
+    def expected_output(self, request):
+        """
+        :type request: pytest.SubRequest
+        :rtype: StreamListProcedure
+        """
+        data = {
+            'db': 'testing',
+            'opt_where_clause': ' WHERE `x` = `_x`'
+            }
+        data.update(request.param)
+        return self.class_ref(data)
+
+    @pytest.mark.parametrize('cls_ref, expected_output', [
+        ('A', {'table_name': 'a'}),
+        ('User', {'table_name': 'user'}),
+        ('CouchPotato', {'table_name': 'couch_potato'})
+        ], indirect=True)
+    def test_from_db_able(self, cls_ref: Type[Scrollable], expected_output):
+        """
+        :type cls_ref: Type[Scrollable]
+        :type expected_output: StreamListProcedure
+        """
+        assert cls_ref.stream_params == ['x']
+        assert self.class_ref.from_db_able(cls_ref) == expected_output
+
+    def test_no_where_clause(self):
+        assert self.class_ref.from_db_able(B).as_sql() == 'SELECT * FROM `testing`.`b`;'
+
+
 class TestCoreStoredProcedure(object):
     class_ref = CoreStoredProcedure
 
@@ -432,7 +628,9 @@ class TestCoreStoredProcedure(object):
         ('save', None),
         ('delete', None),
         ('list', 'paginated'),
+        ('list', 'paginated_deferred_join'),
         ('list', 'scrollable'),
+        ('stream', None),
         ])
     def method(self, request):
         """
@@ -471,6 +669,87 @@ class TestCoreStoredProcedure(object):
         assert self.class_ref.from_db_able(cls_ref, method[0], procedure_key=method[1]) == expected_output
 
 
+def test_create_many_procedure():
+    inst = CreateManyProcedure.from_db_able(A)
+    assert inst == CreateManyProcedure({
+        'db': 'testing',
+        'table_name': 'a',
+        'columns': '`string`, `json`, `int`, `float`, `datetime`',
+        'select_columns': "`string`, NULLIF(`json`, CAST('null' AS JSON)), `int`, `float`, `datetime`",
+        'json_columns': "`string` VARCHAR(255) PATH '$.string', `json` JSON PATH '$.json', `int` INT PATH '$.int', "
+                        "`float` FLOAT PATH '$.float', `datetime` TIMESTAMP PATH '$.datetime'",
+        'id': 'id'
+        })
+    core = CoreStoredProcedure.from_db_able(A, 'create_many')
+    assert core.params == '    IN `_rows` JSON,\n    IN `_echo` BOOL'
+    assert core.procedure == inst.as_sql()
+    # A single multi-row insert; rows are re-selected past the last id visible to the read view opened before it,
+    # never derived from `LAST_INSERT_ID()`, which concurrent inserts may interleave.
+    assert core.procedure.count('INSERT INTO') == 1 and 'WHILE' not in core.procedure
+    assert core.procedure.index('INTO `_last_id`') < core.procedure.index('INSERT INTO')
+    assert 'LAST_INSERT_ID' not in core.procedure
+
+
+def test_partial_save_procedure():
+    inst = PartialSaveProcedure.from_db_able(A)
+    assert inst.json_columns == "`string` VARCHAR(255) PATH '$.string', `json` JSON PATH '$.json', " \
+                               "`int` INT PATH '$.int', `float` FLOAT PATH '$.float', " \
+                               "`datetime` TIMESTAMP PATH '$.datetime'"
+    assert inst.set_clause.startswith(
+        "`a`.`string` = IF(JSON_CONTAINS_PATH(`_changes`, 'one', '$.string'), "
+        "`_changes_table`.`string`, `a`.`string`), "
+        "`a`.`json` = IF(JSON_CONTAINS_PATH(`_changes`, 'one', '$.json'), "
+        "NULLIF(`_changes_table`.`json`, CAST('null' AS JSON)), `a`.`json`), "
+        )
+    assert inst.where_clause == '`a`.`id` = `_id`'
+    core = CoreStoredProcedure.from_db_able(A, 'save_partial')
+    assert core.params == '    IN `_id` INT,\n    IN `_changes` JSON'
+    assert core.version == A.save_params.version
+    assert core.procedure == inst.as_sql()
+
+
+@pytest.mark.parametrize('method, procedure_cls, expected_output', [
+    ('create', NoEchoCreateProcedure, 'SELECT LAST_INSERT_ID() AS `id`;'),
+    ('save', NoEchoSaveProcedure, 'SELECT ROW_COUNT() AS `saved`;'),
+    ('save_partial', NoEchoPartialSaveProcedure, 'SELECT ROW_COUNT() AS `saved`;'),
+    ])
+def test_core_stored_procedure_no_echo(monkeypatch, method, procedure_cls, expected_output):
+    """
+    Create and save procedures of `echo_writes = False` classes take the `_echo` flag and only load the written row
+    when it is set.
+    :type monkeypatch: pytest.MonkeyPatch
+    :type method: str
+    :type procedure_cls: type[ABCSQL]
+    :type expected_output: str
+    """
+    monkeypatch.setattr(A, 'echo_writes', False)
+    inst = CoreStoredProcedure.from_db_able(A, method)
+    assert inst.params.endswith(',\n    IN `_echo` BOOL')
+    assert inst.procedure == procedure_cls.from_db_able(A).as_sql()
+    assert 'IF `_echo` THEN\n        CALL `testing`.`A_load`(' in inst.procedure
+    assert expected_output in inst.procedure
+
+
+def test_core_stored_procedure_load_many():
+    """
+    `load_many` takes its keys as a single JSON argument and is versioned with `load_params`.
+    """
+    inst = CoreStoredProcedure.from_db_able(A, 'load_many')
+    assert inst.params == '    IN `_keys` JSON'
+    assert inst.version == A.load_params.version
+    assert inst.procedure == LoadManyProcedure.from_db_able(A).as_sql()
+
+
+def test_core_stored_procedure_cached_total(monkeypatch):
+    """
+    `TotalMode.CACHED` list procedures take the additional `_with_total` flag.
+    :type monkeypatch: pytest.MonkeyPatch
+    """
+    monkeypatch.setattr(C, 'total_mode', TotalMode.CACHED)
+    inst = CoreStoredProcedure.from_db_able(C, 'list', procedure_key='paginated')
+    assert inst.params == '    IN `_limit` INT,\n    IN `_page` INT,\n    IN `_with_total` BOOL'
+
+
 def test_print_all_sps():
     print_all_sps(A)
     print_all_sps(B)